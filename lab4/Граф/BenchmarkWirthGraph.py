@@ -0,0 +1,267 @@
+"""
+Бенчмарки операций WirthGraph на синтетических графах
+Запуск: python BenchmarkWirthGraph.py --edges 100000 1000000 [--save-baseline | --compare]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from WirthGraph import WirthGraph
+
+BASELINE_PATH = Path(__file__).with_name("graph_benchmark_baseline.json")
+
+
+# Генераторы синтетических графов
+def erdos_renyi_edges(vertex_count, edge_count, seed=0):
+    """Случайный граф Эрдёша-Реньи G(n, m) без петель и кратных рёбер"""
+    rng = random.Random(seed)
+    edge_count = min(edge_count, vertex_count * (vertex_count - 1) // 2)
+    seen = set()
+    edges = []
+    while len(edges) < edge_count:
+        u = rng.randrange(vertex_count)
+        v = rng.randrange(vertex_count)
+        if u == v:
+            continue
+        edge = (u, v) if u < v else (v, u)
+        if edge not in seen:
+            seen.add(edge)
+            edges.append(edge)
+    return edges
+
+
+def power_law_edges(vertex_count, edges_per_vertex=4, seed=0):
+    """Граф Барабаши-Альберт со степенным распределением степеней"""
+    rng = random.Random(seed)
+    # Каждая вершина входит в список столько раз, какова её степень
+    targets = list(range(edges_per_vertex))
+    repeated = []
+    edges = []
+    for u in range(edges_per_vertex, vertex_count):
+        for v in set(targets):
+            edges.append((v, u))
+            repeated.append(v)
+            repeated.append(u)
+        targets = [rng.choice(repeated) for _ in range(edges_per_vertex)]
+    return edges
+
+
+def grid_edges(rows, cols):
+    """Прямоугольная решётка rows x cols"""
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols:
+                edges.append((v, v + 1))
+            if r + 1 < rows:
+                edges.append((v, v + cols))
+    return edges
+
+
+def generate(family, edge_count, seed=0):
+    """Возвращает (число вершин, рёбра) графа заданного семейства примерно с edge_count рёбрами"""
+    if family == "erdos_renyi":
+        vertex_count = max(2, edge_count // 4)
+        return vertex_count, erdos_renyi_edges(vertex_count, edge_count, seed)
+    if family == "power_law":
+        vertex_count = max(5, edge_count // 4 + 4)
+        return vertex_count, power_law_edges(vertex_count, 4, seed)
+    if family == "grid":
+        side = max(2, int((edge_count / 2) ** 0.5))
+        return side * side, grid_edges(side, side)
+    raise ValueError(f"Unknown graph family '{family}'")
+
+
+class GraphBenchmark:
+    """Замеры построения, изменения, запросов смежности и обхода графа"""
+
+    FAMILIES = ("erdos_renyi", "power_law", "grid")
+
+    def __init__(self, query_ops=100000, mutation_ops=10, seed=0):
+        self.query_ops = query_ops
+        self.mutation_ops = mutation_ops
+        self.seed = seed
+
+    @staticmethod
+    def _measure(name, ops, func):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        return {
+            "name": name,
+            "ops": ops,
+            "seconds": seconds,
+            "ops_per_sec": ops / seconds if seconds > 0 else float("inf"),
+            "peak_kib": None,
+        }
+
+    @staticmethod
+    def _measure_build(vertex_count, edges):
+        """Построение графа с замером пикового потребления памяти"""
+        tracemalloc.start()
+        graph = WirthGraph(vertex_count, edges)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Время берём из отдельного прогона: трассировка замедляет выделение памяти
+        del graph
+        start = time.perf_counter()
+        graph = WirthGraph(vertex_count, edges)
+        seconds = time.perf_counter() - start
+        result = {
+            "name": "build",
+            "ops": len(edges),
+            "seconds": seconds,
+            "ops_per_sec": len(edges) / seconds if seconds > 0 else float("inf"),
+            "peak_kib": peak / 1024,
+        }
+        return graph, result
+
+    def run_family(self, family, edge_count):
+        vertex_count, edges = generate(family, edge_count, self.seed)
+        # Отдельный поток случайных чисел, иначе запросы повторят рёбра генератора
+        rng = random.Random(self.seed + 1)
+        graph, build = self._measure_build(vertex_count, edges)
+        results = [build]
+
+        pairs = [(rng.randrange(vertex_count), rng.randrange(vertex_count))
+                 for _ in range(self.query_ops)]
+
+        def has_edge_queries():
+            has_edge = graph.has_edge
+            for u, v in pairs:
+                has_edge(u, v)
+
+        def degree_queries():
+            degree = graph.vertex_degree
+            for u, _ in pairs:
+                degree(u)
+
+        def iterate_edges():
+            for _ in graph.edges_begin():
+                pass
+
+        def iterate_neighbors():
+            for v in graph.vertices_begin():
+                for _ in graph.neighbors_begin(v):
+                    pass
+
+        def iterate_vertex_edges():
+            for v in graph.vertices_begin():
+                for _ in graph.vertex_edges_begin(v):
+                    pass
+
+        def to_string():
+            str(graph)
+
+        results.append(self._measure("has_edge", len(pairs), has_edge_queries))
+        results.append(self._measure("vertex_degree", len(pairs), degree_queries))
+        results.append(self._measure("iter_edges", len(edges), iterate_edges))
+        results.append(self._measure("iter_neighbors", 2 * len(edges), iterate_neighbors))
+        results.append(self._measure("iter_vertex_edges", 2 * len(edges), iterate_vertex_edges))
+        results.append(self._measure("str", vertex_count, to_string))
+
+        # Изменения выполняются последними: они портят исходный граф
+        new_edges = [(rng.randrange(vertex_count), rng.randrange(vertex_count))
+                     for _ in range(self.mutation_ops)]
+
+        def add_edges():
+            for u, v in new_edges:
+                graph.add_edge(u, v)
+
+        def remove_edges():
+            for u, v in new_edges:
+                graph.remove_edge(u, v)
+
+        def remove_vertices():
+            for _ in range(self.mutation_ops):
+                graph.remove_vertex(rng.randrange(graph.vertex_count()))
+
+        results.append(self._measure("add_edge", len(new_edges), add_edges))
+        results.append(self._measure("remove_edge", len(new_edges), remove_edges))
+        results.append(self._measure("remove_vertex", self.mutation_ops, remove_vertices))
+
+        for result in results:
+            result["family"] = family
+            result["edges"] = len(edges)
+        return results
+
+    def run(self, edge_counts, families=FAMILIES):
+        results = []
+        for edge_count in edge_counts:
+            for family in families:
+                results.extend(self.run_family(family, edge_count))
+        return results
+
+
+# Базовые результаты для сравнения
+def result_key(result):
+    return f"{result['family']}/{result['edges']}/{result['name']}"
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    baseline = {result_key(r): r["ops_per_sec"] for r in results}
+    Path(path).write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path=BASELINE_PATH):
+    """FileNotFoundError, если базовые результаты не сохранены: сравнивать не с чем"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """Замеры, которые медленнее базовых больше чем на tolerance"""
+    regressions = []
+    for result in results:
+        expected = baseline.get(result_key(result))
+        if expected and result["ops_per_sec"] < expected * (1 - tolerance):
+            regressions.append((result, expected))
+    return regressions
+
+
+def format_results(results):
+    lines = [f"{'family':<12} {'edges':>9} {'operation':<18} {'ops/sec':>14} {'seconds':>9} {'peak KiB':>10}"]
+    for r in results:
+        peak = f"{r['peak_kib']:.0f}" if r["peak_kib"] is not None else "-"
+        lines.append(f"{r['family']:<12} {r['edges']:>9} {r['name']:<18} "
+                     f"{r['ops_per_sec']:>14.0f} {r['seconds']:>9.4f} {peak:>10}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки WirthGraph")
+    parser.add_argument("--edges", type=int, nargs="+", default=[100000])
+    parser.add_argument("--families", nargs="+", default=list(GraphBenchmark.FAMILIES))
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--mutations", type=int, default=10)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    if args.compare and not args.baseline.exists():
+        parser.error(f"базовые результаты {args.baseline} не найдены, сохраните их с --save-baseline")
+
+    benchmark = GraphBenchmark(args.queries, args.mutations)
+    results = benchmark.run(args.edges, args.families)
+    print(format_results(results))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Базовые результаты сохранены в {args.baseline}")
+    if args.compare:
+        regressions = find_regressions(results, load_baseline(args.baseline), args.tolerance)
+        for result, expected in regressions:
+            print(f"РЕГРЕССИЯ {result_key(result)}: {result['ops_per_sec']:.0f} ops/sec "
+                  f"(базовое значение {expected:.0f})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
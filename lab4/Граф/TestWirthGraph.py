@@ -1,4 +1,10 @@
+import io
+import os
+import struct
+import sys
+import tempfile
 import unittest
+from array import array
 from WirthGraph import WirthGraph
 from Product import Product
 from Student import Student
@@ -447,5 +453,164 @@ class TestWirthGraph(unittest.TestCase):
         self.assertTrue(it1 == it2)
 
 
+    def test_26_subgraph_extraction(self):
+        """Тест индуцированного подграфа с перенумерацией вершин"""
+        sub = self.graph.subgraph([2, 0, 1])
+        self.assertEqual(sub.vertex_count(), 3)
+        self.assertEqual(sub.edge_count(), 3)
+        # Вершина i подграфа соответствует vertices[i]
+        self.assertEqual(sub.get_vertex_data(0), "City_2")
+        self.assertTrue(sub.has_edge(0, 1))  # 2-0
+        self.assertTrue(sub.has_edge(0, 2))  # 2-1
+        self.assertTrue(sub.has_edge(1, 2))  # 0-1
+        self.assertEqual(sub.vertex_degree(0), 2)
+        
+        # Подграф остаётся полноценным графом
+        sub.add_edge(0, 0)
+        self.assertEqual(sub.edge_count(), 4)
+        
+        with self.assertRaises(IndexError):
+            self.graph.subgraph([0, 10])
+
+    def test_27_k_hop_neighborhood(self):
+        """Тест k-окрестности вершины"""
+        self.assertEqual(self.graph.k_hop_vertices(4, 0), [4])
+        self.assertEqual(self.graph.k_hop_vertices(4, 2), [4, 3, 2])
+        
+        hood = self.graph.k_hop_neighborhood(4, 2)
+        self.assertEqual(hood.vertex_count(), 3)
+        self.assertEqual(hood.get_vertex_data(0), "City_4")
+        self.assertEqual(sorted(hood.edges_begin()), [(0, 1), (1, 2)])
+        
+        whole = self.graph.k_hop_neighborhood(0, 10)
+        self.assertEqual(whole.vertex_count(), 5)
+        self.assertEqual(whole.edge_count(), 5)
+
+    def test_28_partition(self):
+        """Тест сбалансированного разбиения графа"""
+        assignment = self.graph.partition(2)
+        self.assertEqual(len(assignment), 5)
+        self.assertEqual(sorted(assignment), [0, 0, 0, 1, 1])
+        
+        parts = self.graph.partition_subgraphs(assignment)
+        self.assertEqual([p.vertex_count() for p in parts], [3, 2])
+        self.assertEqual(sum(p.edge_count() for p in parts), 4)
+        
+        self.assertEqual(self.graph.partition(5), [0, 1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            self.graph.partition(0)
+
+    def test_29_structural_equality_and_hashing(self):
+        """Тест равенства, не зависящего от порядка рёбер, и хэширования"""
+        graph1 = WirthGraph[int](3, [(0, 1), (1, 2)])
+        graph2 = WirthGraph[int](3, [(2, 1), (1, 0)])
+        graph3 = WirthGraph[int](3, [(0, 1), (0, 2)])
+        
+        self.assertEqual(graph1, graph2)
+        self.assertEqual(hash(graph1), hash(graph2))
+        self.assertNotEqual(graph1, graph3)
+        # Графы можно использовать как ключи кэша
+        cache = {graph1: "cached"}
+        self.assertEqual(cache[graph2], "cached")
+        
+        # Порядок при равных количествах вершин и рёбер согласован с равенством
+        self.assertTrue(graph1 < graph3 or graph3 < graph1)
+        
+        # Отпечаток сбрасывается при изменении графа
+        old_fingerprint = graph2.fingerprint()
+        graph2.add_edge(0, 2)
+        self.assertNotEqual(graph2.fingerprint(), old_fingerprint)
+        self.assertNotEqual(graph1, graph2)
+        graph2.remove_edge(0, 2)
+        self.assertEqual(graph1, graph2)
+
+    def test_30_edge_list_import_export(self):
+        """Тест потокового экспорта и импорта списка рёбер (CSV, TSV)"""
+        self.graph.add_vertex("Isolated")
+        for delimiter in (",", "\t"):
+            stream = io.StringIO()
+            self.graph.write_edge_list(stream, delimiter=delimiter)
+            stream.seek(0)
+            loaded = WirthGraph[str].read_edge_list(stream, delimiter=delimiter)
+            self.assertEqual(loaded.vertex_count(), 6)  # с изолированной вершиной
+            self.assertEqual(loaded.canonical_edges(), self.graph.canonical_edges())
+            self.assertTrue(loaded.has_edge(2, 0))
+            self.assertEqual(loaded.vertex_degree(2), 3)
+        
+        # Повторы и обратные рёбра схлопываются, число вершин по максимальному индексу
+        loaded = WirthGraph.read_edge_list(io.StringIO("0,1\n1,0\n\n2,1\n"))
+        self.assertEqual(loaded.vertex_count(), 3)
+        self.assertEqual(loaded.edge_count(), 2)
+
+    def test_31_binary_import_export(self):
+        """Тест двоичного потока рёбер"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.bin")
+            self.graph.write_binary(path)
+            loaded = WirthGraph[str].read_binary(path, chunk_edges=2)
+        self.assertEqual(loaded.vertex_count(), 5)
+        self.assertEqual(list(loaded.edges_begin()), list(self.graph.edges_begin()))
+        
+        with self.assertRaises(ValueError):
+            WirthGraph.read_binary(io.BytesIO(b"not a graph stream......."))
+        
+        # Чужой поток: обратные пары и повторы схлопываются, отрицательные вершины отвергаются
+        def stream(vertex_count, pairs):
+            values = array("q", [x for pair in pairs for x in pair])
+            if sys.byteorder == "big":
+                values.byteswap()
+            return io.BytesIO(struct.pack("<4sQQ", b"WGEB", vertex_count, len(pairs)) + values.tobytes())
+        
+        loaded = WirthGraph.read_binary(stream(4, [(3, 1), (1, 3), (0, 1)]))
+        self.assertEqual(loaded.edge_count(), 2)
+        self.assertEqual(loaded, WirthGraph(4, [(1, 3), (0, 1)]))
+        loaded.remove_edge(1, 3)
+        self.assertFalse(loaded.has_edge(1, 3))
+        with self.assertRaises(IndexError):
+            WirthGraph.read_binary(stream(4, [(-1, 2)]))
+
+    def test_32_streaming_dump(self):
+        """Тест потокового вывода графа"""
+        stream = io.StringIO()
+        self.graph.dump(stream)
+        self.assertEqual(stream.getvalue(), str(self.graph))
+        self.assertIn("Vertex 2 (data: City_2): [1, 3, 0]", stream.getvalue())
+
+    def test_33_vertex_columns(self):
+        """Тест типизированных столбцов данных вершин"""
+        weights = self.graph.add_column("weight", "d", 1.0)
+        self.assertEqual(weights.typecode, "d")
+        self.assertEqual(list(weights), [1.0] * 5)
+        with self.assertRaises(KeyError):
+            self.graph.add_column("weight")
+        
+        self.graph.set_column("weight", [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.graph.set_column_value(0, "weight", 10.0)
+        self.assertEqual(self.graph.get_column_value(0, "weight"), 10.0)
+        self.assertEqual(list(self.graph.gather_column("weight", self.graph.k_hop_vertices(4, 1))), [4.0, 3.0])
+        with self.assertRaises(ValueError):
+            self.graph.set_column("weight", [1.0])
+        
+        # Столбцы остаются выровненными с вершинами
+        self.graph.add_vertex("New_City")
+        self.assertEqual(self.graph.get_column_value(5, "weight"), 1.0)
+        self.graph.remove_vertex(1)
+        self.assertEqual(list(self.graph.column("weight")), [10.0, 2.0, 3.0, 4.0, 1.0])
+        
+        sub = self.graph.subgraph([3, 0])
+        self.assertEqual(list(sub.column("weight")), [4.0, 10.0])
+        
+        self.assertTrue(self.graph.remove_column("weight"))
+        self.assertFalse(self.graph.has_column("weight"))
+        with self.assertRaises(KeyError):
+            self.graph.column("weight")
+
+    def test_34_weighted_partition(self):
+        """Тест разбиения с балансировкой по столбцу весов"""
+        self.graph.add_column("load", "i")
+        self.graph.set_column("load", [4, 1, 1, 1, 1])
+        assignment = self.graph.partition(2, weight_column="load")
+        self.assertEqual(assignment, [0, 1, 1, 1, 1])
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -1,3 +1,8 @@
+import struct
+import sys
+from array import array
+from collections import deque
+from contextlib import nullcontext
 from typing import Generic, TypeVar
 from VertexIterator import VertexIterator
 from ReverseVertexIterator import ReverseVertexIterator
@@ -10,6 +15,21 @@ from ReverseNeighborIterator import ReverseNeighborIterator
 
 T = TypeVar('T')
 
+_VERTICES_HEADER = "# vertices="
+_BINARY_MAGIC = b"WGEB"
+_BINARY_HEADER = struct.Struct("<4sQQ")
+_CHUNK_EDGES = 1 << 16
+
+
+def _open_stream(target, mode):
+    """Открывает файл по пути или возвращает уже открытый поток как есть"""
+    if hasattr(target, "read") or hasattr(target, "write"):
+        return nullcontext(target)
+    if "b" in mode:
+        return open(target, mode)
+    return open(target, mode, encoding="utf-8", newline="")
+
+
 class WirthGraph(Generic[T]):
     def __init__(self, vertex_count=0, edges=None):
         self._vertex_count = vertex_count
@@ -17,11 +37,27 @@ class WirthGraph(Generic[T]):
         self._start = [0] * (vertex_count + 1) if vertex_count > 0 else [0]
         self._ends = []
         self._edges = []
+        self._canonical_edges = None
+        self._fingerprint = None
+        self._columns: dict[str, array] = {}
+        self._column_defaults = {}
         
         if edges:
             for edge in edges:
                 u, v = edge
                 self._edges.append((min(u, v), max(u, v)))
+            self._build_arrays()
+
+    @classmethod
+    def _from_csr(cls, vertex_data, start, ends, edges):
+        """Создание графа из готовых массивов CSR без пересборки"""
+        graph = cls()
+        graph._vertex_count = len(vertex_data)
+        graph._vertex_data = vertex_data
+        graph._start = start
+        graph._ends = ends
+        graph._edges = edges
+        return graph
 
     def _build_arrays(self):
         if self._vertex_count == 0:
@@ -47,24 +83,53 @@ class WirthGraph(Generic[T]):
             self._ends[current_pos[v]] = u
             current_pos[v] += 1
 
+    def _invalidate_cache(self):
+        """Сброс кэшированного отпечатка после изменения графа"""
+        self._canonical_edges = None
+        self._fingerprint = None
+
+    def canonical_edges(self):
+        """Рёбра в каноническом порядке, не зависящем от порядка добавления"""
+        if self._canonical_edges is None:
+            self._canonical_edges = tuple(sorted(self._edges))
+        return self._canonical_edges
+
+    def fingerprint(self):
+        """Кэшируемый отпечаток структуры графа"""
+        if self._fingerprint is None:
+            self._fingerprint = hash((self._vertex_count, self.canonical_edges()))
+        return self._fingerprint
+
+    def __hash__(self):
+        # Данные вершин не участвуют в хэше: они могут быть нехэшируемыми
+        return self.fingerprint()
+
     def __eq__(self, other):
         """Сравнение на равенство графов"""
         if not isinstance(other, WirthGraph):
             return False
-        return (self._vertex_count == other._vertex_count and
-                self._edges == other._edges and
+        if self is other:
+            return True
+        # Быстрые отрицательные проверки перед полным сравнением
+        if (self._vertex_count != other._vertex_count or
+                len(self._edges) != len(other._edges) or
+                self.fingerprint() != other.fingerprint()):
+            return False
+        return (self.canonical_edges() == other.canonical_edges() and
                 self._vertex_data == other._vertex_data)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __lt__(self, other):
-        """Сравнение графов (по количеству вершин, затем рёбер)"""
+        """Сравнение графов (по количеству вершин, затем рёбер, затем по самим рёбрам)"""
         if not isinstance(other, WirthGraph):
             return NotImplemented
         if self._vertex_count != other._vertex_count:
             return self._vertex_count < other._vertex_count
-        return len(self._edges) < len(other._edges)
+        if len(self._edges) != len(other._edges):
+            return len(self._edges) < len(other._edges)
+        return self.canonical_edges() < other.canonical_edges()
 
     def __gt__(self, other):
         return other.__lt__(self)
@@ -87,11 +152,14 @@ class WirthGraph(Generic[T]):
         return self._vertex_count == 0
 
     def clear(self):
+        self._invalidate_cache()
         self._vertex_count = 0
         self._vertex_data = []
         self._start = [0]
         self._ends = []
         self._edges = []
+        for column in self._columns.values():
+            del column[:]
 
     def vertex_count(self):
         return self._vertex_count
@@ -119,9 +187,12 @@ class WirthGraph(Generic[T]):
         return self.vertex_degree(u) + self.vertex_degree(v) - 2
 
     def add_vertex(self, data: T = None):
+        self._invalidate_cache()
         self._vertex_count += 1
         self._vertex_data.append(data)
-        self._start.append(self._start[-1] + 1)
+        self._start.append(self._start[-1])
+        for name, column in self._columns.items():
+            column.append(self._column_defaults[name])
         return self._vertex_count - 1
 
     def add_edge(self, u, v):
@@ -131,6 +202,7 @@ class WirthGraph(Generic[T]):
             return
         
         self._edges.append((min(u, v), max(u, v)))
+        self._invalidate_cache()
         self._build_arrays()
 
     def remove_vertex(self, vertex):
@@ -148,6 +220,9 @@ class WirthGraph(Generic[T]):
         self._edges = new_edges
         self._vertex_count -= 1
         self._vertex_data.pop(vertex)
+        for column in self._columns.values():
+            column.pop(vertex)
+        self._invalidate_cache()
         self._build_arrays()
         return True
 
@@ -155,6 +230,7 @@ class WirthGraph(Generic[T]):
         edge = (min(u, v), max(u, v))
         if edge in self._edges:
             self._edges.remove(edge)
+            self._invalidate_cache()
             self._build_arrays()
             return True
         return False
@@ -170,6 +246,158 @@ class WirthGraph(Generic[T]):
             raise IndexError("Vertex index out of range")
         return self._vertex_data[vertex]
 
+    # Типизированные столбцы данных вершин
+    def add_column(self, name, typecode="d", default=0):
+        """Добавляет числовой столбец (array.array) со значением по умолчанию для всех вершин"""
+        if name in self._columns:
+            raise KeyError(f"Column '{name}' already exists")
+        self._columns[name] = array(typecode, [default]) * self._vertex_count
+        self._column_defaults[name] = default
+        return self._columns[name]
+
+    def remove_column(self, name):
+        if name not in self._columns:
+            return False
+        del self._columns[name]
+        del self._column_defaults[name]
+        return True
+
+    def has_column(self, name):
+        return name in self._columns
+
+    def column_names(self):
+        return list(self._columns)
+
+    def column(self, name) -> array:
+        """Столбец целиком для пакетного чтения и записи (индекс - номер вершины)"""
+        if name not in self._columns:
+            raise KeyError(f"Column '{name}' not found")
+        return self._columns[name]
+
+    def set_column(self, name, values):
+        """Заменяет все значения столбца"""
+        column = self.column(name)
+        new_column = array(column.typecode, values)
+        if len(new_column) != self._vertex_count:
+            raise ValueError("Column length must match vertex count")
+        self._columns[name] = new_column
+
+    def gather_column(self, name, vertices) -> array:
+        """Значения столбца для набора вершин (например, результата обхода)"""
+        column = self.column(name)
+        return array(column.typecode, [column[v] for v in vertices])
+
+    def get_column_value(self, vertex, name):
+        if not self.has_vertex(vertex):
+            raise IndexError("Vertex index out of range")
+        return self.column(name)[vertex]
+
+    def set_column_value(self, vertex, name, value):
+        if not self.has_vertex(vertex):
+            raise IndexError("Vertex index out of range")
+        self.column(name)[vertex] = value
+
+    # Подграфы и разбиение
+    def subgraph(self, vertices):
+        """Индуцированный подграф: вершина i подграфа соответствует vertices[i]"""
+        remap = {}
+        for vertex in vertices:
+            if not self.has_vertex(vertex):
+                raise IndexError("Vertex index out of range")
+            if vertex not in remap:
+                remap[vertex] = len(remap)
+
+        start = [0] * (len(remap) + 1)
+        ends = []
+        edges = []
+        # Один проход по спискам смежности выбранных вершин
+        for old_u, new_u in remap.items():
+            loop_seen = False
+            for w in self._ends[self._start[old_u]:self._start[old_u + 1]]:
+                new_w = remap.get(w)
+                if new_w is None:
+                    continue
+                ends.append(new_w)
+                if new_w > new_u:
+                    edges.append((new_u, new_w))
+                elif new_w == new_u:
+                    # Петля встречается в списке смежности дважды
+                    if loop_seen:
+                        edges.append((new_u, new_u))
+                    loop_seen = not loop_seen
+            start[new_u + 1] = len(ends)
+
+        vertex_data = [self._vertex_data[v] for v in remap]
+        graph = type(self)._from_csr(vertex_data, start, ends, edges)
+        for name, column in self._columns.items():
+            graph._columns[name] = array(column.typecode, [column[v] for v in remap])
+            graph._column_defaults[name] = self._column_defaults[name]
+        return graph
+
+    def k_hop_vertices(self, vertex, k):
+        """Вершины на расстоянии не более k от vertex в порядке обхода в ширину"""
+        if not self.has_vertex(vertex):
+            raise IndexError("Vertex index out of range")
+        visited = {vertex}
+        order = [vertex]
+        frontier = [vertex]
+        for _ in range(k):
+            next_frontier = []
+            for u in frontier:
+                for w in self._ends[self._start[u]:self._start[u + 1]]:
+                    if w not in visited:
+                        visited.add(w)
+                        order.append(w)
+                        next_frontier.append(w)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return order
+
+    def k_hop_neighborhood(self, vertex, k):
+        """Подграф k-окрестности вершины (вершина 0 подграфа - сама vertex)"""
+        return self.subgraph(self.k_hop_vertices(vertex, k))
+
+    def partition(self, parts, weight_column=None):
+        """Сбалансированное разбиение обходом в ширину: номер части для каждой вершины"""
+        if parts <= 0:
+            raise ValueError("Number of parts must be positive")
+        # Без столбца весов каждая вершина весит 1
+        weights = self.column(weight_column) if weight_column is not None else None
+        total = sum(weights) if weights is not None else self._vertex_count
+        capacity = total / parts
+        assignment = [-1] * self._vertex_count
+        part = 0
+        load = 0
+        for seed in range(self._vertex_count):
+            if assignment[seed] != -1:
+                continue
+            queue = deque([seed])
+            assignment[seed] = part
+            load += weights[seed] if weights is not None else 1
+            while queue:
+                if load >= capacity and part < parts - 1:
+                    # Часть заполнена, незавершённый фронт достанется следующим частям
+                    part += 1
+                    load = 0
+                    break
+                u = queue.popleft()
+                for w in self._ends[self._start[u]:self._start[u + 1]]:
+                    if assignment[w] == -1:
+                        assignment[w] = part
+                        load += weights[w] if weights is not None else 1
+                        queue.append(w)
+                        if load >= capacity:
+                            break
+        return assignment
+
+    def partition_subgraphs(self, assignment):
+        """Разбивает граф на подграфы по массиву номеров частей"""
+        groups = {}
+        for vertex, part in enumerate(assignment):
+            groups.setdefault(part, []).append(vertex)
+        return [self.subgraph(groups[part]) for part in sorted(groups)]
+
     # Итераторы
     def vertices_begin(self):
         return VertexIterator(self, 0)
@@ -249,10 +477,119 @@ class WirthGraph(Generic[T]):
         self.remove_edge(edge[0], edge[1])
         return EdgeIterator(self, it._index)
 
-    def __str__(self):
-        result = f"WirthGraph(vertices={self._vertex_count}, edges={len(self._edges)})\n"
+    # Импорт и экспорт списка рёбер
+    @classmethod
+    def _from_edge_list(cls, vertex_count, edges):
+        """Граф из готового списка рёбер с однократной сборкой массивов"""
+        graph = cls(vertex_count)
+        graph._edges = edges
+        graph._build_arrays()
+        return graph
+
+    @classmethod
+    def read_edge_list(cls, source, delimiter=",", vertex_count=None, chunk_size=1 << 20):
+        """Потоковое чтение списка рёбер в текстовом формате (CSV, TSV)"""
+        edges = []
+        seen = set()
+        max_vertex = -1
+        with _open_stream(source, "r") as stream:
+            while True:
+                # Читаем файл блоками примерно по chunk_size символов
+                lines = stream.readlines(chunk_size)
+                if not lines:
+                    break
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if line.startswith("#"):
+                        if vertex_count is None and line.startswith(_VERTICES_HEADER):
+                            vertex_count = int(line[len(_VERTICES_HEADER):])
+                        continue
+                    u_text, v_text = line.split(delimiter)
+                    u, v = int(u_text), int(v_text)
+                    if u < 0 or v < 0:
+                        raise IndexError("Vertex index out of range")
+                    edge = (u, v) if u <= v else (v, u)
+                    if edge in seen:
+                        continue
+                    seen.add(edge)
+                    edges.append(edge)
+                    if edge[1] > max_vertex:
+                        max_vertex = edge[1]
+        if vertex_count is None:
+            vertex_count = max_vertex + 1
+        return cls._from_edge_list(vertex_count, edges)
+
+    def write_edge_list(self, target, delimiter=","):
+        """Потоковая запись списка рёбер в текстовом формате (CSV, TSV)"""
+        with _open_stream(target, "w") as stream:
+            # Заголовок сохраняет изолированные вершины
+            stream.write(f"{_VERTICES_HEADER}{self._vertex_count}\n")
+            for offset in range(0, len(self._edges), _CHUNK_EDGES):
+                chunk = self._edges[offset:offset + _CHUNK_EDGES]
+                stream.write("".join(f"{u}{delimiter}{v}\n" for u, v in chunk))
+
+    @classmethod
+    def read_binary(cls, source, chunk_edges=_CHUNK_EDGES):
+        """Потоковое чтение упакованного двоичного списка рёбер"""
+        with _open_stream(source, "rb") as stream:
+            header = stream.read(_BINARY_HEADER.size)
+            if len(header) != _BINARY_HEADER.size:
+                raise ValueError("Truncated binary edge stream")
+            magic, vertex_count, edge_count = _BINARY_HEADER.unpack(header)
+            if magic != _BINARY_MAGIC:
+                raise ValueError("Not a binary edge stream")
+            edges = []
+            seen = set()
+            remaining = edge_count
+            while remaining:
+                count = min(chunk_edges, remaining)
+                data = stream.read(count * 16)
+                if len(data) != count * 16:
+                    raise ValueError("Truncated binary edge stream")
+                values = array("q")
+                values.frombytes(data)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                it = iter(values)
+                # Поток мог быть записан не write_binary: пары приводятся к (min, max) без повторов
+                for u, v in zip(it, it):
+                    if u < 0 or v < 0:
+                        raise IndexError("Vertex index out of range")
+                    edge = (u, v) if u <= v else (v, u)
+                    if edge in seen:
+                        continue
+                    seen.add(edge)
+                    edges.append(edge)
+                remaining -= count
+        return cls._from_edge_list(vertex_count, edges)
+
+    def write_binary(self, target):
+        """Потоковая запись рёбер парами 64-битных чисел (little-endian)"""
+        with _open_stream(target, "wb") as stream:
+            stream.write(_BINARY_HEADER.pack(_BINARY_MAGIC, self._vertex_count, len(self._edges)))
+            for offset in range(0, len(self._edges), _CHUNK_EDGES):
+                values = array("q")
+                for u, v in self._edges[offset:offset + _CHUNK_EDGES]:
+                    values.append(u)
+                    values.append(v)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                stream.write(values.tobytes())
+
+    def _dump_lines(self):
+        yield f"WirthGraph(vertices={self._vertex_count}, edges={len(self._edges)})\n"
         for v in range(self._vertex_count):
-            neighbors = list(self.neighbors_begin(v))
-            data = self.get_vertex_data(v)
-            result += f"Vertex {v} (data: {data}): {neighbors}\n"
-        return result
+            neighbors = self._ends[self._start[v]:self._start[v + 1]]
+            yield f"Vertex {v} (data: {self._vertex_data[v]}): {neighbors}\n"
+
+    def dump(self, stream=None):
+        """Построчный вывод графа в поток без сборки общей строки"""
+        if stream is None:
+            stream = sys.stdout
+        for line in self._dump_lines():
+            stream.write(line)
+
+    def __str__(self):
+        return "".join(self._dump_lines())
@@ -0,0 +1,299 @@
+"""
+Бенчмарки сортировок на разных распределениях входных данных, эталон - встроенная sorted()
+Запуск (каталог "дополнительные классы" в PYTHONPATH):
+python BenchmarkSorting.py --sizes 1000 100000 [--save-baseline | --compare]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from Book import Book
+from ExternalMergeSort import ExternalMergeSort
+from InPlaceMergeSort import InPlaceMergeSort
+from ParallelMergeSort import ParallelMergeSort
+from Product import Product
+from SortStats import SortStats
+from Student import Student
+
+BASELINE_PATH = Path(__file__).with_name("sort_benchmark_baseline.json")
+
+REFERENCE = "sorted"
+
+
+# Генераторы входных данных
+def random_values(size, rng):
+    return [rng.randrange(size * 10) for _ in range(size)]
+
+
+def sorted_values(size, rng):
+    return list(range(size))
+
+
+def reverse_values(size, rng):
+    return list(range(size, 0, -1))
+
+
+def organ_pipe_values(size, rng):
+    """Возрастающая половина, затем убывающая"""
+    half = size // 2
+    return list(range(half)) + list(range(size - half, 0, -1))
+
+
+def duplicate_values(size, rng):
+    """Много повторов: всего около десятка различных значений"""
+    return [rng.randrange(10) for _ in range(size)]
+
+
+def products(size, rng):
+    return [Product(f"Item{i}", rng.randrange(1000)) for i in range(size)]
+
+
+def students(size, rng):
+    return [Student(f"Student{i}", rng.randrange(400) / 100) for i in range(size)]
+
+
+def books(size, rng):
+    return [Book(f"Book{i}", 1800 + rng.randrange(225)) for i in range(size)]
+
+
+DISTRIBUTIONS = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "reverse": reverse_values,
+    "organ_pipe": organ_pipe_values,
+    "duplicates": duplicate_values,
+    "products": products,
+    "students": students,
+    "books": books,
+}
+
+
+def generate(distribution, size, seed=0):
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'")
+    return DISTRIBUTIONS[distribution](size, random.Random(seed))
+
+
+# Сортировщики: функция получает собственную копию данных и возвращает отсортированный список
+def _sorted(data):
+    return sorted(data)
+
+
+def _in_place(data):
+    InPlaceMergeSort().sort(data)
+    return data
+
+
+def _in_place_generic(data):
+    InPlaceMergeSort(numeric_fast_path=False).sort(data)
+    return data
+
+
+def _parallel(data):
+    ParallelMergeSort().sort(data)
+    return data
+
+
+def _external(data):
+    return list(ExternalMergeSort().sort(data))
+
+
+ENGINES = {
+    REFERENCE: _sorted,
+    "in_place_merge": _in_place,
+    "in_place_merge_generic": _in_place_generic,
+    "parallel_merge": _parallel,
+    "external_merge": _external,
+}
+
+# Сравнения не считаются там, где сортировка идёт в других процессах
+_UNCOUNTABLE = {"parallel_merge"}
+
+# Эти сортировщики считают сравнения сами через SortStats: обёртка элементов
+# отключила бы числовой быстрый путь, и подсчёт описывал бы не ту работу, что замерена
+_STATS_ENGINES = {
+    "in_place_merge": InPlaceMergeSort,
+    "in_place_merge_generic": lambda: InPlaceMergeSort(numeric_fast_path=False),
+}
+# Порции сортируются InPlaceMergeSort, на числовых данных - быстрым путём
+_CHUNKED_FAST_PATH = {"external_merge"}
+
+
+class _Counted:
+    """Обёртка элемента, считающая сравнения в общем счётчике"""
+    __slots__ = ("value",)
+    count = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _Counted.count += 1
+        return self.value < other.value
+
+
+class SortBenchmark:
+    """Замеры времени, числа сравнений и пиковой памяти сортировщиков"""
+
+    def __init__(self, engines=tuple(ENGINES), repeat=1, count_limit=100000, seed=0):
+        """
+        repeat - число прогонов, берётся лучшее время
+        count_limit - сравнения считаются только для размеров не больше этого (подсчёт медленный)
+        """
+        unknown = set(engines) - set(ENGINES)
+        if unknown:
+            raise ValueError(f"Unknown sort engines {sorted(unknown)}")
+        self.engines = [REFERENCE] + [e for e in engines if e != REFERENCE]
+        self.repeat = repeat
+        self.count_limit = count_limit
+        self.seed = seed
+
+    def _measure_time(self, func, data):
+        best = float("inf")
+        result = None
+        for _ in range(self.repeat):
+            copy = data[:]
+            start = time.perf_counter()
+            result = func(copy)
+            best = min(best, time.perf_counter() - start)
+        return result, best
+
+    @staticmethod
+    def _measure_memory(func, data):
+        copy = data[:]
+        tracemalloc.start()
+        func(copy)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / 1024
+
+    def _count_comparisons(self, engine, data):
+        if engine in _UNCOUNTABLE or len(data) > self.count_limit:
+            return None
+        if engine in _STATS_ENGINES or engine in _CHUNKED_FAST_PATH:
+            stats = SortStats()
+            _STATS_ENGINES.get(engine, InPlaceMergeSort)().sort(data[:], stats=stats)
+            # На быстром пути сравнивает встроенная сортировка, их число неизвестно
+            if stats.fast_paths:
+                return None
+            if engine in _STATS_ENGINES:
+                return stats.comparisons
+        _Counted.count = 0
+        ENGINES[engine]([_Counted(x) for x in data])
+        return _Counted.count
+
+    def run_case(self, distribution, size):
+        data = generate(distribution, size, self.seed)
+        results = []
+        reference_seconds = None
+        expected = None
+        for engine in self.engines:
+            func = ENGINES[engine]
+            result, seconds = self._measure_time(func, data)
+            if engine == REFERENCE:
+                reference_seconds, expected = seconds, result
+            elif result != expected:
+                raise AssertionError(f"{engine} sorted {distribution}/{size} incorrectly")
+            results.append({
+                "engine": engine,
+                "distribution": distribution,
+                "size": size,
+                "seconds": seconds,
+                "ops_per_sec": size / seconds if seconds > 0 else float("inf"),
+                "vs_reference": seconds / reference_seconds if reference_seconds else None,
+                "comparisons": self._count_comparisons(engine, data),
+                "peak_kib": self._measure_memory(func, data),
+            })
+        return results
+
+    def run(self, sizes, distributions=tuple(DISTRIBUTIONS)):
+        results = []
+        for size in sizes:
+            for distribution in distributions:
+                results.extend(self.run_case(distribution, size))
+        return results
+
+
+# Базовые результаты для сравнения
+def result_key(result):
+    return f"{result['distribution']}/{result['size']}/{result['engine']}"
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    baseline = {result_key(r): {"ops_per_sec": r["ops_per_sec"], "comparisons": r["comparisons"]}
+                for r in results}
+    Path(path).write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path=BASELINE_PATH):
+    """FileNotFoundError, если базовые результаты не сохранены: сравнивать не с чем"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    Замеры медленнее базовых больше чем на tolerance, а также любой рост числа сравнений:
+    оно детерминировано, поэтому его рост - изменение логики слияния, а не шум
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result_key(result))
+        if not expected:
+            continue
+        if result["ops_per_sec"] < expected["ops_per_sec"] * (1 - tolerance):
+            regressions.append((result, "ops_per_sec", expected["ops_per_sec"]))
+        comparisons = expected.get("comparisons")
+        if comparisons is not None and result["comparisons"] is not None and result["comparisons"] > comparisons:
+            regressions.append((result, "comparisons", comparisons))
+    return regressions
+
+
+def format_results(results):
+    lines = [f"{'distribution':<12} {'size':>9} {'engine':<24} {'seconds':>9} {'x sorted':>9} "
+             f"{'comparisons':>12} {'peak KiB':>10}"]
+    for r in results:
+        comparisons = r["comparisons"] if r["comparisons"] is not None else "-"
+        ratio = f"{r['vs_reference']:.2f}" if r["vs_reference"] is not None else "-"
+        lines.append(f"{r['distribution']:<12} {r['size']:>9} {r['engine']:<24} {r['seconds']:>9.4f} "
+                     f"{ratio:>9} {comparisons:>12} {r['peak_kib']:>10.0f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки сортировок")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS))
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--count-limit", type=int, default=100000)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    if args.compare and not args.baseline.exists():
+        parser.error(f"базовые результаты {args.baseline} не найдены, сохраните их с --save-baseline")
+
+    benchmark = SortBenchmark(args.engines, args.repeat, args.count_limit)
+    results = benchmark.run(args.sizes, args.distributions)
+    print(format_results(results))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Базовые результаты сохранены в {args.baseline}")
+    if args.compare:
+        regressions = find_regressions(results, load_baseline(args.baseline), args.tolerance)
+        for result, metric, expected in regressions:
+            print(f"РЕГРЕССИЯ {result_key(result)}: {metric} = {result[metric]:.0f} "
+                  f"(базовое значение {expected:.0f})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,33 +1,160 @@
+import operator
 import random
+import time
+from collections.abc import Sequence
+from itertools import islice
 from typing import TypeVar, Generic
 
+from numeric_sort import sort_numeric
+from SortStats import SortStats
+
 T = TypeVar('T')
 
+class ArrayView(Sequence):
+    """Представление списка только для чтения, без копирования элементов"""
+    __slots__ = ("_arr",)
+    
+    def __init__(self, arr: list):
+        self._arr = arr
+    
+    def __len__(self) -> int:
+        return len(self._arr)
+    
+    def __getitem__(self, index):
+        return self._arr[index]
+    
+    def __iter__(self):
+        return iter(self._arr)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArrayView):
+            other = other._arr
+        if not isinstance(other, Sequence) or len(other) != len(self._arr):
+            return False
+        return all(map(operator.eq, self._arr, other))
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"ArrayView({self._arr!r})"
+
 class BogoSort(Generic[T]):
-    def __init__(self, arr: list[T] = None):
-        self._arr = arr.copy() if arr else []
+    def __init__(self, arr: list[T] = None, max_shuffles: int = None, time_budget: float = None,
+                 copy: bool = True):
+        """
+        max_shuffles - ограничение числа перемешиваний
+        time_budget - ограничение времени сортировки в секундах
+        При исчерпании любого ограничения массив досортировывается за O(n log n)
+        copy=False - сортировщик работает прямо со списком вызывающего без копий:
+        sort() сортирует его на месте, get_array() возвращает представление только для чтения
+        """
+        self._copy = copy
+        self._arr = self._take(arr)
+        self.max_shuffles = max_shuffles
+        self.time_budget = time_budget
+        # Известна ли упорядоченность: None - не проверялась после изменения массива
+        self._sorted = None
+    
+    def _take(self, arr: list[T] | None) -> list[T]:
+        if arr is None:
+            return []
+        return arr.copy() if self._copy else arr
+    
+    def _result(self) -> list[T]:
+        return self._arr.copy() if self._copy else self._arr
     
     def is_sorted(self) -> bool:
-        """Проверяет, отсортирован ли массив"""
-        return all(self._arr[i] <= self._arr[i + 1] for i in range(len(self._arr) - 1))
+        """Проверяет, отсортирован ли массив (до первой инверсии, результат запоминается)"""
+        # Чужой список могли изменить снаружи, поэтому без копии результат не запоминается
+        if self._sorted is None or not self._copy:
+            arr = self._arr
+            # Попарное сравнение соседей на уровне C, all останавливается на первом False
+            self._sorted = all(map(operator.le, arr, islice(arr, 1, None)))
+        return self._sorted
     
     def shuffle(self) -> None:
         """Перемешивает массив случайным образом"""
         random.shuffle(self._arr)
+        self._sorted = None
+    
+    def sort(self, stats: SortStats = None) -> list[T]:
+        """Выполняет сортировку bogosort (stats - необязательный сбор статистики)"""
+        if stats is not None:
+            return self._sort_counted(stats)
+        # Однородные числа сортируются сразу встроенными средствами
+        if not sort_numeric(self._arr, 0, len(self._arr) - 1):
+            shuffles = 0
+            deadline = self._deadline()
+            while not self.is_sorted():
+                if self._budget_exhausted(shuffles, deadline):
+                    self._fallback_sort()
+                    break
+                self.shuffle()
+                shuffles += 1
+        self._sorted = True
+        return self._result()
+    
+    def _deadline(self) -> float | None:
+        if self.time_budget is None:
+            return None
+        return time.perf_counter() + self.time_budget
+    
+    def _budget_exhausted(self, shuffles: int, deadline: float | None) -> bool:
+        if self.max_shuffles is not None and shuffles >= self.max_shuffles:
+            return True
+        return deadline is not None and time.perf_counter() >= deadline
+    
+    def _fallback_sort(self) -> None:
+        """Обычная сортировка за O(n log n), когда ограничение исчерпано"""
+        self._arr.sort()
+        self._sorted = True
+    
+    def _sort_counted(self, stats: SortStats) -> list[T]:
+        """Та же сортировка с подсчётом сравнений, перемешиваний и перемещений"""
+        stats.sorts += 1
+        shuffles_before = stats.shuffles
+        with stats.phase("total"):
+            with stats.phase("numeric_fast_path"):
+                handled = sort_numeric(self._arr, 0, len(self._arr) - 1)
+            if handled:
+                stats.fast_paths += 1
+            else:
+                deadline = self._deadline()
+                while not self._is_sorted_counted(stats):
+                    if self._budget_exhausted(stats.shuffles - shuffles_before, deadline):
+                        with stats.phase("fallback"):
+                            self._fallback_sort()
+                        stats.fallbacks += 1
+                        break
+                    with stats.phase("shuffle"):
+                        self.shuffle()
+                    stats.shuffles += 1
+                    stats.moves += len(self._arr)
+        self._sorted = True
+        stats.finish()
+        return self._result()
+    
+    def _is_sorted_counted(self, stats: SortStats) -> bool:
+        arr = self._arr
+        with stats.phase("is_sorted"):
+            for i in range(len(arr) - 1):
+                stats.comparisons += 1
+                if not arr[i] <= arr[i + 1]:
+                    return False
+        return True
     
-    def sort(self) -> list[T]:
-        """Выполняет сортировку bogosort"""
-        while not self.is_sorted():
-            self.shuffle()
-        return self._arr.copy()
+    def get_array(self) -> list[T] | ArrayView:
+        """Возвращает копию текущего массива (при copy=False - представление только для чтения)"""
+        return self._arr.copy() if self._copy else ArrayView(self._arr)
     
-    def get_array(self) -> list[T]:
-        """Возвращает копию текущего массива"""
-        return self._arr.copy()
+    def view(self) -> ArrayView:
+        """Представление текущего массива только для чтения, без копирования"""
+        return ArrayView(self._arr)
     
     def set_array(self, arr: list[T]) -> None:
         """Устанавливает новый массив для сортировки"""
-        self._arr = arr.copy()
+        self._arr = self._take(arr)
+        self._sorted = None
     
     def __str__(self) -> str:
         return f"BogoSort(array={self._arr}, sorted={self.is_sorted()})"
@@ -0,0 +1,94 @@
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+from InPlaceMergeSort import InPlaceMergeSort
+
+T = TypeVar('T')
+
+
+class ExternalMergeSort(Generic[T]):
+    """
+    Внешняя сортировка слиянием для данных, не помещающихся в память
+    Вход читается порциями по chunk_size элементов, каждая порция сортируется
+    InPlaceMergeSort и сбрасывается во временный файл кадрами pickle,
+    затем серии сливаются k-путевым слиянием с ограниченным числом открытых файлов
+    """
+
+    def __init__(self, chunk_size: int = 100000, frame_size: int = 1024, max_fan_in: int = 64,
+                 buffer_size: int = 1 << 16, temp_dir: str = None):
+        """
+        chunk_size - элементов в памяти при формировании серии
+        frame_size - элементов в одном кадре pickle (и в буфере чтения каждой серии)
+        max_fan_in - максимум серий, сливаемых за один проход
+        buffer_size - размер буфера файлового ввода-вывода в байтах
+        """
+        if chunk_size < 1 or frame_size < 1 or max_fan_in < 2:
+            raise ValueError("Invalid external sort parameters")
+        self.chunk_size = chunk_size
+        self.frame_size = frame_size
+        self.max_fan_in = max_fan_in
+        self.buffer_size = buffer_size
+        self.temp_dir = temp_dir
+        self._sorter = InPlaceMergeSort()
+
+    def sort(self, iterable: Iterable[T], key: Callable[[T], object] = None,
+             reverse: bool = False) -> Iterator[T]:
+        """Генератор элементов iterable в отсортированном (устойчиво) порядке"""
+        source = iter(iterable)
+        runs = []
+        try:
+            while True:
+                chunk = list(islice(source, self.chunk_size))
+                if not chunk:
+                    break
+                self._sorter.sort(chunk, key=key, reverse=reverse)
+                if not runs and len(chunk) < self.chunk_size:
+                    # Всё поместилось в одну порцию - обходимся без диска
+                    yield from chunk
+                    return
+                runs.append(self._write_run(chunk))
+
+            # Многопроходное слияние, пока серий больше, чем можно открыть за раз
+            while len(runs) > self.max_fan_in:
+                merged_runs = []
+                for i in range(0, len(runs), self.max_fan_in):
+                    group = runs[i:i + self.max_fan_in]
+                    merged_runs.append(self._write_run(self._merge(group, key, reverse)))
+                    for run in group:
+                        run.close()
+                runs = merged_runs
+
+            yield from self._merge(runs, key, reverse)
+        finally:
+            for run in runs:
+                run.close()
+
+    def _write_run(self, items: Iterable[T]):
+        """Записывает серию во временный файл кадрами по frame_size элементов"""
+        run = tempfile.TemporaryFile(dir=self.temp_dir, buffering=self.buffer_size)
+        items = iter(items)
+        while True:
+            frame = list(islice(items, self.frame_size))
+            if not frame:
+                break
+            pickle.dump(frame, run, protocol=pickle.HIGHEST_PROTOCOL)
+        run.flush()
+        return run
+
+    @staticmethod
+    def _read_run(run) -> Iterator[T]:
+        """Читает серию с начала, держа в памяти только текущий кадр"""
+        run.seek(0)
+        while True:
+            try:
+                frame = pickle.load(run)
+            except EOFError:
+                return
+            yield from frame
+
+    def _merge(self, runs: list, key, reverse: bool) -> Iterator[T]:
+        # heapq.merge при равных ключах берёт элемент из более ранней серии - слияние устойчиво
+        return heapq.merge(*(self._read_run(run) for run in runs), key=key, reverse=reverse)
\ No newline at end of file
@@ -1,4 +1,7 @@
-from typing import TypeVar, Generic
+from typing import Callable, TypeVar, Generic
+
+from numeric_sort import argsort_numeric, sort_numeric
+from SortStats import SortStats
 
 T = TypeVar('T')
 
@@ -6,50 +9,339 @@ class InPlaceMergeSort(Generic[T]):
     """
     In-place merge sort для любого списка объектов с поддержкой операторов сравнения
     Сортирует оригинальный массив без создания копий и без дополнительной памяти
+    (при сортировке по key ключи вычисляются один раз и хранятся в параллельном массиве)
     """
     
-    def sort(self, arr: list[T], start: int = 0, end: int = None) -> None:
-        """Основной метод сортировки"""
+    def __init__(self, bottom_up: bool = True, min_run: int = 32, numeric_fast_path: bool = True):
+        """
+        bottom_up - итеративная сортировка без рекурсии (естественные серии + слияние)
+        min_run - минимальная длина серии, короткие серии добиваются вставками
+        numeric_fast_path - однородные числа (и числовые ключи) сортируются встроенными
+        или векторными (NumPy) средствами вместо поэлементных сравнений
+        """
+        self.bottom_up = bottom_up
+        self.min_run = max(1, min_run)
+        self.numeric_fast_path = numeric_fast_path
+    
+    def sort(self, arr: list[T], start: int = 0, end: int = None,
+             key: Callable[[T], object] = None, reverse: bool = False,
+             stats: SortStats = None) -> None:
+        """
+        Основной метод сортировки
+        key - функция ключа, вызывается ровно один раз для каждого элемента
+        reverse - сортировка по убыванию с сохранением порядка равных элементов
+        stats - необязательный сбор статистики (без него сортировка не тратит время на подсчёты)
+        """
         if end is None:
             end = len(arr) - 1
+        if stats is not None:
+            _InstrumentedMergeSort(self, stats).sort(arr, start, end, key, reverse)
+            return
+        if start >= end:
+            return
+        
+        if key is None:
+            if self.numeric_fast_path and sort_numeric(arr, start, end, reverse):
+                return
+            keys, items = arr, None
+        else:
+            # Декорирование: сравниваются ключи, элементы переставляются вместе с ними
+            items = arr[start:end + 1]
+            keys = [key(item) for item in items]
+            if self.numeric_fast_path:
+                order = argsort_numeric(keys, reverse)
+                if order is not None:
+                    arr[start:end + 1] = [items[i] for i in order]
+                    return
+            start, end, offset = 0, end - start, start
         
+        self._sort_range(keys, start, end, items, reverse)
+        if items is not None:
+            arr[offset:offset + len(items)] = items
+    
+    def _sort_range(self, arr: list, start: int, end: int, items: list, reverse: bool) -> None:
+        # Устойчивый обратный порядок: разворот, сортировка по возрастанию, разворот
+        if reverse:
+            self._reverse(arr, start, end + 1, items)
+        if self.bottom_up:
+            self._sort_bottom_up(arr, start, end, items)
+        else:
+            self._sort_recursive(arr, start, end, items)
+        if reverse:
+            self._reverse(arr, start, end + 1, items)
+    
+    def _sort_recursive(self, arr: list, start: int, end: int, items: list = None) -> None:
+        """Рекурсивная сортировка сверху вниз"""
         if start < end:
             mid = (start + end) // 2
             
             # Рекурсивно сортируем левую и правую половины
-            self.sort(arr, start, mid)
-            self.sort(arr, mid + 1, end)
+            self._sort_recursive(arr, start, mid, items)
+            self._sort_recursive(arr, mid + 1, end, items)
             
             # In-place слияние отсортированных половин
-            self._merge_inplace(arr, start, mid, end)
+            self._merge_inplace(arr, start, mid, end, items)
     
-    def _merge_inplace(self, arr: list[T], start: int, mid: int, end: int) -> None:
+    def _sort_bottom_up(self, arr: list, start: int, end: int, items: list = None) -> None:
+        """Итеративная сортировка снизу вверх по естественным сериям (как в TimSort)"""
+        if start >= end:
+            return
+        stop = end + 1
+        
+        # Границы серий: bounds[i] - начало i-й серии, последний элемент - конец диапазона
+        bounds = []
+        lo = start
+        while lo < stop:
+            run_end = self._find_run(arr, lo, stop, items)
+            forced_end = min(lo + self.min_run, stop)
+            if run_end < forced_end:
+                self._binary_insertion_sort(arr, lo, forced_end, run_end, items)
+                run_end = forced_end
+            bounds.append(lo)
+            lo = run_end
+        bounds.append(stop)
+        
+        # Попарно сливаем соседние серии, пока не останется одна
+        while len(bounds) > 2:
+            merged = [bounds[0]]
+            for i in range(0, len(bounds) - 2, 2):
+                self._merge_inplace(arr, bounds[i], bounds[i + 1] - 1, bounds[i + 2] - 1, items)
+                merged.append(bounds[i + 2])
+            if len(bounds) % 2 == 0:
+                # Нечётное число серий: последняя переходит в следующий проход без слияния
+                merged.append(bounds[-1])
+            bounds = merged
+    
+    def _find_run(self, arr: list, lo: int, stop: int, items: list = None) -> int:
+        """Находит серию, начинающуюся с lo, и возвращает её конец (не включительно)"""
+        run_end = lo + 1
+        if run_end == stop:
+            return run_end
+        if arr[run_end] < arr[lo]:
+            # Строго убывающую серию можно развернуть без потери устойчивости
+            while run_end + 1 < stop and arr[run_end + 1] < arr[run_end]:
+                run_end += 1
+            run_end += 1
+            self._reverse(arr, lo, run_end, items)
+        else:
+            while run_end + 1 < stop and not arr[run_end + 1] < arr[run_end]:
+                run_end += 1
+            run_end += 1
+        return run_end
+    
+    def _binary_insertion_sort(self, arr: list, lo: int, stop: int, sorted_end: int,
+                               items: list = None) -> None:
+        """Устойчивая сортировка вставками arr[lo:stop], где arr[lo:sorted_end] уже упорядочен"""
+        for i in range(sorted_end, stop):
+            item = arr[i]
+            left, right = lo, i
+            while left < right:
+                middle = (left + right) // 2
+                if item < arr[middle]:
+                    right = middle
+                else:
+                    left = middle + 1
+            self._move_right(arr, left, i, items)
+    
+    def _merge_inplace(self, arr: list, start: int, mid: int, end: int, items: list = None) -> None:
         """In-place слияние двух отсортированных подмассивов без дополнительной памяти"""
-        left = start
-        right = mid + 1
+        # Половины уже стоят в нужном порядке
+        if not arr[mid + 1] < arr[mid]:
+            return
+        self._sym_merge(arr, start, mid + 1, end + 1, items)
+    
+    def _sym_merge(self, arr: list, a: int, m: int, b: int, items: list = None) -> None:
+        """
+        Устойчивое слияние SymMerge отсортированных arr[a:m] и arr[m:b] поворотами
+        O(n log n) сравнений и O(n log n) перемещений, глубина рекурсии O(log n)
+        """
+        if m - a == 1:
+            # Один элемент слева: вставляем его перед первым строго большим справа
+            i, j = m, b
+            while i < j:
+                h = (i + j) // 2
+                if arr[h] < arr[a]:
+                    i = h + 1
+                else:
+                    j = h
+            self._move_left(arr, a, i - 1, items)
+            return
         
-        while left <= mid and right <= end:
-            # Если элемент слева меньше или равен - всё ок, двигаем левый указатель
-            if arr[left] <= arr[right]:
-                left += 1
+        if b - m == 1:
+            # Один элемент справа: вставляем его после последнего не большего слева
+            i, j = a, m
+            while i < j:
+                h = (i + j) // 2
+                if not arr[m] < arr[h]:
+                    i = h + 1
+                else:
+                    j = h
+            self._move_right(arr, i, m, items)
+            return
+        
+        middle = (a + b) // 2
+        n = middle + m
+        if m > middle:
+            low, high = n - b, middle
+        else:
+            low, high = a, m
+        # Ищем симметричную точку разреза относительно middle
+        p = n - 1
+        while low < high:
+            c = (low + high) // 2
+            if not arr[p - c] < arr[c]:
+                low = c + 1
             else:
-                # Сохраняем элемент справа и сдвигаем элементы
-                temp = arr[right]
-                index = right
-                
-                # Сдвигаем все элементы от left до right-1 вправо
-                while index > left:
-                    arr[index] = arr[index - 1]
-                    index -= 1
-                
-                # Вставляем сохранённый элемент на место left
-                arr[left] = temp
-                
-                # Обновляем указатели
+                high = c
+        
+        cut_end = n - low
+        if low < m < cut_end:
+            self._rotate(arr, low, m, cut_end, items)
+        if a < low < middle:
+            self._sym_merge(arr, a, low, middle, items)
+        if middle < cut_end < b:
+            self._sym_merge(arr, middle, cut_end, b, items)
+    
+    # Перемещения: items (если задан) повторяет все перестановки arr
+    @staticmethod
+    def _move_left(arr: list, i: int, j: int, items: list = None) -> None:
+        """Переносит arr[i] на позицию j >= i, сдвигая arr[i+1:j+1] влево"""
+        for seq in (arr, items) if items is not None else (arr,):
+            temp = seq[i]
+            for k in range(i, j):
+                seq[k] = seq[k + 1]
+            seq[j] = temp
+    
+    @staticmethod
+    def _move_right(arr: list, i: int, j: int, items: list = None) -> None:
+        """Переносит arr[j] на позицию i <= j, сдвигая arr[i:j] вправо"""
+        for seq in (arr, items) if items is not None else (arr,):
+            temp = seq[j]
+            for k in range(j, i, -1):
+                seq[k] = seq[k - 1]
+            seq[i] = temp
+    
+    @staticmethod
+    def _reverse(arr: list, i: int, j: int, items: list = None) -> None:
+        """Разворот arr[i:j] обменами"""
+        for seq in (arr, items) if items is not None else (arr,):
+            left, right = i, j - 1
+            while left < right:
+                seq[left], seq[right] = seq[right], seq[left]
                 left += 1
-                mid += 1
-                right += 1
+                right -= 1
+    
+    def _rotate(self, arr: list, a: int, m: int, b: int, items: list = None) -> None:
+        """Циклический сдвиг: arr[a:m] и arr[m:b] меняются местами тремя разворотами"""
+        self._reverse(arr, a, m, items)
+        self._reverse(arr, m, b, items)
+        self._reverse(arr, a, b, items)
     
     def is_sorted(self, arr: list[T]) -> bool:
         """Проверяет, отсортирован ли массив"""
-        return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
\ No newline at end of file
+        return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+
+
+class _CountingKey:
+    """Обёртка ключа, считающая сравнения"""
+    __slots__ = ("value", "stats")
+    
+    def __init__(self, value, stats: SortStats):
+        self.value = value
+        self.stats = stats
+    
+    def __lt__(self, other: '_CountingKey') -> bool:
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+
+class _CountingList(list):
+    """Список, считающий записи элементов (перемещения)"""
+    __slots__ = ("stats",)
+    
+    def __init__(self, values, stats: SortStats):
+        super().__init__(values)
+        self.stats = stats
+    
+    def __setitem__(self, index, value):
+        self.stats.moves += 1
+        super().__setitem__(index, value)
+
+
+class _InstrumentedMergeSort(InPlaceMergeSort):
+    """
+    Сортировщик с теми же настройками, что и исходный, но со сбором статистики
+    Создаётся только при переданном stats, поэтому обычная сортировка не платит за подсчёты
+    """
+    
+    def __init__(self, base: InPlaceMergeSort, stats: SortStats):
+        super().__init__(base.bottom_up, base.min_run, base.numeric_fast_path)
+        self.stats = stats
+        self._depth = 0
+    
+    def sort(self, arr: list[T], start: int = 0, end: int = None,
+             key: Callable[[T], object] = None, reverse: bool = False,
+             stats: SortStats = None) -> None:
+        if end is None:
+            end = len(arr) - 1
+        self.stats.sorts += 1
+        with self.stats.phase("total"):
+            self._sort_counted(arr, start, end, key, reverse)
+        self.stats.finish()
+    
+    def _sort_counted(self, arr: list[T], start: int, end: int, key, reverse: bool) -> None:
+        stats = self.stats
+        if start >= end:
+            return
+        if key is None and self.numeric_fast_path:
+            with stats.phase("numeric_fast_path"):
+                handled = sort_numeric(arr, start, end, reverse)
+            if handled:
+                stats.fast_paths += 1
+                return
+        
+        with stats.phase("decorate"):
+            items = arr[start:end + 1]
+            keys = items if key is None else [key(item) for item in items]
+        if key is not None and self.numeric_fast_path:
+            with stats.phase("numeric_fast_path"):
+                order = argsort_numeric(keys, reverse)
+                if order is not None:
+                    arr[start:end + 1] = [items[i] for i in order]
+            if order is not None:
+                stats.fast_paths += 1
+                return
+        
+        counted = _CountingList((_CountingKey(k, stats) for k in keys), stats)
+        self._sort_range(counted, 0, len(items) - 1, items, reverse)
+        with stats.phase("write_back"):
+            arr[start:end + 1] = items
+    
+    def _sort_recursive(self, arr: list, start: int, end: int, items: list = None) -> None:
+        self._depth += 1
+        self.stats.enter(self._depth)
+        try:
+            super()._sort_recursive(arr, start, end, items)
+        finally:
+            self._depth -= 1
+    
+    def _sym_merge(self, arr: list, a: int, m: int, b: int, items: list = None) -> None:
+        self._depth += 1
+        self.stats.enter(self._depth)
+        try:
+            super()._sym_merge(arr, a, m, b, items)
+        finally:
+            self._depth -= 1
+    
+    def _find_run(self, arr: list, lo: int, stop: int, items: list = None) -> int:
+        with self.stats.phase("runs"):
+            return super()._find_run(arr, lo, stop, items)
+    
+    def _binary_insertion_sort(self, arr: list, lo: int, stop: int, sorted_end: int,
+                               items: list = None) -> None:
+        with self.stats.phase("runs"):
+            super()._binary_insertion_sort(arr, lo, stop, sorted_end, items)
+    
+    def _merge_inplace(self, arr: list, start: int, mid: int, end: int, items: list = None) -> None:
+        with self.stats.phase("merge"):
+            super()._merge_inplace(arr, start, mid, end, items)
\ No newline at end of file
@@ -0,0 +1,132 @@
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, TypeVar, Generic
+
+from InPlaceMergeSort import InPlaceMergeSort
+from numeric_sort import numeric_typecode
+
+T = TypeVar('T')
+
+
+def _sort_order(keys: list, offset: int, reverse: bool) -> list[int]:
+    """Устойчивый порядок индексов (со сдвигом offset) по ключам фрагмента"""
+    order = list(range(len(keys)))
+    InPlaceMergeSort().sort(order, key=keys.__getitem__, reverse=reverse)
+    return [offset + i for i in order]
+
+
+def _sort_shared_chunk(keys_name: str, typecode: str, lo: int, hi: int,
+                       reverse: bool, order_name: str | None) -> None:
+    """
+    Задача рабочего процесса для числовых ключей в разделяемой памяти
+    Без order_name сортирует сами значения на месте, иначе записывает порядок индексов
+    """
+    keys_shm = SharedMemory(name=keys_name)
+    keys_view = keys_shm.buf.cast(typecode)
+    try:
+        chunk = keys_view[lo:hi].tolist()
+        if order_name is None:
+            InPlaceMergeSort().sort(chunk, reverse=reverse)
+            keys_view[lo:hi] = array(typecode, chunk)
+            return
+        order_shm = SharedMemory(name=order_name)
+        order_view = order_shm.buf.cast("q")
+        try:
+            order_view[lo:hi] = array("q", _sort_order(chunk, lo, reverse))
+        finally:
+            order_view.release()
+            order_shm.close()
+    finally:
+        keys_view.release()
+        keys_shm.close()
+
+
+class ParallelMergeSort(Generic[T]):
+    """
+    Параллельная сортировка слиянием: фрагменты сортируются InPlaceMergeSort
+    в пуле процессов, затем сливаются k-путевым слиянием на куче
+    Устойчива; числовые ключи передаются рабочим через разделяемую память
+    """
+
+    def __init__(self, workers: int = None, min_parallel_size: int = 10000):
+        """
+        workers - число процессов (по умолчанию число процессоров)
+        min_parallel_size - меньшие диапазоны сортируются в текущем процессе
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_size = min_parallel_size
+
+    def sort(self, arr: list[T], start: int = 0, end: int = None,
+             key: Callable[[T], object] = None, reverse: bool = False) -> None:
+        """Сортирует arr[start:end + 1] на месте, вызов совместим с InPlaceMergeSort.sort"""
+        if end is None:
+            end = len(arr) - 1
+        length = end - start + 1
+        if length <= 1:
+            return
+        if self.workers <= 1 or length < self.min_parallel_size:
+            InPlaceMergeSort().sort(arr, start, end, key=key, reverse=reverse)
+            return
+
+        items = arr[start:end + 1]
+        keys = items if key is None else [key(item) for item in items]
+        step = -(-length // self.workers)
+        bounds = [(lo, min(lo + step, length)) for lo in range(0, length, step)]
+
+        typecode = numeric_typecode(keys)
+        if typecode is None:
+            result = self._sort_objects(items, keys, bounds, reverse)
+        else:
+            result = self._sort_numeric(items, keys, typecode, bounds, reverse, key is None)
+        arr[start:end + 1] = result
+
+    def _merge_order(self, keys: list, orders: list, reverse: bool) -> list[int]:
+        """k-путевое слияние отсортированных фрагментов; при равных ключах первым идёт более ранний фрагмент"""
+        return list(heapq.merge(*orders, key=keys.__getitem__, reverse=reverse))
+
+    def _sort_objects(self, items: list, keys: list, bounds: list, reverse: bool) -> list:
+        with ProcessPoolExecutor(self.workers) as pool:
+            futures = [pool.submit(_sort_order, keys[lo:hi], lo, reverse) for lo, hi in bounds]
+            orders = [future.result() for future in futures]
+        return [items[i] for i in self._merge_order(keys, orders, reverse)]
+
+    def _sort_numeric(self, items: list, keys: list, typecode: str, bounds: list,
+                      reverse: bool, values_only: bool) -> list:
+        packed = array(typecode, keys)
+        keys_shm = SharedMemory(create=True, size=len(packed) * packed.itemsize)
+        order_shm = None if values_only else SharedMemory(create=True, size=len(packed) * 8)
+        try:
+            keys_view = keys_shm.buf.cast(typecode)
+            keys_view[:len(packed)] = packed
+            keys_view.release()
+
+            order_name = None if order_shm is None else order_shm.name
+            with ProcessPoolExecutor(self.workers) as pool:
+                futures = [pool.submit(_sort_shared_chunk, keys_shm.name, typecode, lo, hi, reverse, order_name)
+                           for lo, hi in bounds]
+                for future in futures:
+                    future.result()
+
+            if values_only:
+                # Равные числа неразличимы, поэтому сливаем сами значения
+                keys_view = keys_shm.buf.cast(typecode)
+                try:
+                    runs = [keys_view[lo:hi].tolist() for lo, hi in bounds]
+                finally:
+                    keys_view.release()
+                return list(heapq.merge(*runs, reverse=reverse))
+
+            order_view = order_shm.buf.cast("q")
+            try:
+                orders = [order_view[lo:hi].tolist() for lo, hi in bounds]
+            finally:
+                order_view.release()
+            return [items[i] for i in self._merge_order(keys, orders, reverse)]
+        finally:
+            for shm in (keys_shm, order_shm):
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+
+class SortStats:
+    """
+    Счётчики и замеры времени сортировок: сравнения, перемещения элементов,
+    перемешивания, глубина рекурсии и время по фазам
+    Передаётся в sort(..., stats=...); без него сортировки ничего не считают
+    """
+    
+    def __init__(self, callback: Callable[['SortStats'], None] = None):
+        """callback вызывается после каждой завершённой сортировки (например, для метрик)"""
+        self.callback = callback
+        self.reset()
+    
+    def reset(self) -> None:
+        self.sorts = 0
+        self.comparisons = 0
+        self.moves = 0
+        self.shuffles = 0
+        self.max_depth = 0
+        self.fast_paths = 0
+        self.fallbacks = 0
+        self.timings: dict[str, float] = {}
+    
+    def add_time(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Замер времени фазы, время суммируется по всем вызовам"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+    
+    def enter(self, depth: int) -> None:
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    def finish(self) -> None:
+        if self.callback is not None:
+            self.callback(self)
+    
+    def as_dict(self) -> dict:
+        return {
+            "sorts": self.sorts,
+            "comparisons": self.comparisons,
+            "moves": self.moves,
+            "shuffles": self.shuffles,
+            "max_depth": self.max_depth,
+            "fast_paths": self.fast_paths,
+            "fallbacks": self.fallbacks,
+            "timings": dict(self.timings),
+        }
+    
+    def __str__(self) -> str:
+        return (f"SortStats(sorts={self.sorts}, comparisons={self.comparisons}, moves={self.moves}, "
+                f"shuffles={self.shuffles}, max_depth={self.max_depth})")
\ No newline at end of file
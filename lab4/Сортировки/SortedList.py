@@ -0,0 +1,337 @@
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import chain
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+from InPlaceMergeSort import InPlaceMergeSort
+
+T = TypeVar('T')
+
+
+class SortedList(Generic[T]):
+    """
+    Отсортированный список с добавлением, удалением и поиском за O(log n)
+    Элементы хранятся в подсписках ограниченной длины, над их длинами строится
+    дерево Фенвика для запросов по позиции (select) и ранга (rank)
+    Порядок задаётся сравнениями самих элементов (например, @total_ordering) или функцией key;
+    равные элементы идут в порядке добавления
+    """
+
+    def __init__(self, iterable: Iterable[T] = None, key: Callable[[T], object] = None, load: int = 1000):
+        """load - целевая длина подсписка, подсписок делится пополам при превышении 2 * load"""
+        if load < 2:
+            raise ValueError("SortedList load must be at least 2")
+        self._key = key
+        self._load = load
+        self._lists: list[list[T]] = []
+        # Ключи подсписков; без key это те же подсписки элементов
+        self._keys: list[list] = self._lists if key is None else []
+        self._maxes: list = []
+        # Дерево Фенвика по длинам подсписков, None - требуется перестроить
+        self._index: list[int] | None = None
+        self._len = 0
+        if iterable is not None:
+            self.update(iterable)
+
+    def _key_of(self, value: T):
+        return value if self._key is None else self._key(value)
+
+    # Дерево Фенвика по длинам подсписков
+    def _fenwick(self) -> list[int]:
+        if self._index is None:
+            tree = [0] + [len(sublist) for sublist in self._lists]
+            size = len(self._lists)
+            for i in range(1, size + 1):
+                parent = i + (i & -i)
+                if parent <= size:
+                    tree[parent] += tree[i]
+            self._index = tree
+        return self._index
+
+    def _index_add(self, pos: int, delta: int) -> None:
+        tree = self._index
+        if tree is None:
+            return
+        i = pos + 1
+        size = len(tree) - 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _position(self, pos: int, offset: int) -> int:
+        """Позиция в списке элемента с номером offset в подсписке pos"""
+        if pos == 0:
+            return offset
+        tree = self._fenwick()
+        i = pos
+        while i > 0:
+            offset += tree[i]
+            i -= i & -i
+        return offset
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """(подсписок, смещение в нём) для позиции index в списке"""
+        if len(self._lists) == 1:
+            return 0, index
+        tree = self._fenwick()
+        size = len(tree) - 1
+        pos = 0
+        step = 1 << size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] <= index:
+                index -= tree[nxt]
+                pos = nxt
+            step >>= 1
+        return pos, index
+
+    # Изменение
+    def add(self, value: T) -> None:
+        """Добавляет элемент после всех равных ему"""
+        key = self._key_of(value)
+        if not self._maxes:
+            self._lists.append([value])
+            if self._key is not None:
+                self._keys.append([key])
+            self._maxes.append(key)
+            self._index = None
+            self._len = 1
+            return
+
+        pos = bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._lists[pos].append(value)
+            if self._key is not None:
+                self._keys[pos].append(key)
+            self._maxes[pos] = key
+        elif self._key is None:
+            insort_right(self._lists[pos], value)
+        else:
+            i = bisect_right(self._keys[pos], key)
+            self._lists[pos].insert(i, value)
+            self._keys[pos].insert(i, key)
+        self._len += 1
+
+        if len(self._lists[pos]) > 2 * self._load:
+            self._split(pos)
+        else:
+            self._index_add(pos, 1)
+
+    def update(self, iterable: Iterable[T]) -> None:
+        """Добавляет все элементы; большие пачки вставляются одной сортировкой вместо поштучных вставок"""
+        values = list(iterable)
+        if not values:
+            return
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        values = list(chain(self, values))
+        InPlaceMergeSort().sort(values, key=self._key)
+        self._rebuild(values)
+
+    def _rebuild(self, values: list[T]) -> None:
+        load = self._load
+        self._lists[:] = [values[i:i + load] for i in range(0, len(values), load)]
+        if self._key is not None:
+            self._keys[:] = [[self._key(value) for value in sublist] for sublist in self._lists]
+        self._maxes[:] = [keys[-1] for keys in self._keys]
+        self._index = None
+        self._len = len(values)
+
+    def _split(self, pos: int) -> None:
+        load = self._load
+        self._lists.insert(pos + 1, self._lists[pos][load:])
+        del self._lists[pos][load:]
+        if self._key is not None:
+            self._keys.insert(pos + 1, self._keys[pos][load:])
+            del self._keys[pos][load:]
+        self._maxes[pos] = self._keys[pos][-1]
+        self._maxes.insert(pos + 1, self._keys[pos + 1][-1])
+        self._index = None
+
+    def _delete(self, pos: int, offset: int) -> None:
+        del self._lists[pos][offset]
+        if self._key is not None:
+            del self._keys[pos][offset]
+        self._len -= 1
+
+        if not self._lists[pos]:
+            del self._lists[pos]
+            if self._key is not None:
+                del self._keys[pos]
+            del self._maxes[pos]
+            self._index = None
+            return
+        self._maxes[pos] = self._keys[pos][-1]
+        if len(self._lists[pos]) >= self._load // 2 or len(self._lists) == 1:
+            self._index_add(pos, -1)
+            return
+
+        # Слишком короткий подсписок сливается с соседом
+        if pos == len(self._lists) - 1:
+            pos -= 1
+        self._lists[pos].extend(self._lists.pop(pos + 1))
+        if self._key is not None:
+            self._keys[pos].extend(self._keys.pop(pos + 1))
+        self._maxes[pos] = self._maxes.pop(pos + 1)
+        self._index = None
+        if len(self._lists[pos]) > 2 * self._load:
+            self._split(pos)
+
+    def _find(self, value: T) -> tuple[int, int] | None:
+        """
+        Положение элемента среди равных ему по ключу: сначала ищется сам объект,
+        иначе первый равный ему по ==
+        """
+        key = self._key_of(value)
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return None
+        offset = bisect_left(self._keys[pos], key)
+        candidate = None
+        while pos < len(self._lists):
+            keys = self._keys[pos]
+            items = self._lists[pos]
+            while offset < len(keys):
+                if key < keys[offset]:
+                    return candidate
+                item = items[offset]
+                if item is value:
+                    return pos, offset
+                if candidate is None and item == value:
+                    candidate = (pos, offset)
+                offset += 1
+            pos += 1
+            offset = 0
+        return candidate
+
+    def remove(self, value: T) -> None:
+        """Удаляет элемент; ValueError, если его нет"""
+        location = self._find(value)
+        if location is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        self._delete(*location)
+
+    def discard(self, value: T) -> None:
+        """Удаляет элемент, если он есть"""
+        location = self._find(value)
+        if location is not None:
+            self._delete(*location)
+
+    def pop(self, index: int = -1) -> T:
+        pos, offset = self._locate(self._normalize(index))
+        value = self._lists[pos][offset]
+        self._delete(pos, offset)
+        return value
+
+    def __delitem__(self, index: int) -> None:
+        self._delete(*self._locate(self._normalize(index)))
+
+    def clear(self) -> None:
+        self._lists.clear()
+        self._keys.clear()
+        self._maxes.clear()
+        self._index = None
+        self._len = 0
+
+    # Поиск
+    def bisect_key_left(self, key) -> int:
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._position(pos, bisect_left(self._keys[pos], key))
+
+    def bisect_key_right(self, key) -> int:
+        pos = bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._position(pos, bisect_right(self._keys[pos], key))
+
+    def bisect_left(self, value: T) -> int:
+        return self.bisect_key_left(self._key_of(value))
+
+    def bisect_right(self, value: T) -> int:
+        return self.bisect_key_right(self._key_of(value))
+
+    def rank(self, value: T) -> int:
+        """Число элементов строго меньше value"""
+        return self.bisect_left(value)
+
+    def select(self, index: int) -> T:
+        """Элемент на позиции index в отсортированном порядке"""
+        return self[index]
+
+    def index(self, value: T) -> int:
+        location = self._find(value)
+        if location is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        return self._position(*location)
+
+    def count(self, value: T) -> int:
+        start = self.bisect_left(value)
+        stop = self.bisect_right(value)
+        return sum(1 for item in self._iter_range(start, stop) if item == value)
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._iter_range(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        pos, offset = self._locate(self._normalize(index))
+        return self._lists[pos][offset]
+
+    # Обход
+    def _iter_range(self, start: int, stop: int) -> Iterator[T]:
+        if start >= stop:
+            return
+        pos, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._lists[pos][offset:offset + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos += 1
+            offset = 0
+
+    def irange_key(self, minimum=None, maximum=None,
+                   inclusive: tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """Элементы с ключами между minimum и maximum (None - без границы)"""
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_key_left(minimum) if inclusive[0] else self.bisect_key_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_key_right(maximum) if inclusive[1] else self.bisect_key_left(maximum)
+        return self._iter_range(start, stop)
+
+    def irange(self, minimum: T = None, maximum: T = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """Элементы между minimum и maximum (None - без границы)"""
+        return self.irange_key(None if minimum is None else self._key_of(minimum),
+                               None if maximum is None else self._key_of(maximum), inclusive)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain.from_iterable(reversed(sublist) for sublist in reversed(self._lists))
+
+    def __contains__(self, value: T) -> bool:
+        return self._find(value) is not None
+
+    def __repr__(self) -> str:
+        return f"SortedList({list(self)!r})"
\ No newline at end of file
@@ -3,7 +3,8 @@ import random
 from Product import Product
 from Student import Student
 from Book import Book
-from Bogosort import BogoSort
+from Bogosort import ArrayView, BogoSort
+from SortStats import SortStats
 
 class TestBogosort(unittest.TestCase):
     
@@ -204,6 +205,102 @@ class TestBogosort(unittest.TestCase):
         
         self.assertTrue(sorted_sorter.is_sorted())
         self.assertFalse(unsorted_sorter.is_sorted())
+    
+    def test_numeric_fast_path_long_list(self):
+        """Длинный список чисел сортируется без перемешиваний"""
+        values = [(i * 37) % 101 - 50 for i in range(200)]
+        sorter = BogoSort(values)
+        result = sorter.sort()
+        self.assertEqual(result, sorted(values))
+        self.assertTrue(sorter.is_sorted())
+    
+    def test_sort_with_stats(self):
+        """Статистика перемешиваний и сравнений"""
+        stats = SortStats()
+        sorter = BogoSort([Book("C", 3), Book("A", 1), Book("D", 4), Book("B", 2)])
+        result = sorter.sort(stats=stats)
+        
+        self.assertEqual([b.year for b in result], [1, 2, 3, 4])
+        self.assertEqual(stats.sorts, 1)
+        self.assertGreater(stats.shuffles, 0)
+        self.assertEqual(stats.moves, stats.shuffles * 4)
+        self.assertGreaterEqual(stats.comparisons, stats.shuffles + 3)
+        self.assertIn("shuffle", stats.timings)
+    
+    def test_stats_callback(self):
+        """callback вызывается после сортировки"""
+        reports = []
+        stats = SortStats(callback=reports.append)
+        BogoSort([2, 1, 3]).sort(stats=stats)
+        self.assertEqual(reports, [stats])
+        self.assertEqual(stats.fast_paths, 1)
+    
+    def test_is_sorted_stops_at_first_inversion(self):
+        """Проверка упорядоченности останавливается на первой инверсии"""
+        compared = []
+        
+        class Tracked(Book):
+            def __le__(self, other):
+                compared.append(self.year)
+                return self.year <= other.year
+        
+        sorter = BogoSort([Tracked("B", 2), Tracked("A", 1)] + [Tracked(f"T{i}", i) for i in range(3, 50)])
+        self.assertFalse(sorter.is_sorted())
+        self.assertEqual(compared, [2])
+        # Результат запоминается до следующего изменения массива
+        self.assertFalse(sorter.is_sorted())
+        self.assertEqual(compared, [2])
+    
+    def test_bounded_by_max_shuffles(self):
+        """При исчерпании перемешиваний массив досортировывается обычной сортировкой"""
+        books = [Book(f"Book{i}", (i * 7) % 12) for i in range(12)]
+        stats = SortStats()
+        sorter = BogoSort(books, max_shuffles=5)
+        result = sorter.sort(stats=stats)
+        
+        self.assertEqual([b.year for b in result], list(range(12)))
+        self.assertEqual(stats.shuffles, 5)
+        self.assertEqual(stats.fallbacks, 1)
+        self.assertIn("sorted=True", str(sorter))
+    
+    def test_bounded_by_time_budget(self):
+        """Ограничение по времени не даёт сортировке зависнуть на длинном списке"""
+        students = [Student(f"S{i}", ((i * 13) % 20) / 5) for i in range(20)]
+        result = BogoSort(students, time_budget=0.01).sort()
+        self.assertEqual([s.gpa for s in result], sorted(s.gpa for s in students))
+    
+    def test_ownership_mode_sorts_in_place(self):
+        """При copy=False сортируется сам список вызывающего"""
+        products = [Product("C", 30), Product("A", 10), Product("B", 20)]
+        sorter = BogoSort(products, copy=False)
+        result = sorter.sort()
+        
+        self.assertIs(result, products)
+        self.assertEqual([p.price for p in products], [10, 20, 30])
+    
+    def test_ownership_mode_get_array_is_read_only_view(self):
+        """get_array без копии возвращает представление только для чтения"""
+        original = [3, 1, 2]
+        sorter = BogoSort(original, copy=False)
+        view = sorter.get_array()
+        
+        self.assertIsInstance(view, ArrayView)
+        self.assertEqual(view, [3, 1, 2])
+        self.assertEqual(len(view), 3)
+        with self.assertRaises(TypeError):
+            view[0] = 5
+        # Представление отражает изменения исходного списка
+        original[0] = 9
+        self.assertEqual(view[0], 9)
+        self.assertFalse(sorter.is_sorted())
+    
+    def test_view_in_copy_mode(self):
+        """view() не копирует внутренний массив и в обычном режиме"""
+        sorter = BogoSort([2, 1])
+        view = sorter.view()
+        sorter.sort()
+        self.assertEqual(list(view), [1, 2])
+        self.assertEqual(view, sorter.view())
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
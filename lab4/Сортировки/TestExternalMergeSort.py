@@ -0,0 +1,66 @@
+import random
+import tempfile
+import unittest
+from Product import Product
+from Book import Book
+from ExternalMergeSort import ExternalMergeSort
+
+
+class TestExternalMergeSort(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # Маленькие порции и кадры, чтобы серии действительно попадали на диск
+        self.sorter = ExternalMergeSort(chunk_size=50, frame_size=7, max_fan_in=3,
+                                        temp_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_empty_input(self):
+        self.assertEqual(list(self.sorter.sort([])), [])
+    
+    def test_single_chunk_in_memory(self):
+        self.assertEqual(list(self.sorter.sort([3, 1, 2])), [1, 2, 3])
+    
+    def test_many_runs_multi_pass(self):
+        rng = random.Random(3)
+        data = [rng.randint(0, 1000) for _ in range(1000)]  # 20 серий, несколько проходов
+        self.assertEqual(list(self.sorter.sort(data)), sorted(data))
+    
+    def test_generator_input_and_reverse(self):
+        data = (x * 37 % 101 for x in range(300))
+        expected = sorted((x * 37 % 101 for x in range(300)), reverse=True)
+        self.assertEqual(list(self.sorter.sort(data, reverse=True)), expected)
+    
+    def test_output_is_lazy(self):
+        result = self.sorter.sort(range(500, 0, -1))
+        self.assertEqual(next(result), 1)
+        self.assertEqual(next(result), 2)
+        result.close()
+    
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            ExternalMergeSort(chunk_size=0)
+        with self.assertRaises(ValueError):
+            ExternalMergeSort(max_fan_in=1)
+
+
+class TestExternalMergeSortWithCustomClasses(unittest.TestCase):
+    
+    def setUp(self):
+        self.sorter = ExternalMergeSort(chunk_size=16, frame_size=5, max_fan_in=2)
+    
+    def test_product_sort_is_stable(self):
+        products = [Product(f"Item{i}", (i * 7) % 5) for i in range(100)]
+        expected = [p.name for p in sorted(products)]
+        self.assertEqual([p.name for p in self.sorter.sort(products)], expected)
+    
+    def test_book_sort_with_key(self):
+        books = [Book(f"Book{i}", 1900 + (i * 31) % 120) for i in range(80)]
+        expected = [b.title for b in sorted(books, key=lambda b: b.title)]
+        self.assertEqual([b.title for b in self.sorter.sort(books, key=lambda b: b.title)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,14 +1,20 @@
+import random
 import unittest
-from Product import Product
-from Student import Student
-from Book import Book
+from array import array
+from Product import Product, CompactProduct
+from Student import Student, CompactStudent
+from Book import Book, CompactBook
 from InPlaceMergeSort import InPlaceMergeSort
+from SortStats import SortStats
+import numeric_sort
 
 
 class TestInPlaceMergeSort(unittest.TestCase):
     
     def setUp(self):
         self.sorter = InPlaceMergeSort()
+        # Без быстрого числового пути, чтобы проверять сам алгоритм слияния
+        self.generic_sorter = InPlaceMergeSort(numeric_fast_path=False)
     
     def test_empty_list(self):
         arr = []
@@ -39,12 +45,109 @@ class TestInPlaceMergeSort(unittest.TestCase):
         arr = [5, 2, 5, 1, 2, 1]
         self.sorter.sort(arr)
         self.assertEqual(arr, [1, 1, 2, 2, 5, 5])
+    
+    def test_large_reverse_sorted_array(self):
+        arr = list(range(5000, 0, -1))
+        self.generic_sorter.sort(arr)
+        self.assertEqual(arr, list(range(1, 5001)))
+    
+    def test_large_random_array(self):
+        rng = random.Random(42)
+        arr = [rng.randint(0, 100) for _ in range(3000)]
+        expected = sorted(arr)
+        self.generic_sorter.sort(arr)
+        self.assertEqual(arr, expected)
+    
+    def test_subrange_sort(self):
+        arr = [9, 5, 4, 3, 2, 0]
+        self.generic_sorter.sort(arr, 1, 4)
+        self.assertEqual(arr, [9, 2, 3, 4, 5, 0])
+    
+    def test_recursive_mode(self):
+        sorter = InPlaceMergeSort(bottom_up=False, numeric_fast_path=False)
+        arr = [3, 1, 4, 1, 5, 9, 2, 6]
+        sorter.sort(arr)
+        self.assertEqual(arr, [1, 1, 2, 3, 4, 5, 6, 9])
+    
+    def test_bottom_up_small_runs(self):
+        rng = random.Random(7)
+        for min_run in (1, 2, 5):
+            sorter = InPlaceMergeSort(min_run=min_run, numeric_fast_path=False)
+            arr = [rng.randint(0, 20) for _ in range(257)]
+            expected = sorted(arr)
+            sorter.sort(arr)
+            self.assertEqual(arr, expected)
+    
+    def test_nearly_sorted_is_linear(self):
+        comparisons = [0]
+        
+        class Counted:
+            def __init__(self, value):
+                self.value = value
+            
+            def __lt__(self, other):
+                comparisons[0] += 1
+                return self.value < other.value
+        
+        arr = [Counted(i) for i in range(10000)]
+        arr[5000], arr[5001] = arr[5001], arr[5000]
+        self.sorter.sort(arr)
+        
+        self.assertEqual([c.value for c in arr], list(range(10000)))
+        self.assertLess(comparisons[0], 3 * len(arr))
+    
+    def test_stats_counts_comparisons_and_moves(self):
+        stats = SortStats()
+        arr = [random.randint(0, 100) for _ in range(300)]
+        expected = sorted(arr)
+        self.generic_sorter.sort(arr, stats=stats)
+        
+        self.assertEqual(arr, expected)
+        self.assertEqual(stats.sorts, 1)
+        self.assertGreater(stats.comparisons, 0)
+        self.assertGreater(stats.moves, 0)
+        self.assertIn("merge", stats.timings)
+        self.assertIn("total", stats.timings)
+    
+    def test_stats_recursion_depth(self):
+        stats = SortStats()
+        arr = list(range(200, 0, -1))
+        InPlaceMergeSort(bottom_up=False, numeric_fast_path=False).sort(arr, stats=stats)
+        self.assertEqual(arr, list(range(1, 201)))
+        self.assertGreaterEqual(stats.max_depth, 8)
+    
+    def test_stats_sorted_input_is_linear(self):
+        stats = SortStats()
+        arr = list(range(1000))
+        self.generic_sorter.sort(arr, stats=stats)
+        self.assertEqual(stats.comparisons, 999)
+        self.assertEqual(stats.moves, 0)
+    
+    def test_stats_key_reverse_and_callback(self):
+        reports = []
+        stats = SortStats(callback=lambda s: reports.append(s.as_dict()))
+        students = [Student("Alice", 3.5), Student("Bob", 3.9), Student("Charlie", 3.5), Student("Diana", 3.9)]
+        self.sorter.sort(students, key=lambda s: s.name, stats=stats)
+        self.sorter.sort(students, reverse=True, stats=stats)
+        
+        self.assertEqual([s.name for s in students], ["Bob", "Diana", "Alice", "Charlie"])
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[-1]["sorts"], 2)
+    
+    def test_stats_numeric_fast_path(self):
+        stats = SortStats()
+        arr = [5, 3, 1, 4, 2]
+        self.sorter.sort(arr, stats=stats)
+        self.assertEqual(arr, [1, 2, 3, 4, 5])
+        self.assertEqual(stats.fast_paths, 1)
+        self.assertEqual(stats.comparisons, 0)
 
 
 class TestInPlaceMergeSortWithCustomClasses(unittest.TestCase):
     
     def setUp(self):
         self.sorter = InPlaceMergeSort()
+        self.generic_sorter = InPlaceMergeSort(numeric_fast_path=False)
     
     def test_product_sort_by_price(self):
         products = [
@@ -85,6 +188,120 @@ class TestInPlaceMergeSortWithCustomClasses(unittest.TestCase):
         self.assertEqual(books[0].year, 1932)
         self.assertEqual(books[1].year, 1949)
         self.assertEqual(books[2].year, 1953)
+    
+    def test_sort_is_stable(self):
+        products = [Product(f"Item{i}", price) for i, price in enumerate([50, 10, 50, 10, 30, 50, 10])]
+        self.sorter.sort(products)
+        
+        self.assertEqual([p.price for p in products], [10, 10, 10, 30, 50, 50, 50])
+        # Равные по цене продукты сохраняют исходный порядок
+        self.assertEqual([p.name for p in products],
+                         ["Item1", "Item3", "Item6", "Item4", "Item0", "Item2", "Item5"])
+    
+    def test_sort_with_key(self):
+        products = [Product("Laptop", 1000), Product("Mouse", 25), Product("Keyboard", 75)]
+        self.sorter.sort(products, key=lambda p: p.name)
+        self.assertEqual([p.name for p in products], ["Keyboard", "Laptop", "Mouse"])
+    
+    def test_key_computed_once_per_element(self):
+        calls = []
+        
+        def price_key(product):
+            calls.append(product)
+            return product.price
+        
+        products = [Product(f"Item{i}", (i * 37) % 11) for i in range(50)]
+        self.sorter.sort(products, key=price_key)
+        
+        self.assertEqual(len(calls), 50)
+        self.assertEqual([p.price for p in products], sorted((i * 37) % 11 for i in range(50)))
+    
+    def test_reverse_is_stable(self):
+        students = [Student("Alice", 3.5), Student("Bob", 3.9), Student("Charlie", 3.5), Student("Diana", 3.9)]
+        self.sorter.sort(students, reverse=True)
+        self.assertEqual([s.name for s in students], ["Bob", "Diana", "Alice", "Charlie"])
+        
+        books = [Book("B", 1950), Book("A", 1950), Book("C", 1920)]
+        self.sorter.sort(books, key=lambda b: b.year, reverse=True)
+        self.assertEqual([b.title for b in books], ["B", "A", "C"])
+        
+        # Тот же результат без быстрого пути по числовым ключам
+        books = [Book("B", 1950), Book("A", 1950), Book("C", 1920)]
+        self.generic_sorter.sort(books, key=lambda b: b.year, reverse=True)
+        self.assertEqual([b.title for b in books], ["B", "A", "C"])
+    
+    def test_key_on_subrange(self):
+        arr = [9, -5, 4, -3, 2, 0]
+        self.generic_sorter.sort(arr, 1, 4, key=abs)
+        self.assertEqual(arr, [9, 2, -3, 4, -5, 0])
+    
+    def test_numeric_fast_path(self):
+        rng = random.Random(5)
+        ints = [rng.randint(-100, 100) for _ in range(1000)]
+        floats = [rng.uniform(-1, 1) for _ in range(1000)]
+        for values in (ints, floats):
+            arr = list(values)
+            self.sorter.sort(arr)
+            self.assertEqual(arr, sorted(values))
+            arr = list(values)
+            self.sorter.sort(arr, 100, 899, reverse=True)
+            self.assertEqual(arr, values[:100] + sorted(values[100:900], reverse=True) + values[900:])
+    
+    def test_numeric_fast_path_array_buffer(self):
+        arr = array("d", [3.5, -1.0, 2.25, 0.0])
+        self.sorter.sort(arr)
+        self.assertIsInstance(arr, array)
+        self.assertEqual(arr.tolist(), [-1.0, 0.0, 2.25, 3.5])
+    
+    def test_numeric_fast_path_unsigned_array(self):
+        big = (1 << 64) - 1
+        arr = array("Q", [big, 1, 1 << 63, 0])
+        self.sorter.sort(arr)
+        self.assertEqual(arr.tolist(), [0, 1, 1 << 63, big])
+        self.sorter.sort(arr, reverse=True)
+        self.assertEqual(arr.tolist(), [big, 1 << 63, 1, 0])
+    
+    @unittest.skipIf(numeric_sort.np is None, "NumPy не установлен")
+    def test_numeric_fast_path_unsigned_array_numpy(self):
+        big = (1 << 64) - 1
+        values = [big, 1, (1 << 63) + 5, 0, 1 << 63]
+        self.assertEqual(numeric_sort._stable_sorted(values, "Q", False), sorted(values))
+        self.assertEqual(numeric_sort._stable_sorted(values, "Q", True), sorted(values, reverse=True))
+        arr = array("L", [3, 1, 2])
+        self.sorter.sort(arr)
+        self.assertEqual(arr.tolist(), [1, 2, 3])
+    
+    def test_mixed_types_use_generic_path(self):
+        arr = [3, 1.5, True, 2]
+        self.sorter.sort(arr)
+        self.assertEqual(arr, [True, 1.5, 2, 3])
+    
+    def test_compact_records_have_no_dict(self):
+        for record in (CompactProduct("Mouse", 25), CompactStudent("Alice", 3.5), CompactBook("1984", 1949)):
+            self.assertFalse(hasattr(record, "__dict__"))
+            with self.assertRaises(AttributeError):
+                record.extra = 1
+    
+    def test_compact_product_comparisons(self):
+        cheap, expensive, same = CompactProduct("Mouse", 25), CompactProduct("Laptop", 1000), CompactProduct("Cable", 25)
+        self.assertTrue(cheap < expensive)
+        self.assertTrue(cheap <= same)
+        self.assertTrue(expensive > cheap)
+        self.assertTrue(cheap >= same)
+        self.assertTrue(cheap == same)
+        self.assertTrue(cheap != expensive)
+        self.assertFalse(cheap == Product("Mouse", 25))
+    
+    def test_compact_from_columns_sort(self):
+        students = CompactStudent.from_columns(["Alice", "Bob", "Charlie", "Diana"], [3.5, 3.9, 3.5, 3.2])
+        self.sorter.sort(students)
+        self.assertEqual([s.name for s in students], ["Diana", "Alice", "Charlie", "Bob"])
+        
+        books = CompactBook.from_columns(("Dune", "1984"), (1965, 1949))
+        self.sorter.sort(books, reverse=True)
+        self.assertEqual(repr(books), "[CompactBook('Dune', 1965), CompactBook('1984', 1949)]")
+        with self.assertRaises(ValueError):
+            CompactProduct.from_columns(["Mouse"], [25, 30])
 
 
 if __name__ == '__main__':
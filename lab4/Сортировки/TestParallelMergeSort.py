@@ -0,0 +1,74 @@
+import random
+import unittest
+from Product import Product
+from Student import Student
+from ParallelMergeSort import ParallelMergeSort
+
+
+class TestParallelMergeSort(unittest.TestCase):
+    
+    def setUp(self):
+        # Маленький порог, чтобы даже короткие массивы шли через пул процессов
+        self.sorter = ParallelMergeSort(workers=3, min_parallel_size=2)
+    
+    def test_empty_list(self):
+        arr = []
+        self.sorter.sort(arr)
+        self.assertEqual(arr, [])
+    
+    def test_int_array(self):
+        rng = random.Random(1)
+        arr = [rng.randint(-1000, 1000) for _ in range(500)]
+        expected = sorted(arr)
+        self.sorter.sort(arr)
+        self.assertEqual(arr, expected)
+    
+    def test_float_array_reverse(self):
+        rng = random.Random(2)
+        arr = [rng.random() for _ in range(500)]
+        expected = sorted(arr, reverse=True)
+        self.sorter.sort(arr, reverse=True)
+        self.assertEqual(arr, expected)
+    
+    def test_huge_ints_use_object_path(self):
+        arr = [1 << 70, -5, 3, 1 << 64, 0]
+        self.sorter.sort(arr)
+        self.assertEqual(arr, [-5, 0, 3, 1 << 64, 1 << 70])
+    
+    def test_strings(self):
+        arr = ["pear", "apple", "fig", "banana", "cherry"]
+        self.sorter.sort(arr)
+        self.assertEqual(arr, ["apple", "banana", "cherry", "fig", "pear"])
+    
+    def test_subrange(self):
+        arr = list(range(20, 0, -1))
+        self.sorter.sort(arr, 5, 14)
+        self.assertEqual(arr, [20, 19, 18, 17, 16] + list(range(6, 16)) + [5, 4, 3, 2, 1])
+    
+    def test_small_input_sorted_in_process(self):
+        sorter = ParallelMergeSort(workers=4)
+        arr = [3, 1, 2]
+        sorter.sort(arr)
+        self.assertEqual(arr, [1, 2, 3])
+
+
+class TestParallelMergeSortWithCustomClasses(unittest.TestCase):
+    
+    def setUp(self):
+        self.sorter = ParallelMergeSort(workers=3, min_parallel_size=2)
+    
+    def test_product_sort_is_stable(self):
+        products = [Product(f"Item{i}", (i * 7) % 5) for i in range(100)]
+        expected = [p.name for p in sorted(products)]
+        self.sorter.sort(products)
+        self.assertEqual([p.name for p in products], expected)
+    
+    def test_student_sort_with_numeric_key(self):
+        students = [Student(f"S{i}", round((i * 13) % 10 / 2.5, 1)) for i in range(60)]
+        expected = [s.name for s in sorted(students, key=lambda s: s.gpa, reverse=True)]
+        self.sorter.sort(students, key=lambda s: s.gpa, reverse=True)
+        self.assertEqual([s.name for s in students], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
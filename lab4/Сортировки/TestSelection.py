@@ -0,0 +1,100 @@
+import random
+import unittest
+from Product import Product
+from Student import Student
+from Book import Book
+from selection import nth_element, partial_sort, top_k
+
+
+class TestSelection(unittest.TestCase):
+    
+    def test_nth_element_random(self):
+        rng = random.Random(1)
+        for n in (1, 2, 17, 100, 1000):
+            data = [rng.randint(0, n) for _ in range(n)]
+            expected = sorted(data)
+            for k in {0, n // 2, n - 1}:
+                arr = data[:]
+                nth_element(arr, k)
+                self.assertEqual(arr[k], expected[k])
+                self.assertTrue(all(x <= arr[k] for x in arr[:k]))
+                self.assertTrue(all(arr[k] <= x for x in arr[k + 1:]))
+                self.assertEqual(sorted(arr), expected)
+    
+    def test_nth_element_adversarial_inputs(self):
+        # Упорядоченные, обратные, "органные трубы" и одинаковые элементы
+        inputs = [list(range(500)), list(range(500, 0, -1)),
+                  list(range(250)) + list(range(250, 0, -1)), [7] * 500]
+        for data in inputs:
+            arr = data[:]
+            nth_element(arr, 123)
+            self.assertEqual(arr[123], sorted(data)[123])
+    
+    def test_nth_element_reverse(self):
+        arr = [5, 1, 9, 3, 7, 2]
+        nth_element(arr, 1, reverse=True)
+        self.assertEqual(arr[1], 7)
+        self.assertTrue(all(x >= 7 for x in arr[:1]))
+        self.assertTrue(all(x <= 7 for x in arr[2:]))
+    
+    def test_nth_element_out_of_range(self):
+        with self.assertRaises(IndexError):
+            nth_element([1, 2, 3], 3)
+        with self.assertRaises(IndexError):
+            nth_element([], 0)
+    
+    def test_partial_sort(self):
+        rng = random.Random(2)
+        data = [rng.randint(0, 10000) for _ in range(2000)]
+        arr = data[:]
+        partial_sort(arr, 100)
+        self.assertEqual(arr[:100], sorted(data)[:100])
+        self.assertEqual(sorted(arr), sorted(data))
+    
+    def test_partial_sort_k_larger_than_list(self):
+        arr = [3, 1, 2]
+        partial_sort(arr, 10)
+        self.assertEqual(arr, [1, 2, 3])
+        partial_sort(arr, 0)
+        self.assertEqual(arr, [1, 2, 3])
+    
+    def test_top_k_streaming(self):
+        result = top_k((x * 37 % 1001 for x in range(1001)), 5)
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+        self.assertEqual(top_k(iter(range(10)), 3, reverse=True), [9, 8, 7])
+        self.assertEqual(top_k([], 3), [])
+        self.assertEqual(top_k([1, 2], 0), [])
+
+
+class TestSelectionWithCustomClasses(unittest.TestCase):
+    
+    def test_cheapest_products(self):
+        products = [Product(f"Item{i}", (i * 37) % 200) for i in range(200)]
+        arr = products[:]
+        partial_sort(arr, 10)
+        self.assertEqual([p.price for p in arr[:10]], list(range(10)))
+        self.assertEqual([p.price for p in top_k(products, 10)], list(range(10)))
+    
+    def test_top_gpa_students(self):
+        students = [Student(f"S{i}", (i * 13 % 40) / 10) for i in range(40)]
+        best = top_k(students, 3, key=lambda s: s.gpa, reverse=True)
+        self.assertEqual([s.gpa for s in best], [3.9, 3.8, 3.7])
+        arr = students[:]
+        partial_sort(arr, 3, key=lambda s: s.gpa, reverse=True)
+        self.assertEqual([s.gpa for s in arr[:3]], [3.9, 3.8, 3.7])
+    
+    def test_top_k_is_stable(self):
+        books = [Book(f"Book{i}", 2000 + i % 3) for i in range(12)]
+        oldest = top_k(books, 4, key=lambda b: b.year)
+        self.assertEqual([b.title for b in oldest], ["Book0", "Book3", "Book6", "Book9"])
+    
+    def test_nth_element_with_key(self):
+        books = [Book(f"Book{i}", 1900 + (i * 31) % 120) for i in range(120)]
+        arr = books[:]
+        nth_element(arr, 60, key=lambda b: b.year)
+        self.assertEqual(arr[60].year, 1960)
+        self.assertEqual(sorted(b.title for b in arr), sorted(b.title for b in books))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
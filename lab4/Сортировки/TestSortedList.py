@@ -0,0 +1,125 @@
+import random
+import unittest
+from Product import Product
+from Student import Student
+from Book import Book
+from SortedList import SortedList
+
+
+class TestSortedList(unittest.TestCase):
+    
+    def test_empty(self):
+        sl = SortedList()
+        self.assertEqual(len(sl), 0)
+        self.assertEqual(list(sl), [])
+        self.assertEqual(sl.bisect_left(5), 0)
+        self.assertNotIn(5, sl)
+        with self.assertRaises(IndexError):
+            sl[0]
+    
+    def test_add_keeps_order(self):
+        sl = SortedList([5, 1, 4])
+        sl.add(3)
+        sl.add(0)
+        sl.add(9)
+        self.assertEqual(list(sl), [0, 1, 3, 4, 5, 9])
+        self.assertEqual(sl[0], 0)
+        self.assertEqual(sl[-1], 9)
+        self.assertEqual(sl[1:3], [1, 3])
+    
+    def test_random_operations_match_sorted(self):
+        # Маленький load, чтобы подсписки делились и сливались
+        rng = random.Random(5)
+        sl = SortedList(load=4)
+        expected = []
+        for _ in range(2000):
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                expected.remove(value)
+                sl.remove(value)
+            else:
+                value = rng.randint(0, 100)
+                expected.append(value)
+                expected.sort()
+                sl.add(value)
+            self.assertEqual(len(sl), len(expected))
+        self.assertEqual(list(sl), expected)
+        self.assertEqual(list(reversed(sl)), expected[::-1])
+        for i in range(len(expected)):
+            self.assertEqual(sl[i], expected[i])
+    
+    def test_rank_select_bisect(self):
+        sl = SortedList([10, 20, 20, 30, 40], load=2)
+        self.assertEqual(sl.rank(20), 1)
+        self.assertEqual(sl.bisect_right(20), 3)
+        self.assertEqual(sl.select(3), 30)
+        self.assertEqual(sl.index(30), 3)
+        self.assertEqual(sl.count(20), 2)
+        with self.assertRaises(ValueError):
+            sl.index(25)
+    
+    def test_remove_discard_pop(self):
+        sl = SortedList(range(10), load=3)
+        sl.remove(4)
+        sl.discard(100)
+        self.assertEqual(sl.pop(), 9)
+        self.assertEqual(sl.pop(0), 0)
+        del sl[1]
+        self.assertEqual(list(sl), [1, 3, 5, 6, 7, 8])
+        with self.assertRaises(ValueError):
+            sl.remove(4)
+    
+    def test_update_bulk(self):
+        sl = SortedList([5, 3], load=4)
+        sl.update(range(100, 0, -1))
+        self.assertEqual(list(sl), sorted([5, 3] + list(range(1, 101))))
+        sl.update([50])
+        self.assertEqual(sl.count(50), 2)
+        sl.clear()
+        self.assertEqual(len(sl), 0)
+    
+    def test_irange(self):
+        sl = SortedList(range(0, 100, 5), load=3)
+        self.assertEqual(list(sl.irange(20, 35)), [20, 25, 30, 35])
+        self.assertEqual(list(sl.irange(20, 35, inclusive=(False, False))), [25, 30])
+        self.assertEqual(list(sl.irange(maximum=7)), [0, 5])
+        self.assertEqual(list(sl.irange(minimum=91)), [95])
+        self.assertEqual(list(sl.irange(60, 40)), [])
+    
+    def test_invalid_load(self):
+        with self.assertRaises(ValueError):
+            SortedList(load=1)
+
+
+class TestSortedListWithCustomClasses(unittest.TestCase):
+    
+    def test_products_price_range(self):
+        products = SortedList((Product(f"Item{i}", (i * 37) % 150) for i in range(150)),
+                              key=lambda p: p.price, load=8)
+        in_range = list(products.irange_key(50, 100))
+        self.assertEqual([p.price for p in in_range], list(range(50, 101)))
+    
+    def test_products_total_ordering(self):
+        products = SortedList([Product("Laptop", 1000), Product("Mouse", 25)])
+        products.add(Product("Keyboard", 75))
+        self.assertEqual([p.name for p in products], ["Mouse", "Keyboard", "Laptop"])
+        cheap = list(products.irange(Product("", 0), Product("", 100)))
+        self.assertEqual([p.name for p in cheap], ["Mouse", "Keyboard"])
+    
+    def test_equal_elements_keep_insertion_order(self):
+        students = SortedList(key=lambda s: s.gpa, load=2)
+        for name, gpa in [("Alice", 3.5), ("Bob", 3.9), ("Charlie", 3.5), ("Diana", 3.9), ("Eve", 3.5)]:
+            students.add(Student(name, gpa))
+        self.assertEqual([s.name for s in students], ["Alice", "Charlie", "Eve", "Bob", "Diana"])
+    
+    def test_remove_prefers_same_object(self):
+        first = Book("Dune", 1965)
+        second = Book("Ubik", 1965)
+        books = SortedList([first, second, Book("1984", 1949)])
+        books.remove(second)
+        self.assertEqual([b.title for b in books], ["1984", "Dune"])
+        self.assertEqual(books.index(first), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Быстрый путь сортировки однородных числовых данных встроенными или векторными средствами"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него используется встроенная сортировка list
+    np = None
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+_NUMERIC_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+def numeric_typecode(values) -> str | None:
+    """Код типа array для однородного списка int (в пределах int64) или float без NaN"""
+    if not values:
+        return None
+    first_type = type(values[0])
+    if first_type is float:
+        # NaN ломает сравнения, такие данные оставляем общему алгоритму
+        if all(type(v) is float and v == v for v in values):
+            return "d"
+        return None
+    if first_type is int:
+        if all(type(v) is int and INT64_MIN <= v <= INT64_MAX for v in values):
+            return "q"
+    return None
+
+
+def _dtype(typecode: str):
+    """Тип NumPy для кода типа array: беззнаковые Q/L не помещаются в int64 выше INT64_MAX"""
+    if typecode in "fd":
+        return np.float64
+    if typecode in "BHILQ":
+        return np.uint64
+    return np.int64
+
+
+def _stable_sorted(values: list, typecode: str, reverse: bool) -> list:
+    if np is None:
+        return sorted(values, reverse=reverse)
+    packed = np.array(values, dtype=_dtype(typecode))
+    if reverse:
+        # Разворот, устойчивая сортировка по возрастанию и обратный разворот
+        packed = packed[::-1].copy()
+        packed.sort(kind="stable")
+        return packed[::-1].tolist()
+    packed.sort(kind="stable")
+    return packed.tolist()
+
+
+def sort_numeric(arr, start: int, end: int, reverse: bool = False) -> bool:
+    """
+    Сортирует arr[start:end + 1] на месте, если это однородные числа
+    (list из int/float, array.array или одномерный numpy.ndarray)
+    Возвращает False, если данные не подходят для быстрого пути
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+            return False
+        view = arr[start:end + 1]
+        if arr.dtype.kind == "f" and np.isnan(view).any():
+            return False
+        if reverse:
+            view[:] = view[::-1].copy()
+            view.sort(kind="stable")
+            view[:] = view[::-1].copy()
+        else:
+            view.sort(kind="stable")
+        return True
+
+    if isinstance(arr, array):
+        if arr.typecode not in _NUMERIC_TYPECODES:
+            return False
+        values = arr[start:end + 1].tolist()
+        if arr.typecode in "fd" and any(v != v for v in values):
+            return False
+        arr[start:end + 1] = array(arr.typecode, _stable_sorted(values, arr.typecode, reverse))
+        return True
+
+    if isinstance(arr, list):
+        values = arr[start:end + 1]
+        typecode = numeric_typecode(values)
+        if typecode is None:
+            return False
+        arr[start:end + 1] = _stable_sorted(values, typecode, reverse)
+        return True
+    return False
+
+
+def argsort_numeric(keys: list, reverse: bool = False) -> list[int] | None:
+    """Устойчивый порядок индексов по однородным числовым ключам или None"""
+    typecode = numeric_typecode(keys)
+    if typecode is None:
+        return None
+    if np is None:
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    packed = np.array(keys, dtype=_dtype(typecode))
+    if reverse:
+        last = len(keys) - 1
+        return (last - np.argsort(packed[::-1], kind="stable"))[::-1].tolist()
+    return np.argsort(packed, kind="stable").tolist()
\ No newline at end of file
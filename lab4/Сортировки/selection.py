@@ -0,0 +1,136 @@
+"""Частичная сортировка и выбор k-го элемента без полной сортировки массива"""
+
+import heapq
+from typing import Callable, Iterable, TypeVar
+
+from InPlaceMergeSort import InPlaceMergeSort
+
+T = TypeVar('T')
+
+# Диапазоны не длиннее этого досортировываются вставками
+_SMALL_RANGE = 16
+
+
+def nth_element(arr: list[T], k: int, key: Callable[[T], object] = None, reverse: bool = False) -> None:
+    """
+    Переставляет arr так, что arr[k] - элемент, стоящий на позиции k в отсортированном массиве,
+    слева от него нет больших элементов, справа - меньших (при reverse наоборот)
+    Интроселект: быстрый выбор с 3-путевым разбиением, при вырождении - медиана медиан, O(n)
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("nth_element index out of range")
+    # k-й наибольший - это (n - 1 - k)-й наименьший в развёрнутом порядке
+    target = n - 1 - k if reverse else k
+    if key is None:
+        _select(arr, None, 0, n - 1, target)
+    else:
+        keys = [key(item) for item in arr]
+        items = arr[:]
+        _select(keys, items, 0, n - 1, target)
+        arr[:] = items
+    if reverse:
+        arr.reverse()
+
+
+def partial_sort(arr: list[T], k: int, key: Callable[[T], object] = None, reverse: bool = False) -> None:
+    """
+    Первые k позиций arr занимают k наименьших (при reverse - наибольших) элементов по порядку,
+    остальные элементы идут после них в произвольном порядке; O(n + k log k)
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    nth_element(arr, k - 1, key=key, reverse=reverse)
+    InPlaceMergeSort().sort(arr, 0, k - 1, key=key, reverse=reverse)
+
+
+def top_k(iterable: Iterable[T], k: int, key: Callable[[T], object] = None, reverse: bool = False) -> list[T]:
+    """
+    k наименьших (при reverse - наибольших) элементов потока по порядку
+    Держит в памяти только кучу из k элементов: O(n log k); равные элементы сохраняют исходный порядок
+    """
+    if k <= 0:
+        return []
+    if reverse:
+        return heapq.nlargest(k, iterable, key=key)
+    return heapq.nsmallest(k, iterable, key=key)
+
+
+def _swap(keys: list, items: list | None, i: int, j: int) -> None:
+    keys[i], keys[j] = keys[j], keys[i]
+    if items is not None:
+        items[i], items[j] = items[j], items[i]
+
+
+def _insertion_sort(keys: list, items: list | None, lo: int, hi: int) -> None:
+    for i in range(lo + 1, hi + 1):
+        j = i
+        while j > lo and keys[j] < keys[j - 1]:
+            _swap(keys, items, j, j - 1)
+            j -= 1
+
+
+def _median_of_three(keys: list, a: int, b: int, c: int) -> int:
+    if keys[b] < keys[a]:
+        a, b = b, a
+    if keys[c] < keys[b]:
+        b = c
+        if keys[b] < keys[a]:
+            b = a
+    return b
+
+
+def _median_of_medians(keys: list, items: list | None, lo: int, hi: int) -> int:
+    """Индекс медианы медиан пятёрок - опорный элемент с гарантией линейного времени"""
+    groups = 0
+    for group_lo in range(lo, hi + 1, 5):
+        group_hi = min(group_lo + 4, hi)
+        _insertion_sort(keys, items, group_lo, group_hi)
+        # Медианы пятёрок собираются в начале диапазона
+        _swap(keys, items, lo + groups, (group_lo + group_hi) // 2)
+        groups += 1
+    middle = lo + (groups - 1) // 2
+    _select(keys, items, lo, lo + groups - 1, middle)
+    return middle
+
+
+def _partition(keys: list, items: list | None, lo: int, hi: int, pivot_index: int) -> tuple[int, int]:
+    """
+    Трёхпутевое разбиение по значению опорного элемента, только через <
+    Возвращает (lt, gt): [lo, lt) меньше опорного, [lt, gt] равны ему, (gt, hi] больше
+    """
+    pivot = keys[pivot_index]
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        if keys[i] < pivot:
+            _swap(keys, items, lt, i)
+            lt += 1
+            i += 1
+        elif pivot < keys[i]:
+            _swap(keys, items, i, gt)
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _select(keys: list, items: list | None, lo: int, hi: int, k: int) -> None:
+    depth_limit = 2 * (hi - lo + 1).bit_length()
+    while hi > lo:
+        if hi - lo < _SMALL_RANGE:
+            _insertion_sort(keys, items, lo, hi)
+            return
+        if depth_limit > 0:
+            depth_limit -= 1
+            pivot_index = _median_of_three(keys, lo, (lo + hi) // 2, hi)
+        else:
+            # Слишком много неудачных разбиений - переходим на гарантированный опорный элемент
+            pivot_index = _median_of_medians(keys, items, lo, hi)
+        lt, gt = _partition(keys, items, lo, hi, pivot_index)
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return
\ No newline at end of file
@@ -18,4 +18,48 @@ class Book:
         return NotImplemented
     
     def __repr__(self):
-        return f"Book('{self.title}', {self.year})"
\ No newline at end of file
+        return f"Book('{self.title}', {self.year})"
+
+class CompactBook:
+    """
+    Компактная книга: __slots__ вместо __dict__ и прямые сравнения по году издания
+    без перенаправлений total_ordering
+    """
+    __slots__ = ("title", "year")
+    
+    def __init__(self, title: str, year: int):
+        self.title = title
+        self.year = year
+    
+    @classmethod
+    def from_columns(cls, titles, years) -> list['CompactBook']:
+        """Пакетное создание из столбцов названий и годов издания одинаковой длины"""
+        return [cls(title, year) for title, year in zip(titles, years, strict=True)]
+    
+    def __lt__(self, other):
+        if isinstance(other, CompactBook):
+            return self.year < other.year
+        return NotImplemented
+    
+    def __le__(self, other):
+        if isinstance(other, CompactBook):
+            return self.year <= other.year
+        return NotImplemented
+    
+    def __gt__(self, other):
+        if isinstance(other, CompactBook):
+            return self.year > other.year
+        return NotImplemented
+    
+    def __ge__(self, other):
+        if isinstance(other, CompactBook):
+            return self.year >= other.year
+        return NotImplemented
+    
+    def __eq__(self, other):
+        if isinstance(other, CompactBook):
+            return self.year == other.year
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"CompactBook('{self.title}', {self.year})"
\ No newline at end of file
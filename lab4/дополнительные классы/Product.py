@@ -18,4 +18,48 @@ class Product:
         return NotImplemented
     
     def __repr__(self):
-        return f"Product('{self.name}', ${self.price})"
\ No newline at end of file
+        return f"Product('{self.name}', ${self.price})"
+
+class CompactProduct:
+    """
+    Компактный продукт: __slots__ вместо __dict__ и прямые сравнения по цене
+    без перенаправлений total_ordering
+    """
+    __slots__ = ("name", "price")
+    
+    def __init__(self, name: str, price: float):
+        self.name = name
+        self.price = price
+    
+    @classmethod
+    def from_columns(cls, names, prices) -> list['CompactProduct']:
+        """Пакетное создание из столбцов названий и цен одинаковой длины"""
+        return [cls(name, price) for name, price in zip(names, prices, strict=True)]
+    
+    def __lt__(self, other):
+        if isinstance(other, CompactProduct):
+            return self.price < other.price
+        return NotImplemented
+    
+    def __le__(self, other):
+        if isinstance(other, CompactProduct):
+            return self.price <= other.price
+        return NotImplemented
+    
+    def __gt__(self, other):
+        if isinstance(other, CompactProduct):
+            return self.price > other.price
+        return NotImplemented
+    
+    def __ge__(self, other):
+        if isinstance(other, CompactProduct):
+            return self.price >= other.price
+        return NotImplemented
+    
+    def __eq__(self, other):
+        if isinstance(other, CompactProduct):
+            return self.price == other.price
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"CompactProduct('{self.name}', ${self.price})"
\ No newline at end of file
@@ -18,4 +18,48 @@ class Student:
         return NotImplemented
     
     def __repr__(self):
-        return f"Student('{self.name}', GPA: {self.gpa})"
\ No newline at end of file
+        return f"Student('{self.name}', GPA: {self.gpa})"
+
+class CompactStudent:
+    """
+    Компактный студент: __slots__ вместо __dict__ и прямые сравнения по среднему баллу
+    без перенаправлений total_ordering
+    """
+    __slots__ = ("name", "gpa")
+    
+    def __init__(self, name: str, gpa: float):
+        self.name = name
+        self.gpa = gpa
+    
+    @classmethod
+    def from_columns(cls, names, gpas) -> list['CompactStudent']:
+        """Пакетное создание из столбцов имён и средних баллов одинаковой длины"""
+        return [cls(name, gpa) for name, gpa in zip(names, gpas, strict=True)]
+    
+    def __lt__(self, other):
+        if isinstance(other, CompactStudent):
+            return self.gpa < other.gpa
+        return NotImplemented
+    
+    def __le__(self, other):
+        if isinstance(other, CompactStudent):
+            return self.gpa <= other.gpa
+        return NotImplemented
+    
+    def __gt__(self, other):
+        if isinstance(other, CompactStudent):
+            return self.gpa > other.gpa
+        return NotImplemented
+    
+    def __ge__(self, other):
+        if isinstance(other, CompactStudent):
+            return self.gpa >= other.gpa
+        return NotImplemented
+    
+    def __eq__(self, other):
+        if isinstance(other, CompactStudent):
+            return self.gpa == other.gpa
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"CompactStudent('{self.name}', GPA: {self.gpa})"
\ No newline at end of file
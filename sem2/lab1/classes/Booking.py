@@ -1,3 +1,4 @@
+from itertools import islice
 from BookingStatus import BookingStatus
 from Guest import Guest
 from Room import Room
@@ -14,20 +15,69 @@ class Booking:
         self.guest = guest
         self.room = room
         self.period = period
-        self.status = BookingStatus.CONFIRMED
+        # Вызывается при смене статуса (хранилище поддерживает по нему индексы)
+        self._status_listener = None
+        # Вызывается при прочих изменениях брони (заказ услуги)
+        self._change_listener = None
+        self._status = BookingStatus.CONFIRMED
         self.service_orders: list[ServiceOrder] = []
         self.total_paid = 0.0
+        # Стоимость проживания и (начало, конец, цена за сутки), для которых она посчитана
+        self._room_cost = 0.0
+        self._room_cost_key = None
+    
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @status.setter
+    def status(self, value: str):
+        old_status = self._status
+        self._status = value
+        if self._status_listener is not None and old_status != value:
+            self._status_listener(self, old_status)
+    
+    @property
+    def service_orders(self) -> list[ServiceOrder]:
+        return self._service_orders
+    
+    @service_orders.setter
+    def service_orders(self, orders: list[ServiceOrder]):
+        self._service_orders = orders
+        # Сумма цен первых _services_counted заказов; добавленные в список напрямую досчитываются при обращении
+        self._services_total = 0.0
+        self._services_counted = 0
+    
+    @property
+    def room_cost(self) -> float:
+        key = (self.period.start, self.period.end, self.room.price_per_day)
+        if key != self._room_cost_key:
+            self._room_cost = self.room.price_per_day * self.period.duration_days
+            self._room_cost_key = key
+        return self._room_cost
+    
+    @property
+    def services_cost(self) -> float:
+        orders = self._service_orders
+        if len(orders) < self._services_counted:
+            # Заказы удалены из списка напрямую - сумма считается заново
+            self._services_total = 0.0
+            self._services_counted = 0
+        if len(orders) > self._services_counted:
+            self._services_total += sum(order.price for order in islice(orders, self._services_counted, None))
+            self._services_counted = len(orders)
+        return self._services_total
     
     @property
     def total_amount(self) -> float:
-        room_cost = self.room.price_per_day * self.period.duration_days
-        services_cost = sum(order.price for order in self.service_orders)
-        return room_cost + services_cost
+        return self.room_cost + self.services_cost
     
     def check_in(self):
         if self.status != BookingStatus.CONFIRMED:
             # Используем наше кастомное исключение
             raise BookingInvalidStatusError("Невозможно выполнить регистрацию: бронирование не в статусе 'Подтверждено'")
+        if self.room.current_booking_id != self.id:
+            self.room.prepare_for(self.id)
         self.room.occupy()
         self.status = BookingStatus.CHECKED_IN
     
@@ -36,13 +86,19 @@ class Booking:
             # Используем наше кастомное исключение
             raise BookingInvalidStatusError("Услуги можно заказывать только после заселения (статус CHECKED_IN)")
         self.service_orders.append(order)
+        if self._services_counted == len(self.service_orders) - 1:
+            self._services_total += order.price
+            self._services_counted += 1
+        if self._change_listener is not None:
+            self._change_listener(self)
     
     def check_out(self, payment_amount: float):
         if self.status != BookingStatus.CHECKED_IN:
             raise BookingInvalidStatusError("Невозможно выселить: гость не заселен")
-        if payment_amount < self.total_amount:
+        total_amount = self.total_amount
+        if payment_amount < total_amount:
             # Используем наше кастомное исключение
-            raise PaymentError(f"Недостаточная оплата. Требуется: {self.total_amount:.2f} BYN, внесено: {payment_amount:.2f} BYN")
+            raise PaymentError(f"Недостаточная оплата. Требуется: {total_amount:.2f} BYN, внесено: {payment_amount:.2f} BYN")
         
         self.room.release()
         self.status = BookingStatus.CHECKED_OUT
@@ -73,9 +129,9 @@ class Booking:
         return booking
     
     def __str__(self):
-        room_cost = self.room.price_per_day * self.period.duration_days
-        services_cost = sum(o.price for o in self.service_orders)
+        room_cost = self.room_cost
+        services_cost = self.services_cost
         return (f"Бронь #{self.id} | {self.guest.name} | Номер {self.room.number} | "
                 f"{self.period.start.strftime('%d.%m')} - {self.period.end.strftime('%d.%m')} | "
                 f"Статус: {BookingStatus.display(self.status)}\n"
-                f"  Стоимость: номер {room_cost:.2f} + услуги {services_cost:.2f} = {self.total_amount:.2f} BYN")
\ No newline at end of file
+                f"  Стоимость: номер {room_cost:.2f} + услуги {services_cost:.2f} = {room_cost + services_cost:.2f} BYN")
\ No newline at end of file
@@ -0,0 +1,150 @@
+import json
+import os
+from pathlib import Path
+
+class BookingHistory:
+    """
+    Завершённые брони рядом со снимком в формате JSON Lines (снимок.history), по брони в строке
+    Файл только дописывается: изменённая бронь добавляется новой строкой, действует последняя
+    При старте файл не читается: индекс id -> смещение строки и индексы по полям
+    строятся при первом обращении, бронь разбирается только когда её запрашивают
+    """
+    # Поля брони, по которым ищутся идентификаторы
+    FIELDS = ("guest_id", "room_number", "status", "check_in")
+    
+    def __init__(self, snapshot_path: Path):
+        snapshot_path = Path(snapshot_path)
+        self.path = snapshot_path.with_name(snapshot_path.name + ".history")
+        self._offsets: dict[str, int] | None = None
+        self._by_field: dict[str, dict[str, list[str]]] = {}
+    
+    @staticmethod
+    def key(record: dict, field: str) -> str:
+        """Значение поля брони для поиска; дата заезда - первые 10 символов ISO-строки начала периода"""
+        if field == "check_in":
+            return record["period"]["start"][:10]
+        return record[field]
+    
+    def _index(self) -> dict[str, int]:
+        if self._offsets is None:
+            self._offsets = {}
+            self._by_field = {field: {} for field in self.FIELDS}
+            if self.path.exists():
+                self._build_index()
+        return self._offsets
+    
+    def _build_index(self):
+        # Последняя строка брони заменяет предыдущие
+        latest: dict[str, tuple[int, dict]] = {}
+        offset = 0
+        with open(self.path, "rb") as history:
+            for line in history:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Строка истории без конца строки")
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                latest[record["booking_id"]] = (offset, record)
+                offset += len(line)
+            torn = history.seek(0, os.SEEK_END) > offset
+        if torn:
+            # Недописанный при сбое хвост обрезается, иначе к нему приклеится следующая запись
+            os.truncate(self.path, offset)
+        for offset, record in latest.values():
+            self._add(record, offset)
+    
+    def _add(self, record: dict, offset: int):
+        self._offsets[record["booking_id"]] = offset
+        for field in self.FIELDS:
+            self._by_field[field].setdefault(self.key(record, field), []).append(record["booking_id"])
+    
+    def _remove(self, record: dict):
+        for field in self.FIELDS:
+            self._by_field[field][self.key(record, field)].remove(record["booking_id"])
+    
+    def has_version(self, record: dict) -> bool:
+        """
+        Записана ли в истории именно эта версия брони
+        Без построенного индекса из истории ничего не загружалось, поэтому ответ - нет
+        """
+        if self._offsets is None:
+            return False
+        return self.read(record["booking_id"]) == record
+    
+    def read(self, booking_id: str) -> dict | None:
+        offset = self._index().get(booking_id)
+        if offset is None:
+            return None
+        with open(self.path, "rb") as history:
+            history.seek(offset)
+            return json.loads(history.readline())
+    
+    def records(self):
+        """Действующие брони истории по порядку, файл читается построчно"""
+        offsets = self._index()
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as history:
+            offset = 0
+            for line in history:
+                record = json.loads(line)
+                if offsets.get(record["booking_id"]) == offset:
+                    yield record
+                offset += len(line)
+    
+    def ids(self, field: str, key: str) -> list[str]:
+        self._index()
+        return list(self._by_field[field].get(key, []))
+    
+    def append(self, records: list[dict]):
+        """Дописывает брони в конец файла; каталог сбрасывается вместе со снимком"""
+        if not records:
+            return
+        self._trim_torn_tail()
+        with open(self.path, "ab") as history:
+            offset = history.tell()
+            lines = [(json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8") for record in records]
+            history.writelines(lines)
+            history.flush()
+            os.fsync(history.fileno())
+        if self._offsets is None:
+            # Индекс ещё не строился, он прочтёт и новые строки
+            return
+        for record, line in zip(records, lines):
+            old = self.read(record["booking_id"])
+            if old is not None:
+                self._remove(old)
+            self._add(record, offset)
+            offset += len(line)
+    
+    def _trim_torn_tail(self, block: int = 4096):
+        """Обрезает недописанную последнюю строку, читая с конца только её"""
+        if not self.path.exists():
+            return
+        with open(self.path, "rb+") as history:
+            end = history.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - block)
+                history.seek(start)
+                chunk = history.read(position - start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                history.truncate(position)
+    
+    def set_aside(self):
+        """Переименовывает файл истории в .bak, заменяя прежний"""
+        if self.path.exists():
+            self.path.replace(self.path.with_name(self.path.name + ".bak"))
+        self._offsets = None
+        self._by_field = {}
+    
+    def discard(self):
+        self.path.unlink(missing_ok=True)
+        self._offsets = None
+        self._by_field = {}
\ No newline at end of file
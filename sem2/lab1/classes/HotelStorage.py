@@ -4,22 +4,49 @@ from Booking import Booking
 from Employee import Employee
 from RoomStatus import RoomStatus
 from BookingStatus import BookingStatus
-from datetime import datetime
-import json
+from datetime import date, datetime, timedelta
 from Period import Period
 from ServiceOrder import ServiceOrder
 from ServiceType import ServiceType
+from IntervalTree import IntervalTree
+from RoomIndex import RoomIndex
+from StorageBackend import StorageBackend
+from JsonBackend import JsonBackend
+from exceptions import StorageCorruptedError
 from pathlib import Path
 
 class HotelStorage:
-    """Хранилище всех данных отеля"""
+    """
+    Хранилище всех данных отеля
+    Номера, гости, персонал и активные брони держатся в памяти; остальные брони
+    бэкенд может отдавать по запросу, тогда bookings содержит только загруженные
+    """
     
-    def __init__(self, filepath: str = "hotel_data.json"):
+    def __init__(self, filepath: str = "hotel_data.json", compact_every: int = 1000,
+                 backend: StorageBackend | None = None):
+        """
+        По умолчанию данные хранятся снимком filepath и журналом изменений filepath.journal
+        (JsonBackend, сжатие после compact_every записей журнала); backend задаёт другое хранилище
+        """
         self._filepath = Path(filepath)
+        self._backend = backend if backend is not None else JsonBackend(self._filepath, compact_every)
+        # Изменённые с последнего сохранения сущности: (тип записи, идентификатор)
+        self._dirty: dict[tuple[str, str], None] = {}
+        self._saved_counters: dict | None = None
         self.rooms: dict[str, Room] = {}
         self.guests: dict[str, Guest] = {}
         self.bookings: dict[str, Booking] = {}
         self.employees: dict[str, Employee] = {}
+        # Индексы для поиска свободных номеров
+        self._room_index = RoomIndex()
+        self._room_periods: dict[str, IntervalTree] = {}
+        # Периоды активных броней всех номеров: занятые на даты номера находятся одним запросом
+        self._active_periods = IntervalTree()
+        # Вторичные индексы бронирований: ключ -> {id брони: бронь}
+        self._bookings_by_guest: dict[str, dict[str, Booking]] = {}
+        self._bookings_by_status: dict[str, dict[str, Booking]] = {}
+        self._bookings_by_room: dict[str, dict[str, Booking]] = {}
+        self._bookings_by_check_in: dict[date, dict[str, Booking]] = {}
         self._next_guest_id = 1
         self._next_booking_id = 1
         self._next_order_id = 1
@@ -28,25 +55,25 @@ class HotelStorage:
         self._load_or_initialize()
     
     def _load_or_initialize(self):
-        if self._filepath.exists():
-            try:
-                self._load_from_file()
-                print(f"Данные загружены из {self._filepath}")
-                return
-            except Exception as e:
-                print(f"Ошибка загрузки: {e}. Создаём новую базу...")
-                self._filepath.unlink(missing_ok=True)
+        try:
+            data = self._backend.load()
+        except StorageCorruptedError as e:
+            # Остальные ошибки загрузки пробрасываются: данные могут быть целы
+            print(f"Ошибка загрузки: {e}. Создаём новую базу...")
+            self._backend.reset()
+            data = None
+        if data is not None:
+            self._load_data(data)
+            print(f"Данные загружены из {self._backend.location}")
+            return
         
         self._initialize_demo_data()
         self.save_to_file()
-        print(f"Создан новый файл {self._filepath} с демо-данными")
+        print(f"Создано новое хранилище {self._backend.location} с демо-данными")
     
-    def _load_from_file(self):
-        data = json.loads(self._filepath.read_text(encoding="utf-8"))
-        
+    def _load_data(self, data: dict):
         for room_data in data.get("rooms", []):
-            room = Room.from_dict(room_data)
-            self.rooms[room.number] = room
+            self.add_room(Room.from_dict(room_data))
         
         self._next_guest_id = data.get("next_guest_id", 1)
         for guest_data in data.get("guests", []):
@@ -59,20 +86,18 @@ class HotelStorage:
             guest = self.guests.get(booking_data["guest_id"])
             room = self.rooms.get(booking_data["room_number"])
             if guest and room:
-                booking = Booking.from_dict(booking_data, guest, room)
-                self.bookings[booking.id] = booking
-                if booking.status == BookingStatus.CHECKED_IN:
-                    room.status = RoomStatus.OCCUPIED
-                    room.current_booking_id = booking.id
-                elif booking.status == BookingStatus.CONFIRMED:
-                    room.status = RoomStatus.BOOKED
-                    room.current_booking_id = booking.id
+                self._add_booking(Booking.from_dict(booking_data, guest, room))
+        for number, periods in self._room_periods.items():
+            if len(periods):
+                self._assign_current_booking(self.rooms[number])
         
         self._next_employee_id = data.get("next_employee_id", 1)
         for employee_data in data.get("employees", []):
             employee = Employee.from_dict(employee_data)
             self.employees[employee.id] = employee
         
+        self._dirty.clear()
+        self._saved_counters = self._counters()
         print(f"Загружено: {len(self.rooms)} номеров, {len(self.guests)} гостей, {len(self.bookings)} бронирований")
     
     def _initialize_demo_data(self):
@@ -85,7 +110,7 @@ class HotelStorage:
             ("202", 2, 200.0, "улучшенный"),
         ]
         for number, berths, price, r_type in rooms_data:
-            self.rooms[number] = Room(number, berths, price, r_type)
+            self.add_room(Room(number, berths, price, r_type))
         
         # Гости
         self.guests["G0001"] = Guest("G0001", "Анна Сидорова", "+375291112233")
@@ -98,7 +123,7 @@ class HotelStorage:
             datetime(2026, 2, 18, 12, 0)
         )
         booking = Booking("B0001", self.guests["G0001"], self.rooms["101"], period)
-        self.bookings["B0001"] = booking
+        self._add_booking(booking)
         self.rooms["101"].assign_booking("B0001")
         booking.check_in()
         
@@ -112,27 +137,70 @@ class HotelStorage:
         self.employees["E0001"] = Employee("E0001", "Иван Петров", "Администратор")
         self.employees["E0002"] = Employee("E0002", "Мария Соколова", "Портье")
         self._next_employee_id = 3
+        
+        # Гости и персонал добавлены в обход методов хранилища
+        for guest_id in self.guests:
+            self._mark_dirty("guest", guest_id)
+        for employee_id in self.employees:
+            self._mark_dirty("employee", employee_id)
+    
+    def _counters(self) -> dict:
+        return {
+            "next_guest_id": self._next_guest_id,
+            "next_booking_id": self._next_booking_id,
+            "next_order_id": self._next_order_id,
+            "next_employee_id": self._next_employee_id
+        }
+    
+    def _snapshot_data(self) -> dict:
+        return {
+            "rooms": [room.to_dict() for room in self.rooms.values()],
+            "guests": [guest.to_dict() for guest in self.guests.values()],
+            "bookings": [booking.to_dict() for booking in self.bookings.values()],
+            "employees": [employee.to_dict() for employee in self.employees.values()],
+            **self._counters()
+        }
+    
+    def _mark_dirty(self, kind: str, key: str):
+        self._dirty[(kind, key)] = None
+    
+    def _change_record(self, kind: str, key: str) -> dict:
+        entities = {"room": self.rooms, "guest": self.guests, "booking": self.bookings, "employee": self.employees}
+        return {"type": kind, "data": entities[kind][key].to_dict()}
     
     def save_to_file(self):
+        """Передаёт бэкенду только изменённые с прошлого сохранения сущности"""
         try:
-            data = {
-                "rooms": [room.to_dict() for room in self.rooms.values()],
-                "guests": [guest.to_dict() for guest in self.guests.values()],
-                "bookings": [booking.to_dict() for booking in self.bookings.values()],
-                "employees": [employee.to_dict() for employee in self.employees.values()],
-                "next_guest_id": self._next_guest_id,
-                "next_booking_id": self._next_booking_id,
-                "next_order_id": self._next_order_id,
-                "next_employee_id": self._next_employee_id
-            }
-            self._filepath.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-            print(f"Данные сохранены в {self._filepath}")
+            records = [self._change_record(kind, key) for kind, key in self._dirty]
+            counters = self._counters()
+            if counters != self._saved_counters:
+                records.append({"type": "counters", "data": counters})
+            self._backend.save(records, self._snapshot_data)
+            self._dirty.clear()
+            self._saved_counters = counters
+            print(f"Данные сохранены в {self._backend.location}")
         except Exception as e:
             print(f"Ошибка сохранения: {e}")
     
+    def compact(self):
+        """Сжимает хранилище (для JSON - полный снимок вместо журнала)"""
+        self.save_to_file()
+        self._backend.compact(self._snapshot_data)
+    
+    def close(self):
+        self._backend.close()
+    
     # Методы для работы с номерами
     def add_room(self, room: Room):
         self.rooms[room.number] = room
+        room._status_listener = self._on_room_status_changed
+        self._room_index.update(room)
+        self._room_periods.setdefault(room.number, IntervalTree())
+        self._mark_dirty("room", room.number)
+    
+    def _on_room_status_changed(self, room: Room, old_status: str):
+        self._room_index.update(room)
+        self._mark_dirty("room", room.number)
     
     def get_room(self, number: str) -> Room | None:
         return self.rooms.get(number)
@@ -140,8 +208,31 @@ class HotelStorage:
     def get_all_rooms(self) -> list[Room]:
         return list(self.rooms.values())
     
-    def find_available_rooms(self, min_berths: int = 1) -> list[Room]:
-        return [r for r in self.rooms.values() if r.status == RoomStatus.AVAILABLE and r.berths >= min_berths]
+    def find_available_rooms(self, min_berths: int = 1, start: datetime | None = None,
+                             end: datetime | None = None, room_type: str | None = None) -> list[Room]:
+        """
+        Без дат - номера, свободные сейчас (статус AVAILABLE), за O(log R + k)
+        С датами - номера не на ремонте без активных броней, пересекающихся с [start, end):
+        занятые номера дают b пересекающихся броней общего дерева за O(log n + b),
+        подходящие по местам и типу номера перебираются из индекса, итого O(log n + b + k)
+        """
+        if start is None and end is None:
+            numbers = self._room_index.find(RoomStatus.AVAILABLE, min_berths, room_type)
+            return [self.rooms[number] for number in numbers]
+        if start is None or end is None or not start < end:
+            raise ValueError("Для поиска по датам нужны начало и конец периода, начало раньше конца")
+        
+        busy = {booking.room.number for booking in self._active_periods.overlapping(start, end)}
+        rooms = []
+        for status in (RoomStatus.AVAILABLE, RoomStatus.BOOKED, RoomStatus.OCCUPIED):
+            for number in self._room_index.find(status, min_berths, room_type):
+                if number not in busy:
+                    rooms.append(self.rooms[number])
+        return rooms
+    
+    def is_room_free(self, room_number: str, start: datetime, end: datetime) -> bool:
+        """Нет ли у номера активных броней, пересекающихся с [start, end)"""
+        return not self._room_periods[room_number].overlaps(start, end)
     
     # Методы для работы с гостями
     def register_guest(self, name: str, contact: str) -> Guest:
@@ -149,6 +240,7 @@ class HotelStorage:
         self._next_guest_id += 1
         guest = Guest(guest_id, name, contact)
         self.guests[guest_id] = guest
+        self._mark_dirty("guest", guest_id)
         return guest
     
     def get_guest(self, guest_id: str) -> Guest | None:
@@ -159,18 +251,147 @@ class HotelStorage:
         booking_id = f"B{self._next_booking_id:04d}"
         self._next_booking_id += 1
         booking = Booking(booking_id, guest, room, period)
-        self.bookings[booking_id] = booking
+        self._add_booking(booking)
         return booking
     
+    def _add_booking(self, booking: Booking):
+        self.bookings[booking.id] = booking
+        booking._status_listener = self._on_booking_status_changed
+        booking._change_listener = self._on_booking_changed
+        self._mark_dirty("booking", booking.id)
+        self._bookings_by_guest.setdefault(booking.guest.id, {})[booking.id] = booking
+        self._bookings_by_status.setdefault(booking.status, {})[booking.id] = booking
+        self._bookings_by_room.setdefault(booking.room.number, {})[booking.id] = booking
+        self._bookings_by_check_in.setdefault(booking.period.start.date(), {})[booking.id] = booking
+        if self._is_active(booking.status):
+            self._room_periods[booking.room.number].add(*self._booked_interval(booking), booking)
+            self._active_periods.add(*self._booked_interval(booking), booking)
+    
+    @staticmethod
+    def _booked_interval(booking: Booking) -> tuple[datetime, datetime]:
+        # Период без длительности оплачивается как одни сутки, столько же он и занимает номер
+        start, end = booking.period.start, booking.period.end
+        return start, end if start < end else start + timedelta(days=1)
+    
+    @staticmethod
+    def _precedes(booking: Booking, other: Booking | None) -> bool:
+        """Должна ли бронь стать текущей для номера вместо other"""
+        if other is None:
+            return True
+        if (booking.status == BookingStatus.CHECKED_IN) != (other.status == BookingStatus.CHECKED_IN):
+            return booking.status == BookingStatus.CHECKED_IN
+        return booking.period.start < other.period.start
+    
+    def _assign_current_booking(self, room: Room):
+        """
+        Текущей бронью номера становится заселённая, иначе подтверждённая с самым ранним заездом;
+        без активных броней номер освобождается
+        """
+        current = None
+        for _, _, booking in self._room_periods[room.number]:
+            if self._precedes(booking, current):
+                current = booking
+        if current is None:
+            room.release()
+            return
+        room.status = RoomStatus.OCCUPIED if current.status == BookingStatus.CHECKED_IN else RoomStatus.BOOKED
+        room.current_booking_id = current.id
+    
+    @staticmethod
+    def _is_active(status: str) -> bool:
+        return status in (BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN)
+    
+    def _on_booking_changed(self, booking: Booking):
+        self._mark_dirty("booking", booking.id)
+    
+    def _on_booking_status_changed(self, booking: Booking, old_status: str):
+        self._mark_dirty("booking", booking.id)
+        del self._bookings_by_status[old_status][booking.id]
+        self._bookings_by_status.setdefault(booking.status, {})[booking.id] = booking
+        # Выселенные и отменённые брони больше не занимают номер на свои даты
+        trees = (self._room_periods[booking.room.number], self._active_periods)
+        if self._is_active(old_status) and not self._is_active(booking.status):
+            for periods in trees:
+                periods.remove(*self._booked_interval(booking), booking)
+            # Номер, освобождённый этой бронью, переходит к следующей активной, как и при загрузке
+            room = booking.room
+            if room.status != RoomStatus.MAINTENANCE and room.current_booking_id in (None, booking.id):
+                self._assign_current_booking(room)
+        elif not self._is_active(old_status) and self._is_active(booking.status):
+            for periods in trees:
+                periods.add(*self._booked_interval(booking), booking)
+    
     def get_booking(self, booking_id: str) -> Booking | None:
-        return self.bookings.get(booking_id)
+        booking = self.bookings.get(booking_id)
+        if booking is None:
+            booking = self._load_booking(booking_id)
+        return booking
+    
+    def _load_booking(self, booking_id: str) -> Booking | None:
+        """Загружает из бэкенда бронь, не загруженную при старте"""
+        data = self._backend.load_booking(booking_id)
+        if data is None:
+            return None
+        guest = self.guests.get(data["guest_id"])
+        room = self.rooms.get(data["room_number"])
+        if not (guest and room):
+            return None
+        booking = Booking.from_dict(data, guest, room)
+        self._add_booking(booking)
+        # Загруженная бронь совпадает с сохранённой
+        del self._dirty[("booking", booking.id)]
+        return booking
+    
+    def _find_bookings(self, index: dict, field: str, value) -> list[Booking]:
+        """Брони из индекса загруженных и не загруженные из бэкенда, без повторов"""
+        ids = dict.fromkeys(self._backend.booking_ids(field, value))
+        ids.update(dict.fromkeys(index.get(value, {})))
+        bookings = (self.get_booking(booking_id) for booking_id in ids)
+        return [booking for booking in bookings if booking is not None]
     
     def get_active_bookings(self) -> list[Booking]:
-        return [b for b in self.bookings.values() 
-                if b.status in (BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN)]
+        # Активные брони загружаются всегда, бэкенд спрашивать не нужно
+        return (list(self._bookings_by_status.get(BookingStatus.CONFIRMED, {}).values())
+                + list(self._bookings_by_status.get(BookingStatus.CHECKED_IN, {}).values()))
     
     def get_bookings_by_guest(self, guest_id: str) -> list[Booking]:
-        return [b for b in self.bookings.values() if b.guest.id == guest_id]
+        return self._find_bookings(self._bookings_by_guest, "guest_id", guest_id)
+    
+    def get_bookings_by_status(self, status: str) -> list[Booking]:
+        # Сохранённый в бэкенде статус мог устареть, верен статус загруженной брони
+        bookings = self._find_bookings(self._bookings_by_status, "status", status)
+        return [booking for booking in bookings if booking.status == status]
+    
+    def get_bookings_by_room(self, room_number: str) -> list[Booking]:
+        return self._find_bookings(self._bookings_by_room, "room_number", room_number)
+    
+    def get_bookings_by_check_in_date(self, day: date) -> list[Booking]:
+        return self._find_bookings(self._bookings_by_check_in, "check_in", day)
+    
+    def get_revenue(self) -> dict:
+        """
+        Выручка по всем броням, кроме отменённых: проживание, услуги, итог и оплачено
+        Загруженные брони дают закэшированные суммы, остальные считаются по сводкам бэкенда без создания броней
+        """
+        revenue = {"bookings": 0, "room": 0.0, "services": 0.0, "total": 0.0, "paid": 0.0}
+        
+        def add(room_cost: float, services_cost: float, paid: float):
+            revenue["bookings"] += 1
+            revenue["room"] += room_cost
+            revenue["services"] += services_cost
+            revenue["total"] += room_cost + services_cost
+            revenue["paid"] += paid
+        
+        for booking in self.bookings.values():
+            if booking.status != BookingStatus.CANCELLED:
+                add(booking.room_cost, booking.services_cost, booking.total_paid)
+        for summary in self._backend.booking_summaries():
+            room = self.rooms.get(summary["room_number"])
+            if summary["booking_id"] in self.bookings or summary["status"] == BookingStatus.CANCELLED or room is None:
+                continue
+            room_cost = room.price_per_day * Period.from_dict(summary["period"]).duration_days
+            add(room_cost, summary["services_cost"], summary["total_paid"])
+        return revenue
     
     # Методы для работы с услугами
     def create_service_order(self, guest_id: str, service_type: str, description: str, price: float) -> ServiceOrder:
@@ -184,6 +405,7 @@ class HotelStorage:
         self._next_employee_id += 1
         employee = Employee(employee_id, name, role)
         self.employees[employee_id] = employee
+        self._mark_dirty("employee", employee_id)
         return employee
     
     def get_employee(self, employee_id: str) -> Employee | None:
@@ -0,0 +1,163 @@
+class _Node:
+    __slots__ = ("key", "start", "end", "value", "max_end", "height", "left", "right")
+    
+    def __init__(self, start, end, value):
+        # id(value) различает одинаковые интервалы разных объектов
+        self.key = (start, end, id(value))
+        self.start = start
+        self.end = end
+        self.value = value
+        self.max_end = end
+        self.height = 1
+        self.left: '_Node | None' = None
+        self.right: '_Node | None' = None
+
+
+def _height(node: _Node | None) -> int:
+    return node.height if node else 0
+
+
+def _update(node: _Node) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.max_end = node.end
+    if node.left and node.left.max_end > node.max_end:
+        node.max_end = node.left.max_end
+    if node.right and node.right.max_end > node.max_end:
+        node.max_end = node.right.max_end
+
+
+def _rotate_right(node: _Node) -> _Node:
+    top = node.left
+    node.left = top.right
+    top.right = node
+    _update(node)
+    _update(top)
+    return top
+
+
+def _rotate_left(node: _Node) -> _Node:
+    top = node.right
+    node.right = top.left
+    top.left = node
+    _update(node)
+    _update(top)
+    return top
+
+
+def _balance(node: _Node) -> _Node:
+    _update(node)
+    diff = _height(node.left) - _height(node.right)
+    if diff > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if diff < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class IntervalTree:
+    """
+    Дерево полуоткрытых интервалов [start, end) на AVL-дереве
+    Каждый узел хранит наибольший конец интервала в своём поддереве, поэтому
+    проверка пересечения занимает O(log n), а поиск всех k пересечений - O(log n + k)
+    """
+    
+    def __init__(self):
+        self._root: _Node | None = None
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add(self, start, end, value) -> None:
+        if not start < end:
+            raise ValueError("Начало интервала должно быть раньше конца")
+        self._root = self._insert(self._root, _Node(start, end, value))
+        self._size += 1
+    
+    def _insert(self, node: _Node | None, new: _Node) -> _Node:
+        if node is None:
+            return new
+        if new.key < node.key:
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        return _balance(node)
+    
+    def remove(self, start, end, value) -> bool:
+        """Удаляет интервал объекта value; False, если его не было"""
+        size = self._size
+        self._root = self._delete(self._root, (start, end, id(value)))
+        return self._size < size
+    
+    def _delete(self, node: _Node | None, key) -> _Node | None:
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        elif node.key < key:
+            node.right = self._delete(node.right, key)
+        else:
+            self._size -= 1
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Узел заменяется наименьшим из правого поддерева
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.right = self._delete_min(node.right)
+            successor.left = node.left
+            successor.right = node.right
+            node = successor
+        return _balance(node)
+    
+    def _delete_min(self, node: _Node) -> _Node | None:
+        if node.left is None:
+            return node.right
+        node.left = self._delete_min(node.left)
+        return _balance(node)
+    
+    def overlaps(self, start, end) -> bool:
+        """Есть ли интервал, пересекающийся с [start, end)"""
+        node = self._root
+        while node:
+            if node.start < end and start < node.end:
+                return True
+            # Если пересечение есть где-то в дереве, оно найдётся в левом поддереве с max_end > start
+            if node.left and node.left.max_end > start:
+                node = node.left
+            else:
+                node = node.right
+        return False
+    
+    def overlapping(self, start, end) -> list:
+        """Значения всех интервалов, пересекающихся с [start, end), по возрастанию начала"""
+        result = []
+        self._collect(self._root, start, end, result)
+        return result
+    
+    def _collect(self, node: _Node | None, start, end, result: list) -> None:
+        if node is None or not start < node.max_end:
+            return
+        self._collect(node.left, start, end, result)
+        if node.start < end:
+            if start < node.end:
+                result.append(node.value)
+            self._collect(node.right, start, end, result)
+    
+    def __iter__(self):
+        """Интервалы (start, end, value) по возрастанию начала"""
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.value
+            node = node.right
\ No newline at end of file
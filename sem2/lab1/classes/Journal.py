@@ -0,0 +1,76 @@
+import json
+import os
+from pathlib import Path
+
+class Journal:
+    """
+    Снимок данных в JSON и журнал изменений в формате JSON Lines рядом с ним
+    Изменения дописываются в конец журнала, при сжатии снимок перезаписывается целиком
+    через временный файл и атомарное переименование, после чего журнал удаляется
+    """
+    def __init__(self, snapshot_path: Path):
+        self.snapshot_path = Path(snapshot_path)
+        self.path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal")
+        # Записей в журнале с момента последнего снимка
+        self.records = 0
+    
+    def read_snapshot(self) -> dict:
+        return json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+    
+    def replay(self):
+        """
+        Записи журнала по порядку; недописанный при сбое хвост отбрасывается
+        и обрезается в файле, иначе следующие записи допишутся за ним и тоже потеряются
+        """
+        self.records = 0
+        if not self.path.exists():
+            return
+        good_end = 0
+        with open(self.path, "rb") as journal:
+            for line in journal:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Запись журнала без конца строки")
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                good_end += len(line)
+                self.records += 1
+                yield record
+            torn = journal.seek(0, os.SEEK_END) > good_end
+        if torn:
+            os.truncate(self.path, good_end)
+    
+    def append(self, records: list[dict]):
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            journal.flush()
+            os.fsync(journal.fileno())
+        self.records += len(records)
+    
+    def write_snapshot(self, data: dict):
+        """Сжатие: новый снимок заменяет старый атомарно, журнал после этого не нужен"""
+        temp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as snapshot:
+            snapshot.write(json.dumps(data, ensure_ascii=False, indent=2))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self._sync_directory()
+        # Если сбой случится до удаления журнала, его повторное применение к новому снимку ничего не изменит
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+    
+    def discard(self):
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+    
+    def _sync_directory(self):
+        # Переименование надёжно только после сброса каталога (на Windows каталог не открыть)
+        if os.name != "posix":
+            return
+        directory = os.open(self.snapshot_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
\ No newline at end of file
@@ -0,0 +1,139 @@
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterator
+from BookingStatus import BookingStatus
+from exceptions import StorageCorruptedError
+from BookingHistory import BookingHistory
+from Journal import Journal
+from StorageBackend import StorageBackend
+
+class JsonBackend(StorageBackend):
+    """
+    Снимок filepath в JSON и журнал изменений filepath.journal;
+    после compact_every записей журнала при сохранении снимок перезаписывается целиком
+    В снимке только активные брони, завершённые при сжатии дописываются в историю filepath.history
+    и загружаются по запросу, поэтому старт не зависит от длины истории
+    """
+    
+    # Разделы снимка для записей журнала: тип записи -> (раздел, поле идентификатора)
+    _SECTIONS = {
+        "room": ("rooms", "number"),
+        "guest": ("guests", "guest_id"),
+        "booking": ("bookings", "booking_id"),
+        "employee": ("employees", "employee_id"),
+    }
+    
+    def __init__(self, filepath: str | Path, compact_every: int = 1000):
+        self.filepath = Path(filepath)
+        self._journal = Journal(self.filepath)
+        self._history = BookingHistory(self.filepath)
+        self._compact_every = compact_every
+        # Завершённые брони из журнала (и снимков, сохранённых до появления истории), ещё не перенесённые в историю
+        self._pending: dict[str, dict] = {}
+    
+    @property
+    def location(self) -> str:
+        return str(self.filepath)
+    
+    def load(self) -> dict | None:
+        if not self.filepath.exists():
+            # Журнал и история без снимка не к чему применять
+            self._journal.discard()
+            self._history.discard()
+            return None
+        try:
+            data = self._journal.read_snapshot()
+            self._replay_journal(data)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # Битый JSON, не та кодировка или неизвестная структура снимка и журнала
+            raise StorageCorruptedError(f"Повреждён снимок {self.filepath}: {e}") from e
+        active = []
+        self._pending = {}
+        for booking in data.get("bookings", []):
+            if self._is_active(booking):
+                active.append(booking)
+            else:
+                self._pending[booking["booking_id"]] = booking
+        data["bookings"] = active
+        return data
+    
+    @staticmethod
+    def _is_active(booking: dict) -> bool:
+        return booking["status"] in (BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN)
+    
+    def _replay_journal(self, data: dict):
+        """Применяет записи журнала к разделам снимка: запись заменяет сущность с тем же идентификатором"""
+        sections = {
+            section: {item[id_field]: item for item in data.get(section, [])}
+            for section, id_field in self._SECTIONS.values()
+        }
+        for record in self._journal.replay():
+            if record["type"] == "counters":
+                data.update(record["data"])
+                continue
+            section, id_field = self._SECTIONS[record["type"]]
+            sections[section][record["data"][id_field]] = record["data"]
+        for section, items in sections.items():
+            data[section] = list(items.values())
+    
+    def save(self, records: list[dict], snapshot: Callable[[], dict]):
+        """Дописывает записи в журнал; без снимка сразу записывается полный снимок"""
+        if not self.filepath.exists():
+            self.compact(snapshot)
+            return
+        if records:
+            self._journal.append(records)
+        if self._journal.records >= self._compact_every:
+            self.compact(snapshot)
+    
+    def compact(self, snapshot: Callable[[], dict]):
+        """Переносит завершённые брони в историю, записывает снимок с активными и очищает журнал"""
+        data = snapshot()
+        active = []
+        finished = {}
+        for booking in data["bookings"]:
+            if self._is_active(booking):
+                active.append(booking)
+            else:
+                finished[booking["booking_id"]] = booking
+        # Загруженные брони новее записанных в журнал
+        for booking_id, booking in self._pending.items():
+            finished.setdefault(booking_id, booking)
+        # В историю дописываются только новые и изменённые брони, загруженные из неё без изменений пропускаются;
+        # история пишется первой: если сбой случится до записи снимка, журнал применится к старому снимку,
+        # а брони из него совпадут с уже дописанными в историю
+        self._history.append([booking for booking in finished.values() if not self._history.has_version(booking)])
+        data["bookings"] = active
+        self._journal.write_snapshot(data)
+        self._pending = {}
+    
+    def reset(self):
+        """
+        Удаляет повреждённый снимок и его журнал; история не повреждена и откладывается
+        в filepath.history.bak, чтобы брони из неё не смешались с новой базой
+        """
+        self.filepath.unlink(missing_ok=True)
+        self._journal.discard()
+        self._history.set_aside()
+        self._pending = {}
+    
+    def load_booking(self, booking_id: str) -> dict | None:
+        booking = self._pending.get(booking_id)
+        if booking is None:
+            booking = self._history.read(booking_id)
+        return booking
+    
+    def booking_ids(self, field: str, value: str | date) -> list[str]:
+        key = value.isoformat() if field == "check_in" else value
+        pending = [
+            booking_id for booking_id, booking in self._pending.items()
+            if BookingHistory.key(booking, field) == key
+        ]
+        return list(dict.fromkeys(self._history.ids(field, key) + pending))
+    
+    def booking_summaries(self) -> Iterator[dict]:
+        for booking in self._history.records():
+            if booking["booking_id"] not in self._pending:
+                yield self.summary(booking)
+        for booking in self._pending.values():
+            yield self.summary(booking)
\ No newline at end of file
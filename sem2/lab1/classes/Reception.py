@@ -5,6 +5,8 @@ from exceptions import GuestNotFoundError
 from exceptions import EntityNotFoundError
 from Period import Period
 from exceptions import RoomNotAvailableError
+from exceptions import InvalidPeriodError
+from RoomStatus import RoomStatus
 from ServiceOrder import ServiceOrder
 from Room import Room
 from Guest import Guest
@@ -17,6 +19,10 @@ class Reception:
     
     # Операция бронирования номера
     def book_room(self, guest_id: str, room_number: str, check_in: datetime, check_out: datetime) -> Booking:
+        """
+        Бронирует номер на даты [check_in, check_out); у номера может быть сколько угодно
+        будущих броней, если их периоды не пересекаются (проверка по дереву интервалов, O(log n))
+        """
         guest = self.storage.get_guest(guest_id)
         if not guest:
             raise GuestNotFoundError(f"Гость с ID {guest_id} не найден")
@@ -24,14 +30,19 @@ class Reception:
         room = self.storage.get_room(room_number)
         if not room:
             raise EntityNotFoundError(f"Номер {room_number} не найден в базе")
-  
-        try:
-            period = Period(check_in, check_out)
-            booking = self.storage.create_booking(guest, room, period)
+        
+        if not check_in < check_out:
+            raise InvalidPeriodError("Дата выезда должна быть позже даты заезда")
+        if room.status == RoomStatus.MAINTENANCE:
+            raise RoomNotAvailableError(f"Номер {room_number} на ремонте")
+        if not self.storage.is_room_free(room_number, check_in, check_out):
+            raise RoomNotAvailableError(f"Номер {room_number} уже забронирован на пересекающиеся даты")
+        
+        booking = self.storage.create_booking(guest, room, Period(check_in, check_out))
+        # Первая бронь свободного номера сразу становится текущей, остальные ждут своей очереди
+        if room.status == RoomStatus.AVAILABLE:
             room.assign_booking(booking.id)
-            return booking
-        except RoomNotAvailableError:
-            raise
+        return booking
     
     # Операция регистрации гостей
     def check_in_guest(self, booking_id: str):
@@ -9,9 +9,22 @@ class Room:
         self.berths = berths
         self.price_per_day = price_per_day
         self.room_type = room_type
-        self.status = RoomStatus.AVAILABLE
+        # Вызывается при смене статуса (хранилище поддерживает по нему индекс номеров)
+        self._status_listener = None
+        self._status = RoomStatus.AVAILABLE
         self.current_booking_id: str | None = None
     
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @status.setter
+    def status(self, value: str):
+        old_status = self._status
+        self._status = value
+        if self._status_listener is not None and old_status != value:
+            self._status_listener(self, old_status)
+    
     def assign_booking(self, booking_id: str):
         if self.status != RoomStatus.AVAILABLE:
             # Используем наше кастомное исключение
@@ -19,6 +32,18 @@ class Room:
         self.status = RoomStatus.BOOKED
         self.current_booking_id = booking_id
     
+    def prepare_for(self, booking_id: str):
+        """
+        Делает бронь текущей перед заселением: у номера может быть несколько будущих броней,
+        и заселиться можно, пока номер свободен или ждёт другую, ещё не заселённую бронь
+        """
+        if self.status == RoomStatus.AVAILABLE:
+            self.assign_booking(booking_id)
+        elif self.status == RoomStatus.BOOKED:
+            self.current_booking_id = booking_id
+        elif self.current_booking_id != booking_id:
+            raise RoomNotAvailableError(f"Номер {self.number} сейчас недоступен (статус: {self.status})")
+    
     def occupy(self):
         if self.status != RoomStatus.BOOKED:
             # Используем наше кастомное исключение
@@ -0,0 +1,38 @@
+from bisect import bisect_left, insort
+
+class RoomIndex:
+    """
+    Индекс номеров по статусу, числу мест и типу
+    Для каждого статуса (и пары статус + тип) хранится список (мест, номер), отсортированный по местам,
+    поэтому номера с не меньше чем N местами находятся бинарным поиском за O(log n + k)
+    """
+    def __init__(self):
+        self._by_status: dict[str, list[tuple[int, str]]] = {}
+        self._by_status_type: dict[tuple[str, str], list[tuple[int, str]]] = {}
+        # Под какими ключами проиндексирован номер: номер -> (статус, места, тип)
+        self._entries: dict[str, tuple[str, int, str]] = {}
+    
+    def update(self, room) -> None:
+        """Добавляет номер в индекс или переиндексирует его после изменения"""
+        self.remove(room.number)
+        entry = (room.berths, room.number)
+        insort(self._by_status.setdefault(room.status, []), entry)
+        insort(self._by_status_type.setdefault((room.status, room.room_type), []), entry)
+        self._entries[room.number] = (room.status, room.berths, room.room_type)
+    
+    def remove(self, number: str) -> None:
+        indexed = self._entries.pop(number, None)
+        if indexed is None:
+            return
+        status, berths, room_type = indexed
+        for bucket in (self._by_status[status], self._by_status_type[(status, room_type)]):
+            del bucket[bisect_left(bucket, (berths, number))]
+    
+    def find(self, status: str, min_berths: int = 1, room_type: str | None = None) -> list[str]:
+        """Номера комнат с данным статусом и не меньше чем min_berths местами"""
+        if room_type is None:
+            bucket = self._by_status.get(status, [])
+        else:
+            bucket = self._by_status_type.get((status, room_type), [])
+        start = bisect_left(bucket, (min_berths, ""))
+        return [number for _, number in bucket[start:]]
\ No newline at end of file
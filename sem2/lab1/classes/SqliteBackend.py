@@ -0,0 +1,244 @@
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+from BookingStatus import BookingStatus
+from exceptions import StorageCorruptedError
+from StorageBackend import StorageBackend
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rooms (
+    number TEXT PRIMARY KEY,
+    berths INTEGER NOT NULL,
+    price_per_day REAL NOT NULL,
+    room_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    current_booking_id TEXT
+);
+CREATE TABLE IF NOT EXISTS guests (
+    guest_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    booking_id TEXT PRIMARY KEY,
+    guest_id TEXT NOT NULL,
+    room_number TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_paid REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookings_guest ON bookings (guest_id);
+CREATE INDEX IF NOT EXISTS bookings_room ON bookings (room_number);
+CREATE INDEX IF NOT EXISTS bookings_status ON bookings (status);
+CREATE INDEX IF NOT EXISTS bookings_start ON bookings (period_start);
+CREATE TABLE IF NOT EXISTS service_orders (
+    order_id TEXT PRIMARY KEY,
+    booking_id TEXT NOT NULL,
+    guest_id TEXT NOT NULL,
+    service_type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL,
+    ordered_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS service_orders_booking ON service_orders (booking_id);
+CREATE TABLE IF NOT EXISTS employees (
+    employee_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Запросы с параметрами: текст не меняется, поэтому sqlite3 подготавливает каждый один раз и берёт из кэша
+_UPSERT = {
+    "room": (
+        "INSERT INTO rooms VALUES (:number, :berths, :price_per_day, :room_type, :status, :current_booking_id) "
+        "ON CONFLICT (number) DO UPDATE SET berths = excluded.berths, price_per_day = excluded.price_per_day, "
+        "room_type = excluded.room_type, status = excluded.status, current_booking_id = excluded.current_booking_id"
+    ),
+    "guest": (
+        "INSERT INTO guests VALUES (:guest_id, :name, :contact) "
+        "ON CONFLICT (guest_id) DO UPDATE SET name = excluded.name, contact = excluded.contact"
+    ),
+    "booking": (
+        "INSERT INTO bookings VALUES (:booking_id, :guest_id, :room_number, :start, :end, :status, :total_paid) "
+        "ON CONFLICT (booking_id) DO UPDATE SET status = excluded.status, total_paid = excluded.total_paid"
+    ),
+    "employee": (
+        "INSERT INTO employees VALUES (:employee_id, :name, :role) "
+        "ON CONFLICT (employee_id) DO UPDATE SET name = excluded.name, role = excluded.role"
+    ),
+    "counters": (
+        "INSERT INTO counters VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = excluded.value"
+    ),
+}
+_DELETE_ORDERS = "DELETE FROM service_orders WHERE booking_id = ?"
+_INSERT_ORDER = (
+    "INSERT INTO service_orders VALUES (:order_id, :booking_id, :guest_id, :service_type, "
+    ":description, :price, :ordered_at)"
+)
+_SELECT_BOOKING = "SELECT * FROM bookings WHERE booking_id = ?"
+_SELECT_ORDERS = "SELECT * FROM service_orders WHERE booking_id = ? ORDER BY rowid"
+_SELECT_ACTIVE_BOOKINGS = "SELECT * FROM bookings WHERE status IN (?, ?) ORDER BY rowid"
+_SELECT_ACTIVE_ORDERS = (
+    "SELECT o.* FROM service_orders o JOIN bookings b ON b.booking_id = o.booking_id "
+    "WHERE b.status IN (?, ?) ORDER BY o.rowid"
+)
+# Даты в ISO-формате сравниваются как строки, поэтому брони с заездом в день d - это [d, d + 1)
+_SELECT_BOOKING_IDS = {
+    "guest_id": "SELECT booking_id FROM bookings WHERE guest_id = ? ORDER BY rowid",
+    "room_number": "SELECT booking_id FROM bookings WHERE room_number = ? ORDER BY rowid",
+    "status": "SELECT booking_id FROM bookings WHERE status = ? ORDER BY rowid",
+    "check_in": "SELECT booking_id FROM bookings WHERE period_start >= ? AND period_start < ? ORDER BY rowid",
+}
+_SELECT_BOOKING_SUMMARIES = (
+    "SELECT b.*, COALESCE(SUM(o.price), 0.0) AS services_cost FROM bookings b "
+    "LEFT JOIN service_orders o ON o.booking_id = b.booking_id GROUP BY b.booking_id ORDER BY b.rowid"
+)
+
+_ACTIVE = (BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN)
+
+
+class SqliteBackend(StorageBackend):
+    """
+    База SQLite в режиме WAL: сохранение обновляет только изменённые строки,
+    при старте загружаются номера, гости, персонал и активные брони,
+    остальные брони читаются по индексированным полям, когда их запрашивают
+    """
+    
+    def __init__(self, filepath: str | Path):
+        self.filepath = Path(filepath)
+        self._connection: sqlite3.Connection | None = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.filepath)
+            try:
+                connection.row_factory = sqlite3.Row
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.executescript(_SCHEMA)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+    
+    @property
+    def location(self) -> str:
+        return str(self.filepath)
+    
+    def load(self) -> dict | None:
+        try:
+            return self._load()
+        except sqlite3.OperationalError:
+            # Занятая или недоступная база не повреждена
+            raise
+        except sqlite3.DatabaseError as e:
+            # "file is not a database", "database disk image is malformed"
+            raise StorageCorruptedError(f"Повреждена база {self.filepath}: {e}") from e
+    
+    def _load(self) -> dict | None:
+        connection = self._connect()
+        counters = {row["name"]: row["value"] for row in connection.execute("SELECT * FROM counters")}
+        if not counters:
+            return None
+        
+        orders: dict[str, list[dict]] = {}
+        for row in connection.execute(_SELECT_ACTIVE_ORDERS, _ACTIVE):
+            orders.setdefault(row["booking_id"], []).append(self._order_dict(row))
+        return {
+            "rooms": [dict(row) for row in connection.execute("SELECT * FROM rooms ORDER BY rowid")],
+            "guests": [dict(row) for row in connection.execute("SELECT * FROM guests ORDER BY rowid")],
+            "bookings": [self._booking_dict(row, orders.get(row["booking_id"], []))
+                         for row in connection.execute(_SELECT_ACTIVE_BOOKINGS, _ACTIVE)],
+            "employees": [dict(row) for row in connection.execute("SELECT * FROM employees ORDER BY rowid")],
+            **counters
+        }
+    
+    @staticmethod
+    def _order_dict(row: sqlite3.Row) -> dict:
+        order = dict(row)
+        del order["booking_id"]
+        return order
+    
+    @staticmethod
+    def _booking_dict(row: sqlite3.Row, orders: list[dict]) -> dict:
+        return {
+            "booking_id": row["booking_id"],
+            "guest_id": row["guest_id"],
+            "room_number": row["room_number"],
+            "period": {"start": row["period_start"], "end": row["period_end"]},
+            "status": row["status"],
+            "service_orders": orders,
+            "total_paid": row["total_paid"]
+        }
+    
+    def save(self, records: list[dict], snapshot: Callable[[], dict]):
+        """Все записи сохраняются одной транзакцией"""
+        connection = self._connect()
+        with connection:
+            for record in records:
+                kind, data = record["type"], record["data"]
+                if kind == "counters":
+                    connection.executemany(_UPSERT["counters"], data.items())
+                elif kind == "booking":
+                    self._save_booking(connection, data)
+                else:
+                    connection.execute(_UPSERT[kind], data)
+    
+    @staticmethod
+    def _save_booking(connection: sqlite3.Connection, data: dict):
+        connection.execute(_UPSERT["booking"], {**data, **data["period"]})
+        # Заказы брони перезаписываются целиком, их немного
+        connection.execute(_DELETE_ORDERS, (data["booking_id"],))
+        connection.executemany(_INSERT_ORDER, (
+            {**order, "booking_id": data["booking_id"]} for order in data["service_orders"]
+        ))
+    
+    def compact(self, snapshot: Callable[[], dict]):
+        """Переносит WAL в основной файл базы"""
+        self._connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def reset(self):
+        """Удаляет повреждённую базу вместе с её WAL"""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            self.filepath.with_name(self.filepath.name + suffix).unlink(missing_ok=True)
+    
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    def load_booking(self, booking_id: str) -> dict | None:
+        connection = self._connect()
+        row = connection.execute(_SELECT_BOOKING, (booking_id,)).fetchone()
+        if row is None:
+            return None
+        orders = [self._order_dict(order) for order in connection.execute(_SELECT_ORDERS, (booking_id,))]
+        return self._booking_dict(row, orders)
+    
+    def booking_ids(self, field: str, value: str | date) -> list[str]:
+        if field == "check_in":
+            params = (value.isoformat(), (value + timedelta(days=1)).isoformat())
+        else:
+            params = (value,)
+        return [row[0] for row in self._connect().execute(_SELECT_BOOKING_IDS[field], params)]
+    
+    def booking_summaries(self) -> Iterator[dict]:
+        # Суммы услуг считает сама база, заказы не читаются
+        for row in self._connect().execute(_SELECT_BOOKING_SUMMARIES):
+            yield {
+                "booking_id": row["booking_id"],
+                "room_number": row["room_number"],
+                "period": {"start": row["period_start"], "end": row["period_end"]},
+                "status": row["status"],
+                "services_cost": row["services_cost"],
+                "total_paid": row["total_paid"]
+            }
\ No newline at end of file
@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Callable, Iterator
+
+class StorageBackend(ABC):
+    """
+    Место хранения данных отеля для HotelStorage
+    Данные передаются словарями в формате to_dict/from_dict сущностей,
+    изменения - записями {"type": тип сущности или "counters", "data": словарь}
+    """
+    
+    @property
+    @abstractmethod
+    def location(self) -> str:
+        """Где лежат данные, для сообщений пользователю"""
+        pass
+    
+    @abstractmethod
+    def load(self) -> dict | None:
+        """
+        Данные для загрузки при старте: разделы rooms, guests, bookings, employees и счётчики next_*_id;
+        None, если хранилище пусто. Бэкенд может отдать в bookings только активные брони,
+        остальные тогда загружаются по запросу через load_booking
+        Повреждённые данные - StorageCorruptedError; прочие ошибки (нет доступа, база занята)
+        пробрасываются как есть, данные при них не удаляются
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, records: list[dict], snapshot: Callable[[], dict]) -> None:
+        """Сохраняет изменённые сущности; snapshot() строит полный набор данных, если он нужен бэкенду"""
+        pass
+    
+    def compact(self, snapshot: Callable[[], dict]) -> None:
+        """Сжимает хранилище, если бэкенду это нужно"""
+        pass
+    
+    @abstractmethod
+    def reset(self) -> None:
+        """Удаляет повреждённые данные, после которых load() не читается"""
+        pass
+    
+    def close(self) -> None:
+        pass
+    
+    # Отложенная загрузка бронирований, не отданных в load()
+    def load_booking(self, booking_id: str) -> dict | None:
+        return None
+    
+    def booking_ids(self, field: str, value: str | date) -> list[str]:
+        """
+        Идентификаторы сохранённых броней по полю guest_id, room_number, status или check_in (дата заезда);
+        бэкенды, отдающие в load() все брони, возвращают пустой список
+        """
+        return []
+    
+    def booking_summaries(self) -> Iterator[dict]:
+        """
+        Сводки сохранённых броней для отчётов без загрузки самих броней:
+        booking_id, room_number, period, status, services_cost, total_paid
+        """
+        return iter(())
+    
+    @staticmethod
+    def summary(booking: dict) -> dict:
+        """Сводка по словарю брони в формате Booking.to_dict"""
+        return {
+            "booking_id": booking["booking_id"],
+            "room_number": booking["room_number"],
+            "period": booking["period"],
+            "status": booking["status"],
+            "services_cost": sum(order["price"] for order in booking.get("service_orders", [])),
+            "total_paid": booking.get("total_paid", 0.0)
+        }
\ No newline at end of file
@@ -18,6 +18,14 @@ class PaymentError(HotelException):
     """Выбрасывается при ошибках оплаты"""
     pass
 
+class InvalidPeriodError(HotelException):
+    """Выбрасывается, если дата выезда не позже даты заезда"""
+    pass
+
 class EntityNotFoundError(HotelException):
     """Универсальное исключение, если сущность (номер, бронь, сотрудник) не найдена"""
+    pass
+
+class StorageCorruptedError(HotelException):
+    """Выбрасывается бэкендом хранилища, если сохранённые данные повреждены и не читаются"""
     pass
\ No newline at end of file
@@ -6,9 +6,12 @@ Unit тесты для системы управления отелем
 
 import unittest
 import tempfile
+import json
+import sqlite3
 import os
 import sys
 from datetime import datetime
+from unittest import mock
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,7 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from exceptions import (
         HotelException, RoomNotAvailableError, BookingInvalidStatusError,
-        GuestNotFoundError, PaymentError, EntityNotFoundError
+        GuestNotFoundError, PaymentError, EntityNotFoundError, InvalidPeriodError
     )
     from Period import Period
     from Room import Room, RoomStatus
@@ -26,6 +29,9 @@ try:
     from Employee import Employee
     from HotelStorage import HotelStorage
     from Reception import Reception
+    from IntervalTree import IntervalTree
+    from SqliteBackend import SqliteBackend
+    from Journal import Journal
 except ImportError as e:
     print(f"Ошибка импорта: {e}")
     print("Убедитесь что все модули находятся в правильной папке")
@@ -375,6 +381,24 @@ class TestBooking(unittest.TestCase):
         # 750 + 50 + 100 = 900
         self.assertEqual(self.booking.total_amount, 750.0)
     
+    def test_total_amount_tracks_changes(self):
+        """Закэшированные суммы учитывают add_service, правки списка заказов и смену цены номера"""
+        self.booking.check_in()
+        self.booking.add_service(ServiceOrder("O0001", "G0001", ServiceType.RESTAURANT, "Ужин", 50.0))
+        self.assertEqual(self.booking.services_cost, 50.0)
+        self.booking.service_orders.append(ServiceOrder("O0002", "G0001", ServiceType.SPA, "Массаж", 100.0))
+        self.assertEqual(self.booking.total_amount, 750.0)
+        self.booking.service_orders.pop()
+        self.assertEqual(self.booking.services_cost, 50.0)
+        self.booking.service_orders = []
+        self.assertEqual(self.booking.services_cost, 0.0)
+        
+        self.room.price_per_day = 200.0
+        self.assertEqual(self.booking.room_cost, 800.0)
+        self.booking.period.end = datetime(2026, 2, 26, 12, 0)
+        self.assertEqual(self.booking.total_amount, 1000.0)
+        self.assertIn("номер 1000.00 + услуги 0.00 = 1000.00", str(self.booking))
+    
     def test_check_in_success(self):
         """check_in успешен для подтвержденной брони"""
         self.booking.check_in()
@@ -543,6 +567,63 @@ class TestServiceType(unittest.TestCase):
         self.assertEqual(ServiceType.display("unknown"), "unknown")
 
 
+# ==================== ТЕСТЫ INTERVAL_TREE ====================
+
+class TestIntervalTree(unittest.TestCase):
+    """Тесты для дерева интервалов"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.tree = IntervalTree()
+        self.march = [Period(datetime(2026, 3, d), datetime(2026, 3, d + 3)) for d in range(1, 28, 4)]
+        for period in self.march:
+            self.tree.add(period.start, period.end, period)
+    
+    def test_len(self):
+        """Размер дерева равен числу интервалов"""
+        self.assertEqual(len(self.tree), len(self.march))
+    
+    def test_overlaps(self):
+        """Пересечение полуоткрытых интервалов"""
+        self.assertTrue(self.tree.overlaps(datetime(2026, 3, 2), datetime(2026, 3, 3)))
+        # 1-4 и 5-8 марта: 4-5 марта свободно, конец брони не пересекается с началом следующей
+        self.assertFalse(self.tree.overlaps(datetime(2026, 3, 4), datetime(2026, 3, 5)))
+        self.assertFalse(self.tree.overlaps(datetime(2026, 4, 1), datetime(2026, 4, 5)))
+    
+    def test_overlapping_returns_sorted_values(self):
+        """overlapping возвращает все пересечения по возрастанию начала"""
+        found = self.tree.overlapping(datetime(2026, 3, 6), datetime(2026, 3, 14))
+        self.assertEqual(found, self.march[1:4])
+    
+    def test_remove(self):
+        """remove удаляет только интервал данного объекта"""
+        first = self.march[0]
+        self.assertTrue(self.tree.remove(first.start, first.end, first))
+        self.assertFalse(self.tree.remove(first.start, first.end, first))
+        self.assertFalse(self.tree.overlaps(datetime(2026, 3, 1), datetime(2026, 3, 4)))
+        self.assertEqual(len(self.tree), len(self.march) - 1)
+    
+    def test_many_intervals_match_full_scan(self):
+        """Результаты совпадают с полным перебором после вставок и удалений"""
+        tree = IntervalTree()
+        intervals = [(i * 7 % 101, i * 7 % 101 + i % 5 + 1, i) for i in range(300)]
+        for start, end, value in intervals:
+            tree.add(start, end, value)
+        for start, end, value in intervals[::3]:
+            tree.remove(start, end, value)
+        alive = [iv for i, iv in enumerate(intervals) if i % 3]
+        for start in range(0, 110, 3):
+            expected = sorted(v for s, e, v in alive if s < start + 4 and start < e)
+            self.assertEqual(sorted(tree.overlapping(start, start + 4)), expected)
+            self.assertEqual(tree.overlaps(start, start + 4), bool(expected))
+        self.assertEqual([s for s, _, _ in tree], sorted(s for s, _, _ in alive))
+    
+    def test_invalid_interval(self):
+        """Интервал с началом не раньше конца не добавляется"""
+        with self.assertRaises(ValueError):
+            self.tree.add(datetime(2026, 3, 5), datetime(2026, 3, 5), None)
+
+
 # ==================== ТЕСТЫ HOTEL_STORAGE ====================
 
 class TestHotelStorage(unittest.TestCase):
@@ -561,8 +642,10 @@ class TestHotelStorage(unittest.TestCase):
     
     def tearDown(self):
         """Очистка после каждого теста"""
-        if os.path.exists(self.temp_path):
-            os.unlink(self.temp_path)
+        for path in (self.temp_path, self.temp_path + ".journal", self.temp_path + ".history",
+                     self.temp_path + ".history.bak"):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_storage_creation(self):
         """HotelStorage корректно создается"""
@@ -600,6 +683,49 @@ class TestHotelStorage(unittest.TestCase):
         available = self.storage.find_available_rooms(min_berths=2)
         self.assertTrue(all(r.berths >= 2 for r in available))
     
+    def test_find_available_rooms_by_type(self):
+        """find_available_rooms с фильтром по типу номера"""
+        available = self.storage.find_available_rooms(room_type="люкс")
+        self.assertTrue(available)
+        self.assertTrue(all(r.room_type == "люкс" for r in available))
+    
+    def test_find_available_rooms_tracks_status(self):
+        """Индекс номеров следует за изменением статуса"""
+        room = self.storage.get_room("201")
+        room.assign_booking("B0100")
+        self.assertNotIn(room, self.storage.find_available_rooms())
+        room.release()
+        self.assertIn(room, self.storage.find_available_rooms())
+    
+    def test_find_available_rooms_between_dates(self):
+        """Поиск свободных номеров на даты учитывает пересечения броней"""
+        guest = self.storage.get_guest("G0001")
+        room = self.storage.get_room("201")
+        self.storage.create_booking(guest, room, Period(datetime(2026, 3, 1), datetime(2026, 3, 5)))
+        
+        busy = self.storage.find_available_rooms(3, datetime(2026, 3, 4), datetime(2026, 3, 6))
+        free = self.storage.find_available_rooms(3, datetime(2026, 3, 5), datetime(2026, 3, 8))
+        self.assertNotIn(room, busy)
+        self.assertIn(room, free)
+        self.assertTrue(all(r.berths >= 3 for r in free))
+        self.assertFalse(self.storage.is_room_free("201", datetime(2026, 3, 2), datetime(2026, 3, 3)))
+    
+    def test_find_available_rooms_after_check_out(self):
+        """После выселения даты брони снова свободны"""
+        guest = self.storage.get_guest("G0001")
+        room = self.storage.get_room("201")
+        booking = self.storage.create_booking(guest, room, Period(datetime(2026, 3, 1), datetime(2026, 3, 5)))
+        room.assign_booking(booking.id)
+        booking.check_in()
+        booking.check_out(booking.total_amount)
+        self.assertTrue(self.storage.is_room_free("201", datetime(2026, 3, 1), datetime(2026, 3, 5)))
+        self.assertIn(room, self.storage.find_available_rooms(3, datetime(2026, 3, 1), datetime(2026, 3, 5)))
+    
+    def test_find_available_rooms_invalid_dates(self):
+        """Поиск по датам требует обе даты"""
+        with self.assertRaises(ValueError):
+            self.storage.find_available_rooms(start=datetime(2026, 3, 1))
+    
     def test_register_guest(self):
         """register_guest регистрирует нового гостя"""
         initial_count = len(self.storage.guests)
@@ -647,6 +773,48 @@ class TestHotelStorage(unittest.TestCase):
         self.assertTrue(all(b.status in (BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN) 
                            for b in bookings))
     
+    def test_get_bookings_by_guest(self):
+        """get_bookings_by_guest возвращает только брони гостя"""
+        guest = self.storage.register_guest("Пётр Петров", "+375297777777")
+        room = self.storage.get_room("102")
+        booking = self.storage.create_booking(guest, room, Period(datetime(2026, 3, 1), datetime(2026, 3, 5)))
+        self.assertEqual(self.storage.get_bookings_by_guest(guest.id), [booking])
+        self.assertEqual(self.storage.get_bookings_by_guest("G999"), [])
+    
+    def test_status_index_follows_check_in_and_check_out(self):
+        """Индекс по статусу обновляется при заселении и выселении"""
+        guest = self.storage.get_guest("G0001")
+        room = self.storage.get_room("201")
+        booking = self.storage.create_booking(guest, room, Period(datetime(2026, 3, 1), datetime(2026, 3, 5)))
+        self.assertIn(booking, self.storage.get_bookings_by_status(BookingStatus.CONFIRMED))
+        
+        room.assign_booking(booking.id)
+        booking.check_in()
+        self.assertNotIn(booking, self.storage.get_bookings_by_status(BookingStatus.CONFIRMED))
+        self.assertIn(booking, self.storage.get_bookings_by_status(BookingStatus.CHECKED_IN))
+        self.assertIn(booking, self.storage.get_active_bookings())
+        
+        booking.check_out(booking.total_amount)
+        self.assertIn(booking, self.storage.get_bookings_by_status(BookingStatus.CHECKED_OUT))
+        self.assertNotIn(booking, self.storage.get_active_bookings())
+    
+    def test_get_bookings_by_room_and_check_in_date(self):
+        """Поиск броней по номеру и дате заезда"""
+        guest = self.storage.get_guest("G0001")
+        room = self.storage.get_room("102")
+        first = self.storage.create_booking(guest, room, Period(datetime(2026, 3, 1, 14), datetime(2026, 3, 5)))
+        second = self.storage.create_booking(guest, room, Period(datetime(2026, 3, 10), datetime(2026, 3, 12)))
+        self.assertEqual(self.storage.get_bookings_by_room("102"), [first, second])
+        self.assertEqual(self.storage.get_bookings_by_check_in_date(datetime(2026, 3, 1).date()), [first])
+        self.assertEqual(self.storage.get_bookings_by_check_in_date(datetime(2026, 3, 2).date()), [])
+    
+    def test_indexes_after_load(self):
+        """Индексы строятся при загрузке из файла"""
+        storage = HotelStorage(filepath=self.temp_path)
+        self.assertEqual([b.id for b in storage.get_bookings_by_guest("G0001")], ["B0001"])
+        self.assertEqual([b.id for b in storage.get_bookings_by_status(BookingStatus.CHECKED_IN)], ["B0001"])
+        self.assertEqual([b.id for b in storage.get_bookings_by_room("101")], ["B0001"])
+    
     def test_create_service_order(self):
         """create_service_order создает заказ услуги"""
         order = self.storage.create_service_order(
@@ -668,6 +836,196 @@ class TestHotelStorage(unittest.TestCase):
         self.assertIsNotNone(employee)
         self.assertEqual(employee.id, "E0001")
     
+    def test_save_appends_only_changes_to_journal(self):
+        """Сохранение дописывает в журнал только изменения, снимок не перезаписывается"""
+        snapshot = Path(self.temp_path).read_text(encoding="utf-8")
+        self.storage.save_to_file()
+        guest = self.storage.register_guest("Журнальный Гость", "+375291231231")
+        self.storage.save_to_file()
+        
+        self.assertEqual(Path(self.temp_path).read_text(encoding="utf-8"), snapshot)
+        lines = Path(self.temp_path + ".journal").read_text(encoding="utf-8").splitlines()
+        self.assertIn(guest.id, lines[-2])
+        self.assertIn("counters", lines[-1])
+    
+    def test_journal_replay_on_load(self):
+        """При загрузке журнал применяется к снимку"""
+        reception = Reception(self.storage)
+        guest = self.storage.register_guest("Журнальный Гость", "+375291231231")
+        booking = reception.book_room(guest.id, "202", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        reception.check_in_guest(booking.id)
+        reception.order_service(booking.id, ServiceType.SPA, "Массаж", 80.0)
+        self.storage.save_to_file()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        loaded = storage2.get_booking(booking.id)
+        self.assertEqual(loaded.status, BookingStatus.CHECKED_IN)
+        self.assertEqual(len(loaded.service_orders), 1)
+        self.assertEqual(storage2.get_room("202").status, RoomStatus.OCCUPIED)
+        self.assertEqual(storage2.register_guest("Следующий", "-").id, f"G{int(guest.id[1:]) + 1:04d}")
+    
+    def test_journal_compaction(self):
+        """После compact_every записей журнал сжимается в снимок"""
+        storage = HotelStorage(filepath=self.temp_path, compact_every=3)
+        storage.register_guest("Первый", "-")
+        storage.save_to_file()
+        self.assertTrue(os.path.exists(self.temp_path + ".journal"))
+        storage.register_guest("Второй", "-")
+        storage.save_to_file()
+        self.assertFalse(os.path.exists(self.temp_path + ".journal"))
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        self.assertEqual(len(storage2.guests), len(storage.guests))
+    
+    def test_journal_torn_tail_is_ignored(self):
+        """Недописанная при сбое последняя запись журнала отбрасывается"""
+        guest = self.storage.register_guest("Журнальный Гость", "+375291231231")
+        self.storage.save_to_file()
+        with open(self.temp_path + ".journal", "a", encoding="utf-8") as journal:
+            journal.write('{"type": "guest", "data": {"guest_id": "G09')
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        self.assertIsNotNone(storage2.get_guest(guest.id))
+        self.assertIsNone(storage2.get_guest("G0099"))
+    
+    def test_save_after_torn_tail_is_kept(self):
+        """После загрузки с недописанным хвостом новые сохранения не теряются"""
+        self.storage.save_to_file()
+        with open(self.temp_path + ".journal", "a", encoding="utf-8") as journal:
+            journal.write('{"type": "guest", "data": {"guest_id": "G09')
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        first = storage2.register_guest("Первый", "-")
+        storage2.save_to_file()
+        second = storage2.register_guest("Второй", "-")
+        storage2.save_to_file()
+        
+        storage3 = HotelStorage(filepath=self.temp_path)
+        self.assertIsNotNone(storage3.get_guest(first.id))
+        self.assertIsNotNone(storage3.get_guest(second.id))
+        self.assertEqual(storage3.register_guest("Третий", "-").id, f"G{int(second.id[1:]) + 1:04d}")
+    
+    def _checked_out_booking(self) -> Booking:
+        reception = Reception(self.storage)
+        guest = self.storage.register_guest("Историческая Гостья", "+375291231231")
+        booking = reception.book_room(guest.id, "202", datetime(2026, 3, 1), datetime(2026, 3, 3))
+        reception.check_in_guest(booking.id)
+        reception.order_service(booking.id, ServiceType.SPA, "Массаж", 80.0)
+        reception.check_out_guest(booking.id, 480.0)
+        return booking
+    
+    def test_compaction_moves_finished_bookings_to_history(self):
+        """При сжатии завершённые брони переносятся из снимка в историю"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        
+        snapshot = json.loads(Path(self.temp_path).read_text(encoding="utf-8"))
+        self.assertEqual([b["booking_id"] for b in snapshot["bookings"]], ["B0001"])
+        history = Path(self.temp_path + ".history").read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["booking_id"] for line in history], [booking.id])
+    
+    def test_compaction_appends_only_new_history(self):
+        """Сжатие не переписывает историю: загруженные без изменений брони пропускаются, новые дописываются"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        history_path = Path(self.temp_path + ".history")
+        history = history_path.read_bytes()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        storage2.get_booking(booking.id)
+        storage2.compact()
+        self.assertEqual(history_path.read_bytes(), history)
+        
+        self.storage = storage2
+        later = self._checked_out_booking()
+        storage2.compact()
+        appended = history_path.read_bytes()
+        self.assertTrue(appended.startswith(history))
+        self.assertIn(later.id, appended[len(history):].decode("utf-8"))
+    
+    def test_history_torn_tail_is_dropped(self):
+        """Недописанная строка истории отбрасывается, следующие брони не теряются"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        with open(self.temp_path + ".history", "a", encoding="utf-8") as history:
+            history.write('{"booking_id": "B09')
+        
+        self.storage = HotelStorage(filepath=self.temp_path)
+        later = self._checked_out_booking()
+        self.storage.compact()
+        
+        storage3 = HotelStorage(filepath=self.temp_path)
+        self.assertEqual(storage3.get_booking(booking.id).status, BookingStatus.CHECKED_OUT)
+        self.assertEqual(storage3.get_booking(later.id).status, BookingStatus.CHECKED_OUT)
+    
+    def test_corrupted_snapshot_is_recreated(self):
+        """Повреждённый снимок заменяется демо-данными, история откладывается в .bak"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        Path(self.temp_path).write_text("{not json", encoding="utf-8")
+        
+        storage = HotelStorage(filepath=self.temp_path)
+        self.assertIn("101", storage.rooms)
+        self.assertFalse(os.path.exists(self.temp_path + ".history"))
+        backup = Path(self.temp_path + ".history.bak").read_text(encoding="utf-8")
+        self.assertIn(booking.id, backup)
+    
+    def test_load_error_keeps_files(self):
+        """Ошибка чтения, не связанная с повреждением, пробрасывается, файлы не удаляются"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        snapshot = Path(self.temp_path).read_bytes()
+        
+        with mock.patch.object(Journal, "read_snapshot", side_effect=PermissionError("нет доступа")):
+            with self.assertRaises(PermissionError):
+                HotelStorage(filepath=self.temp_path)
+        self.assertEqual(Path(self.temp_path).read_bytes(), snapshot)
+        storage = HotelStorage(filepath=self.temp_path)
+        self.assertEqual(storage.get_booking(booking.id).status, BookingStatus.CHECKED_OUT)
+    
+    def test_history_bookings_load_lazily(self):
+        """Брони из истории не загружаются при старте и подгружаются по запросу"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        self.assertNotIn(booking.id, storage2.bookings)
+        loaded = storage2.get_booking(booking.id)
+        self.assertEqual(loaded.status, BookingStatus.CHECKED_OUT)
+        self.assertEqual([o.description for o in loaded.service_orders], ["Массаж"])
+        self.assertEqual(storage2.get_bookings_by_guest(booking.guest.id), [loaded])
+        self.assertEqual(storage2.get_bookings_by_room("202"), [loaded])
+        self.assertEqual(storage2.get_bookings_by_check_in_date(datetime(2026, 3, 1).date()), [loaded])
+    
+    def test_journal_finished_bookings_load_lazily(self):
+        """Завершённые брони из журнала тоже загружаются по запросу и попадают в историю при сжатии"""
+        booking = self._checked_out_booking()
+        self.storage.save_to_file()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        self.assertNotIn(booking.id, storage2.bookings)
+        self.assertEqual([b.id for b in storage2.get_bookings_by_status(BookingStatus.CHECKED_OUT)], [booking.id])
+        storage2.compact()
+        
+        storage3 = HotelStorage(filepath=self.temp_path)
+        self.assertEqual(storage3.get_booking(booking.id).total_paid, 480.0)
+        self.assertIsNone(storage3.get_booking("B9999"))
+    
+    def test_revenue_includes_history_without_loading(self):
+        """get_revenue учитывает брони из истории, не загружая их"""
+        booking = self._checked_out_booking()
+        self.storage.compact()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        revenue = storage2.get_revenue()
+        self.assertNotIn(booking.id, storage2.bookings)
+        demo = storage2.get_booking("B0001")
+        self.assertEqual(revenue["bookings"], 2)
+        self.assertEqual(revenue["room"], demo.room_cost + 400.0)
+        self.assertEqual(revenue["services"], demo.services_cost + 80.0)
+        self.assertEqual(revenue["total"], demo.total_amount + 480.0)
+        self.assertEqual(revenue["paid"], 480.0)
+    
     def test_save_and_load(self):
         """save_to_file и загрузка работают корректно"""
         self.storage.add_room(Room("301", 2, 180.0))
@@ -679,6 +1037,151 @@ class TestHotelStorage(unittest.TestCase):
         self.assertGreaterEqual(len(storage2.guests), 1)
 
 
+# ==================== ТЕСТЫ SQLITE BACKEND ====================
+
+class TestSqliteBackend(unittest.TestCase):
+    """Тесты для HotelStorage с бэкендом SqliteBackend"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.temp_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_path = self.temp_file.name
+        self.temp_file.close()
+        self.storage = self._open()
+        self.reception = Reception(self.storage)
+    
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.storage.close()
+        for path in (self.temp_path, self.temp_path + "-wal", self.temp_path + "-shm"):
+            if os.path.exists(path):
+                os.unlink(path)
+    
+    def _open(self) -> HotelStorage:
+        return HotelStorage(filepath=self.temp_path, backend=SqliteBackend(self.temp_path))
+    
+    def _reopen(self) -> HotelStorage:
+        self.storage.save_to_file()
+        self.storage.close()
+        self.storage = self._open()
+        return self.storage
+    
+    def _checked_out_booking(self) -> Booking:
+        guest = self.storage.register_guest("Историческая Гостья", "+375291231231")
+        booking = self.reception.book_room(guest.id, "202", datetime(2026, 3, 1), datetime(2026, 3, 3))
+        self.reception.check_in_guest(booking.id)
+        self.reception.order_service(booking.id, ServiceType.SPA, "Массаж", 80.0)
+        self.reception.check_out_guest(booking.id, 480.0)
+        return booking
+    
+    def test_demo_data_in_new_database(self):
+        """Новая база заполняется демо-данными и открывается в режиме WAL"""
+        storage = self._reopen()
+        self.assertIn("101", storage.rooms)
+        self.assertIn("E0001", storage.employees)
+        self.assertEqual(storage.get_room("101").status, RoomStatus.OCCUPIED)
+        self.assertEqual(len(storage.get_booking("B0001").service_orders), 1)
+        with sqlite3.connect(self.temp_path) as connection:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+    
+    def test_historical_bookings_load_lazily(self):
+        """Завершённые брони не загружаются при старте и подгружаются по запросу"""
+        booking = self._checked_out_booking()
+        storage = self._reopen()
+        
+        self.assertNotIn(booking.id, storage.bookings)
+        self.assertIn("B0001", storage.bookings)
+        loaded = storage.get_booking(booking.id)
+        self.assertEqual(loaded.status, BookingStatus.CHECKED_OUT)
+        self.assertEqual(loaded.total_paid, 480.0)
+        self.assertEqual([o.description for o in loaded.service_orders], ["Массаж"])
+        self.assertIs(storage.get_booking(booking.id), loaded)
+        self.assertEqual(storage.get_room("202").status, RoomStatus.AVAILABLE)
+    
+    def test_queries_include_unloaded_bookings(self):
+        """Запросы по гостю, номеру, статусу и дате заезда находят и не загруженные брони"""
+        booking = self._checked_out_booking()
+        storage = self._reopen()
+        guest_id = booking.guest.id
+        
+        self.assertEqual([b.id for b in storage.get_bookings_by_guest(guest_id)], [booking.id])
+        self.assertEqual([b.id for b in storage.get_bookings_by_room("202")], [booking.id])
+        self.assertEqual([b.id for b in storage.get_bookings_by_check_in_date(datetime(2026, 3, 1).date())],
+                         [booking.id])
+        self.assertEqual([b.id for b in storage.get_bookings_by_status(BookingStatus.CHECKED_OUT)], [booking.id])
+        self.assertEqual([b.id for b in storage.get_active_bookings()], ["B0001"])
+    
+    def test_unsaved_status_overrides_database(self):
+        """Несохранённый статус брони важнее сохранённого в базе"""
+        guest = self.storage.register_guest("Гость", "+375291231231")
+        booking = self.reception.book_room(guest.id, "202", datetime(2026, 3, 1), datetime(2026, 3, 3))
+        self.storage.save_to_file()
+        self.reception.check_in_guest(booking.id)
+        
+        self.assertEqual(self.storage.get_bookings_by_status(BookingStatus.CONFIRMED), [])
+        self.assertIn(booking, self.storage.get_bookings_by_status(BookingStatus.CHECKED_IN))
+    
+    def test_reception_works_after_reload(self):
+        """Reception работает с бронями, загруженными из базы"""
+        guest = self.storage.register_guest("Гость", "+375291231231")
+        booking = self.reception.book_room(guest.id, "202", datetime(2026, 3, 1), datetime(2026, 3, 3))
+        storage = self._reopen()
+        reception = Reception(storage)
+        
+        self.assertEqual(storage.get_room("202").status, RoomStatus.BOOKED)
+        reception.check_in_guest(booking.id)
+        reception.order_service(booking.id, ServiceType.RESTAURANT, "Ужин", 30.0)
+        reception.check_out_guest(booking.id, 430.0)
+        storage = self._reopen()
+        
+        self.assertEqual(storage.get_room("202").status, RoomStatus.AVAILABLE)
+        self.assertEqual(storage.get_booking(booking.id).total_amount, 430.0)
+        self.assertEqual(storage.register_guest("Следующий", "-").id, f"G{int(guest.id[1:]) + 1:04d}")
+    
+    def test_revenue_from_database(self):
+        """get_revenue считает незагруженные брони по сводкам из базы"""
+        booking = self._checked_out_booking()
+        storage = self._reopen()
+        revenue = storage.get_revenue()
+        
+        self.assertNotIn(booking.id, storage.bookings)
+        self.assertEqual(revenue["bookings"], 2)
+        self.assertEqual(revenue["total"], storage.get_booking("B0001").total_amount + 480.0)
+        self.assertEqual(revenue["paid"], 480.0)
+    
+    def test_corrupted_database_is_recreated(self):
+        """Повреждённый файл базы заменяется новой базой с демо-данными"""
+        self.storage.close()
+        Path(self.temp_path).write_bytes(b"not a database" * 100)
+        self.storage = self._open()
+        self.assertIn("101", self.storage.rooms)
+        self.assertIsNotNone(self.storage.get_booking("B0001"))
+    
+    def test_messages_name_database_file(self):
+        """Сообщения о загрузке и сохранении называют файл базы"""
+        self.storage.close()
+        with mock.patch("builtins.print") as output:
+            self.storage = HotelStorage(filepath="hotel_data.json", backend=SqliteBackend(self.temp_path))
+            self.storage.save_to_file()
+        messages = [call.args[0] for call in output.call_args_list]
+        self.assertIn(f"Данные загружены из {self.temp_path}", messages)
+        self.assertIn(f"Данные сохранены в {self.temp_path}", messages)
+        self.assertFalse(any("hotel_data.json" in message for message in messages))
+    
+    def test_locked_database_is_not_recreated(self):
+        """Занятая база не считается повреждённой: ошибка пробрасывается, данные сохраняются"""
+        booking = self._checked_out_booking()
+        self._reopen()
+        self.storage.close()
+        locked = sqlite3.OperationalError("database is locked")
+        with mock.patch.object(SqliteBackend, "_load", side_effect=locked):
+            with self.assertRaises(sqlite3.OperationalError):
+                self._open()
+        self.assertTrue(os.path.exists(self.temp_path))
+        self.storage = self._open()
+        self.assertEqual(self.storage.get_booking(booking.id).status, BookingStatus.CHECKED_OUT)
+
+
 # ==================== ТЕСТЫ RECEPTION ====================
 
 class TestReception(unittest.TestCase):
@@ -698,8 +1201,9 @@ class TestReception(unittest.TestCase):
     
     def tearDown(self):
         """Очистка после каждого теста"""
-        if os.path.exists(self.temp_path):
-            os.unlink(self.temp_path)
+        for path in (self.temp_path, self.temp_path + ".journal", self.temp_path + ".history"):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_reception_creation(self):
         """Reception корректно создается"""
@@ -724,17 +1228,107 @@ class TestReception(unittest.TestCase):
             )
     
     def test_book_room_not_available(self):
-        """book_room выбрасывает ошибку если номер недоступен"""
+        """book_room выбрасывает ошибку если номер занят на пересекающиеся даты"""
         self.reception.book_room(
             "G0001", "102",
             datetime(2026, 3, 1), datetime(2026, 3, 5)
         )
+        bookings_count = len(self.storage.bookings)
         with self.assertRaises(RoomNotAvailableError):
             self.reception.book_room(
                 "G0001", "102",
-                datetime(2026, 3, 10), datetime(2026, 3, 15)
+                datetime(2026, 3, 4), datetime(2026, 3, 8)
+            )
+        self.assertEqual(len(self.storage.bookings), bookings_count)
+    
+    def test_book_room_many_future_reservations(self):
+        """На непересекающиеся даты номер можно бронировать много раз"""
+        bookings = [
+            self.reception.book_room("G0001", "102", datetime(2026, 3, day), datetime(2026, 3, day + 2))
+            for day in range(1, 28, 2)
+        ]
+        self.assertEqual(len(bookings), 14)
+        room = self.storage.get_room("102")
+        self.assertEqual(room.status, RoomStatus.BOOKED)
+        self.assertEqual(room.current_booking_id, bookings[0].id)
+    
+    def test_book_room_invalid_period(self):
+        """book_room выбрасывает ошибку если выезд не позже заезда"""
+        with self.assertRaises(InvalidPeriodError):
+            self.reception.book_room(
+                "G0001", "102",
+                datetime(2026, 3, 5), datetime(2026, 3, 5)
             )
     
+    def test_book_room_maintenance(self):
+        """Номер на ремонте нельзя забронировать"""
+        self.storage.get_room("201").status = RoomStatus.MAINTENANCE
+        with self.assertRaises(RoomNotAvailableError):
+            self.reception.book_room(
+                "G0001", "201",
+                datetime(2026, 3, 1), datetime(2026, 3, 5)
+            )
+    
+    def test_check_in_later_reservation_first(self):
+        """Заселение по более ранней брони, сделанной позже другой"""
+        later = self.reception.book_room("G0001", "102", datetime(2026, 3, 10), datetime(2026, 3, 15))
+        earlier = self.reception.book_room("G0001", "102", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        
+        self.reception.check_in_guest(earlier.id)
+        self.reception.check_out_guest(earlier.id, earlier.total_amount)
+        self.reception.check_in_guest(later.id)
+        room = self.storage.get_room("102")
+        self.assertEqual(room.status, RoomStatus.OCCUPIED)
+        self.assertEqual(room.current_booking_id, later.id)
+    
+    def test_check_in_when_room_occupied_by_other(self):
+        """Нельзя заселиться, пока номер занят другим гостем"""
+        first = self.reception.book_room("G0001", "102", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        second = self.reception.book_room("G0001", "102", datetime(2026, 3, 10), datetime(2026, 3, 15))
+        self.reception.check_in_guest(first.id)
+        with self.assertRaises(RoomNotAvailableError):
+            self.reception.check_in_guest(second.id)
+    
+    def test_reload_keeps_occupied_room_with_future_booking(self):
+        """После загрузки номер с заселённым гостем и будущей бронью остаётся занятым"""
+        first = self.reception.book_room("G0001", "102", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        self.reception.check_in_guest(first.id)
+        second = self.reception.book_room("G0001", "102", datetime(2026, 3, 10), datetime(2026, 3, 15))
+        self.storage.save_to_file()
+        
+        storage2 = HotelStorage(filepath=self.temp_path)
+        room = storage2.get_room("102")
+        self.assertEqual(room.status, RoomStatus.OCCUPIED)
+        self.assertEqual(room.current_booking_id, first.id)
+        with self.assertRaises(RoomNotAvailableError):
+            Reception(storage2).check_in_guest(second.id)
+    
+    def test_reload_picks_earliest_confirmed_booking(self):
+        """После загрузки текущей становится подтверждённая бронь с самым ранним заездом"""
+        self.reception.book_room("G0001", "102", datetime(2026, 3, 10), datetime(2026, 3, 15))
+        earlier = self.reception.book_room("G0001", "102", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        self.storage.save_to_file()
+        
+        room = HotelStorage(filepath=self.temp_path).get_room("102")
+        self.assertEqual(room.status, RoomStatus.BOOKED)
+        self.assertEqual(room.current_booking_id, earlier.id)
+    
+    def test_check_out_passes_room_to_next_booking(self):
+        """После выселения номер переходит к следующей брони одинаково до и после перезагрузки"""
+        first = self.reception.book_room("G0001", "102", datetime(2026, 3, 1), datetime(2026, 3, 5))
+        later = self.reception.book_room("G0001", "102", datetime(2026, 4, 1), datetime(2026, 4, 5))
+        self.reception.check_in_guest(first.id)
+        self.reception.check_out_guest(first.id, 1000.0)
+        
+        def state(storage: HotelStorage):
+            room = storage.get_room("102")
+            available = [r.number for r in storage.find_available_rooms()]
+            return room.status, room.current_booking_id, "102" in available
+        
+        self.assertEqual(state(self.storage), (RoomStatus.BOOKED, later.id, False))
+        self.storage.save_to_file()
+        self.assertEqual(state(HotelStorage(filepath=self.temp_path)), state(self.storage))
+    
     def test_check_in_guest_success(self):
         """check_in_guest успешен"""
         booking = self.reception.book_room(
@@ -834,8 +1428,9 @@ class TestIntegration(unittest.TestCase):
     
     def tearDown(self):
         """Очистка после каждого теста"""
-        if os.path.exists(self.temp_path):
-            os.unlink(self.temp_path)
+        for path in (self.temp_path, self.temp_path + ".journal", self.temp_path + ".history"):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_full_booking_cycle(self):
         """Полный цикл: регистрация -> бронь -> заселение -> услуги -> выселение"""